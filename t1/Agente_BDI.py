@@ -1,99 +1,102 @@
 from desenharMapa import inicializar_ambiente
-from agente import aspiradorSimples
-import matplotlib.pyplot as plt
-from matplotlib.animation import FuncAnimation
-import numpy as np    
+from ambiente import Ambiente
+from celulas import PONTOS, MOVEL
+from motor import passos, rodar, mostrar
+from distancias import CacheDistancias
+from replanejamento import DStarLite
+from caminhos import BUSCAS
+from indiceSujeira import IndiceSujeira
+from rotas import matriz_distancias, rota_gulosa, otimizar_rota, estatisticas_rota
 import heapq
 
+DIRECAO_POR_DELTA = {
+    (1, 0): 'S',   # Sul
+    (-1, 0): 'N',  # Norte
+    (0, 1): 'L',   # Leste
+    (0, -1): 'O'   # Oeste
+}
+
+DELTA_POR_DIRECAO = {direcao: delta for delta, direcao in DIRECAO_POR_DELTA.items()}
+
 class Agente_BDI:
-    def __init__(self, tamanho):
-        self.beliefs = [] #guarda coordenadas de sujeira
+    def __init__(self, tamanho, otimizador='auto', semente=None, ambiente=None, indice=None, distancias=None,
+                 planejador='astar'):
+        """
+        ambiente, indice e distancias podem ser passados prontos para vários
+        agentes compartilharem a mesma sala (ver frota.py).
+        """
         self.desires = [] #guarda ordem otimizada de visitação das sujeiras
         self.intentions = [] #guarda ordem de ações com base em desires
-        self.grid = inicializar_ambiente(tamanho)
+        self.ambiente = ambiente if ambiente is not None else Ambiente(inicializar_ambiente(tamanho, semente)) #grid + máscaras de vizinhança
+        self.grid = self.ambiente.grid
+        self.indice = indice if indice is not None else IndiceSujeira(self.grid) #sujeiras conhecidas; self.beliefs é uma visão dele
+        self.mudancas_pendentes = [] #células alteradas ainda não percebidas
         self.bateria = 30
+        self.otimizador = otimizador #'guloso', 'exato', 'busca_local' ou 'auto' (ver rotas.py)
+        self.distancias = distancias if distancias is not None else CacheDistancias(self.grid) #campos de distância BFS por origem
+        self.caminho = [] #intenção corrente: caminho completo até o objetivo atual
+        self.indice_caminho = 0 #posição do agente dentro de self.caminho
+        self.versao_planejada = -1 #versão do índice de sujeiras usada no último update_desires
+        self.planejador = planejador #'astar', 'dstar' (D* Lite incremental), 'jps' ou 'hpa' (ver caminhos.py)
+        self.dstar = None #planejador D* Lite do objetivo atual
+        self.busca = None #backend de caminhos.py, criado no primeiro caminho
+        self.ultima_busca = None #nós expandidos, inserções no heap e comprimento da última busca (ver perfil.py)
+        self.versao_passagem = 0 #incrementada quando algum móvel muda de lugar
+        self.passagem_planejada = 0 #versao_passagem usada no último update_desires
+
+
+    @property
+    def beliefs(self):
+        """
+        Visão viva das sujeiras conhecidas: dicts {"coord": (x,y), "pontos": n}
+        """
+        return self.indice.beliefs()
 
+    def alterar_celula(self, x, y, valor):
+        """
+        Altera uma célula do ambiente. A mudança só entra nos beliefs (e no
+        cache de distâncias) no próximo perceive.
+        """
+        self.ambiente.alterar(x, y, valor)
+        self.mudancas_pendentes.append((x, y, valor))
 
     def pode_mover(self, nx, ny):
-        tamanho = len(self.grid)
-        if 0 <= nx < tamanho and 0 <= ny < tamanho and self.grid[nx][ny] != "movel":
-            return True
-        return False
+        tamanho = self.ambiente.tamanho
+        return 0 <= nx < tamanho and 0 <= ny < tamanho and self.grid[nx, ny] != MOVEL
     
     def detecta_tipo_sujeira(self, sujeira):
-        if sujeira == "poeira":
-            return 1
-        elif sujeira == "liquido":
-            return 2
-        else:
-            return 3
+        return int(PONTOS[sujeira])
     
     def perceive(self, posicao):
         """
-        Detecta todas as sujeiras no grid (percepção global).
-        Atualiza self.beliefs como lista de dicts {"coord": (x,y), "pontos": n}
+        Percepção global incremental: o índice de sujeiras é montado uma vez
+        no início e aqui só recebe as células alteradas desde o último
+        perceive, então o custo depende do número de mudanças e não do
+        tamanho da sala. self.beliefs reflete o índice automaticamente.
         """
-        sujeira = {"poeira", "liquido", "detritos"}
-        self.beliefs = []  # reinicia beliefs
-        linhas = len(self.grid)
-        colunas = len(self.grid[0])
-
-        for i in range(linhas):
-            for j in range(colunas):
-                if self.grid[i][j] in sujeira:
-                    b = {"coord": (i, j), "pontos": self.detecta_tipo_sujeira(self.grid[i][j])}
-                    self.beliefs.append(b)
-
-    def distancia_a_estrela(self,inicio,fim):
-        if inicio == fim:
-            return 0
-    
-        linhas, colunas = len(self.grid), len(self.grid[0])
-        
-        def heuristica(pos):
-            return abs(pos[0] - fim[0]) + abs(pos[1] - fim[1])
-        
-        # fila: (f_score, g_score, posicao)
-        fila = [(heuristica(inicio), 0, inicio)]
-        visitados = {}
-        visitados[inicio] = 0
-        
-        direcoes = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        
-        while fila:
-            f_score, g_score, (x, y) = heapq.heappop(fila)
-            
-            if (x, y) == fim:
-                return g_score
-            
-            # Ignora se já encontrou caminho melhor
-            if g_score > visitados.get((x, y), float('inf')):
-                continue
-            
-            for dx, dy in direcoes:
-                nx, ny = x + dx, y + dy
-                
-                if (0 <= nx < linhas and 0 <= ny < colunas and 
-                    self.grid[nx][ny] != "movel"):
-                    
-                    novo_g = g_score + 1
-                    
-                    if novo_g < visitados.get((nx, ny), float('inf')):
-                        visitados[(nx, ny)] = novo_g
-                        f = novo_g + heuristica((nx, ny))
-                        heapq.heappush(fila, (f, novo_g, (nx, ny)))
-        
-        return float('inf')    
-    
+        for x, y, valor in self.mudancas_pendentes:
+            self.indice.celula_alterada(x, y, valor)
+            # Campos de distância e a árvore do D* Lite são reparados localmente
+            if self.distancias.celula_alterada(x, y, valor):
+                self.versao_passagem += 1
+                if self.dstar is not None:
+                    self.dstar.celula_alterada(x, y)
+                if self.busca is not None:
+                    self.busca.celula_alterada(x, y)
+        self.mudancas_pendentes.clear()
+
     def calcula_melhor_rota(self, posicao_inicial, grafo):
         """
-        Calcula a melhor rota de limpeza usando algoritmo guloso.
+        Calcula a melhor rota de limpeza com o otimizador escolhido no agente.
 
-        Estratégia:
-        - A partir da posição inicial, escolhe a próxima sujeira com melhor score
-        - Score = (pontuacao^2) / (distancia+1)
-        - Prioriza alta pontuação e baixa distância
-        - Usa distâncias do grafo (já calculadas com A*)
+        Estratégias (módulo rotas):
+        - 'guloso': escolhe a próxima sujeira com maior (pontuacao^2) / (distancia+1)
+        - 'exato': Held–Karp sobre subconjuntos (poucas sujeiras)
+        - 'busca_local': rota gulosa melhorada com 2-opt e Or-opt
+        - 'auto': exato até 12 sujeiras, busca local acima disso
+        Os otimizadores usam a bateria atual como orçamento, maximizando a
+        pontuação que cabe nela. A rota gulosa é sempre calculada também e
+        fica em rota_info['guloso'] para comparação.
 
         Parâmetros:
         - posicao_inicial: tupla (x, y) da posição inicial do agente
@@ -101,65 +104,29 @@ class Agente_BDI:
 
         Retorna: lista ordenada de beliefs representando a rota ótima
         """
-        if not self.beliefs:
+        beliefs = list(self.beliefs)
+        if not beliefs:
             return []
 
-        rota = []
-        visitados = set()
-        pos_atual = posicao_inicial
-        distancia_total = 0
-        pontuacao_total = 0
-
-        # Enquanto houver sujeiras não visitadas
-        while len(visitados) < len(self.beliefs):
-            melhor_score = -float('inf')
-            melhor_belief = None
-            melhor_distancia = 0
-
-            # Avalia cada sujeira não visitada
-            for belief in self.beliefs:
-                coord = belief["coord"]
-
-                if coord not in visitados:
-                    # Pega distância do grafo (já calculada com A*)
-                    if pos_atual in grafo and coord in grafo[pos_atual]:
-                        distancia = grafo[pos_atual][coord]
-                    else:
-                        distancia = float('inf')
-
-                    # Se inacessível, pula esta sujeira
-                    if distancia == float('inf'):
-                        continue
-
-                    pontuacao = belief["pontos"]
-
-                    # Heurística de score:
-                    score = (pontuacao ** 2) / (distancia+1)
-
-                    if score > melhor_score:
-                        melhor_score = score
-                        melhor_belief = belief
-                        melhor_distancia = distancia
-
-            # Adiciona melhor escolha à rota
-            if melhor_belief:
-                rota.append(melhor_belief)
-                visitados.add(melhor_belief["coord"])
-                distancia_total += melhor_distancia
-                pontuacao_total += melhor_belief["pontos"]
-                pos_atual = melhor_belief["coord"]
-            else:
-                # Não há mais sujeiras acessíveis
-                break
+        D = matriz_distancias(posicao_inicial, beliefs, grafo)
+        pontos = [b["pontos"] for b in beliefs]
+
+        gulosa = rota_gulosa(D, pontos)
+        if self.otimizador == 'guloso':
+            ordem = gulosa
+        else:
+            ordem = otimizar_rota(D, pontos, self.otimizador, orcamento=self.bateria)
+
+        rota = [beliefs[i] for i in ordem]
 
         # Armazena estatísticas da rota calculada
-        self.rota_info = {
-            'distancia_total': distancia_total,
-            'pontuacao_total': pontuacao_total,
-            'eficiencia': pontuacao_total / (distancia_total + 1),
+        self.rota_info = estatisticas_rota(D, pontos, ordem)
+        self.rota_info.update({
             'num_sujeiras_rota': len(rota),
-            'num_sujeiras_total': len(self.beliefs)
-        }
+            'num_sujeiras_total': len(beliefs),
+            'otimizador': self.otimizador,
+            'guloso': estatisticas_rota(D, pontos, gulosa)
+        })
 
         return rota
 
@@ -169,85 +136,170 @@ class Agente_BDI:
 
         Processo:
         1. Cria grafo conectando posição atual e todas as sujeiras
-        2. Calcula distâncias reais usando A* (considerando obstáculos)
+        2. Calcula distâncias reais com uma BFS por nó (considerando obstáculos);
+           cada campo de distância dá a distância até todos os outros nós de
+           uma vez e fica em cache até algum móvel mudar
         3. Calcula melhor rota (menor distância + maior pontuação)
         4. Armazena rota em self.desires
         """
         if not self.beliefs:
             self.desires = []
             self.grafo = {}
+            self.versao_planejada = self.indice.versao
+            self.passagem_planejada = self.versao_passagem
             return
 
         grafo = {}  # {posicao: {destino: distancia}}
         nos = [posicao_atual] + [b["coord"] for b in self.beliefs]
 
         for no in nos:
-            grafo[no] = {}
-            for outro_no in nos:
-                if outro_no != no:
-                    # Usa A* para calcular distância real considerando obstáculos
-                    distancia = self.distancia_a_estrela(no, outro_no)
-                    grafo[no][outro_no] = distancia
+            distancias = self.distancias.distancias(no, nos)
+            grafo[no] = {outro_no: distancia for outro_no, distancia in zip(nos, distancias) if outro_no != no}
 
+        self.grafo = grafo
         self.desires = self.calcula_melhor_rota(posicao_atual, grafo)
+        self.versao_planejada = self.indice.versao
+        self.passagem_planejada = self.versao_passagem
         
-    def calcular_proximo_passo(self, posicao_atual, destino):
+    def calcular_caminho(self, posicao_atual, destino):
         """
-        Calcula apenas o próximo passo (uma casa) no caminho até o destino.
-        Usa A* para encontrar o caminho e retorna apenas a primeira direção.
+        Calcula o caminho completo até o destino com A*.
+        Cada nó guarda só um ponteiro para o pai; o caminho é montado uma vez
+        no final, em vez de copiar uma lista a cada entrada da fila.
+        Com planejador 'jps' ou 'hpa' a busca é delegada ao backend de caminhos.py.
 
         Parâmetros:
         - posicao_atual: tupla (x, y) da posição atual
         - destino: tupla (x, y) do destino
 
-        Retorna: direção ('N', 'S', 'L', 'O') ou None se já chegou/inacessível
+        Retorna: lista de posições [posicao_atual, ..., destino] ou None se inacessível
         """
-        if posicao_atual == destino:
-            return None
+        if self.planejador in BUSCAS:
+            # Os backends leem o mesmo array de passagem do cache de distâncias
+            if self.busca is None:
+                self.busca = BUSCAS[self.planejador](self.distancias.passavel)
+            expandidos, empurrados = self.busca.expandidos, self.busca.empurrados
+            caminho = self.busca.caminho(posicao_atual, destino)
+            self._registrar_busca(self.busca.expandidos - expandidos, self.busca.empurrados - empurrados,
+                                  len(caminho) - 1 if caminho else None)
+            return caminho
 
         linhas, colunas = len(self.grid), len(self.grid[0])
 
         def heuristica(pos):
             return abs(pos[0] - destino[0]) + abs(pos[1] - destino[1])
 
-        # A*: (f_score, g_score, posicao, caminho)
-        fila = [(heuristica(posicao_atual), 0, posicao_atual, [])]
+        # A*: (f_score, g_score, posicao)
+        fila = [(heuristica(posicao_atual), 0, posicao_atual)]
         visitados = {}
         visitados[posicao_atual] = 0
+        pais = {posicao_atual: None}
 
-        direcoes = {
-            (1, 0): 'S',   # Sul
-            (-1, 0): 'N',  # Norte
-            (0, 1): 'L',   # Leste
-            (0, -1): 'O'   # Oeste
-        }
+        direcoes = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+        expandidos, empurrados = 0, 1
 
         while fila:
-            f_score, g_score, (x, y), caminho = heapq.heappop(fila)
+            f_score, g_score, (x, y) = heapq.heappop(fila)
 
             if (x, y) == destino:
-                # Retorna apenas a primeira direção do caminho
-                return caminho[0] if caminho else None
+                caminho = []
+                pos = destino
+                while pos is not None:
+                    caminho.append(pos)
+                    pos = pais[pos]
+                caminho.reverse()
+                self._registrar_busca(expandidos, empurrados, len(caminho) - 1)
+                return caminho
 
             if g_score > visitados.get((x, y), float('inf')):
                 continue
+            expandidos += 1
 
-            for (dx, dy), direcao in direcoes.items():
+            for dx, dy in direcoes:
                 nx, ny = x + dx, y + dy
 
                 if (0 <= nx < linhas and 0 <= ny < colunas and
-                    self.grid[nx][ny] != "movel"):
+                    self.grid[nx, ny] != MOVEL):
 
                     novo_g = g_score + 1
 
                     if novo_g < visitados.get((nx, ny), float('inf')):
                         visitados[(nx, ny)] = novo_g
+                        pais[(nx, ny)] = (x, y)
                         f = novo_g + heuristica((nx, ny))
-                        novo_caminho = caminho + [direcao]
-                        heapq.heappush(fila, (f, novo_g, (nx, ny), novo_caminho))
+                        heapq.heappush(fila, (f, novo_g, (nx, ny)))
+                        empurrados += 1
 
+        self._registrar_busca(expandidos, empurrados, None)
         return None  # Inacessível
 
+    def _registrar_busca(self, expandidos, empurrados, comprimento):
+        self.ultima_busca = {
+            'expandidos': expandidos,
+            'empurrados': empurrados,
+            'comprimento': comprimento
+        }
+
+    def planejar_dstar(self, posicao_atual, destino):
+        """
+        Próximo passo pelo D* Lite. A árvore sobrevive a mudanças no mapa e só
+        é refeita com outro destino; a busca inicial e cada reparo ficam em
+        self.ultima_busca como as buscas do A*.
+
+        Retorna: direção ('N', 'S', 'L', 'O') ou None se já chegou/inacessível
+        """
+        expandidos = empurrados = 0
+        if self.dstar is None or self.dstar.objetivo != destino:
+            self.dstar = DStarLite(self.distancias.passavel, posicao_atual, destino)
+        else:
+            expandidos, empurrados = self.dstar.expandidos, self.dstar.empurrados
+        direcao = self.dstar.planejar(posicao_atual)
+        distancia = self.dstar.distancia()
+        self._registrar_busca(self.dstar.expandidos - expandidos, self.dstar.empurrados - empurrados,
+                              int(distancia) if distancia != float('inf') else None)
+        return direcao
+
+    def calcular_proximo_passo(self, posicao_atual, destino):
+        """
+        Retorna o próximo passo (uma casa) no caminho até o destino.
+
+        O caminho completo fica guardado em self.caminho como intenção corrente
+        e é seguido passo a passo. Só roda A* de novo quando o destino muda, o
+        agente saiu do caminho ou a próxima casa ficou bloqueada, então na
+        maioria dos passos o custo é O(1).
+
+        Parâmetros:
+        - posicao_atual: tupla (x, y) da posição atual
+        - destino: tupla (x, y) do destino
+
+        Retorna: direção ('N', 'S', 'L', 'O') ou None se já chegou/inacessível
+        """
+        if posicao_atual == destino:
+            return None
+
+        if self.planejador == 'dstar':
+            return self.planejar_dstar(posicao_atual, destino)
+
+        caminho = self.caminho
+        i = self.indice_caminho
+        valido = bool(caminho) and caminho[-1] == destino
+        if valido and i + 1 < len(caminho) and caminho[i + 1] == posicao_atual:
+            i += 1  # o agente andou uma casa desde a última chamada
+        if valido and caminho[i] == posicao_atual:
+            (x, y), (nx, ny) = caminho[i], caminho[i + 1]
+            direcao = DIRECAO_POR_DELTA[(nx - x, ny - y)]
+            if self.ambiente.pode_ir(x, y, direcao):
+                self.indice_caminho = i
+                return direcao
+
+        caminho = self.calcular_caminho(posicao_atual, destino)
+        self.caminho = caminho or []
+        self.indice_caminho = 0
+        if not caminho:
+            return None
+        (x, y), (nx, ny) = caminho[0], caminho[1]
+        return DIRECAO_POR_DELTA[(nx - x, ny - y)]
+
     def update_intentions(self, posicao_atual):
         """
         Atualiza intentions com a próxima ação a ser executada.
@@ -292,149 +344,72 @@ class Agente_BDI:
             # Tenta recalcular com próximo objetivo
             if self.desires:
                 self.update_intentions(posicao_atual)
-        
-
-def simular_BDI(tamanho=5, max_steps=100, intervalo_ms=500):
-    agente = Agente_BDI(tamanho=tamanho)
-    x, y = 0, 0
-
-    estados = []
-    total_pontuacao = 0
-
-    for passo in range(max_steps):
-        if agente.bateria <= 0:
-            break
 
-        agente.perceive((x, y))
-        dedup = {}
-        for b in agente.beliefs:
-            dedup[b['coord']] = b
-        agente.beliefs = list(dedup.values())
+    # Protocolo de agente do motor (ver motor.py)
 
-        # Só recalcula desires se estiver vazio ou se beliefs mudaram significativamente
-        if not agente.desires or len(agente.beliefs) != len(agente.desires):
-            agente.update_desires((x, y))
+    def tem_bateria(self):
+        return self.bateria > 0
 
-        agente.update_intentions((x, y))
-
-        if not agente.intentions:
-            break
-
-        acao = agente.intentions[0]
-
-        delta = 0
+    def observar(self, x, y):
+        """
+        perceive e, só se estiver vazio ou se beliefs (ou os móveis) mudaram
+        desde o último plano, update_desires (a rota pode deixar de fora
+        sujeiras que não cabem na bateria).
+        """
+        self.perceive((x, y))
+        if (not self.desires or self.indice.versao != self.versao_planejada
+                or self.versao_passagem != self.passagem_planejada):
+            self.update_desires((x, y))
+
+    def agir(self, x, y):
+        self.update_intentions((x, y))
+        if not self.intentions:
+            return None
+        acao = self.intentions[0]
         if acao == "aspirar":
-            conteudo = agente.grid[x][y]
-            sujeira = {"poeira", "liquido", "detritos"}
-            if conteudo in sujeira:
-                delta = agente.detecta_tipo_sujeira(conteudo)
-            agente.grid[x][y] = "limpo"
-            agente.bateria -= 2
-            agente.beliefs = [b for b in agente.beliefs if b['coord'] != (x, y)]
-            # Remove de desires após limpar com sucesso
-            agente.desires = [d for d in agente.desires if d['coord'] != (x, y)]
-        elif acao == "N":
-            if x > 0 and agente.pode_mover(x - 1, y):
-                x -= 1
-                agente.bateria -= 1
-        elif acao == "S":
-            if x < tamanho - 1 and agente.pode_mover(x + 1, y):
-                x += 1
-                agente.bateria -= 1
-        elif acao == "L":
-            if y < tamanho - 1 and agente.pode_mover(x, y + 1):
-                y += 1
-                agente.bateria -= 1
-        elif acao == "O":
-            if y > 0 and agente.pode_mover(x, y - 1):
-                y -= 1
-                agente.bateria -= 1
-        else:
-            break
-
-        total_pontuacao += delta
+            # Remove de desires a sujeira que vai ser limpa
+            self.desires = [d for d in self.desires if d['coord'] != (x, y)]
+        return acao
+        
 
-        estados.append({
-            'grid': np.copy(agente.grid),
-            'x': x,
-            'y': y,
-            'bateria': agente.bateria,
-            'pontuacao': total_pontuacao,
-            'passo': passo
-        })
+def passos_BDI(agente, max_steps=100, eventos=None):
+    """
+    Roda o ciclo perceive/desires/intentions passo a passo (laço de motor.passos).
+
+    Parâmetros:
+    - eventos: função (passo, grid, ocupadas) -> [(x, y, valor)] com as
+      mudanças da sala a cada passo (ver eventos.py); cada mudança também
+      sai no fluxo, com acao 'evento'
+
+    Retorna: gerador de fluxo.Passo, um por ação executada
+    """
+    return passos(agente, max_steps, eventos)
+
+def rodar_BDI(tamanho=5, max_steps=100, otimizador='auto', semente=None, parar=(), observadores=(),
+              eventos=None, planejador='astar', perfil=None):
+    """
+    Roda um episódio do agente BDI sem desenhar nada.
+
+    Parâmetros:
+    - parar, observadores: critérios de parada e callbacks por passo (ver fluxo.consumir)
+    - eventos: mudanças dinâmicas da sala (ver passos_BDI e eventos.py)
+    - planejador: 'astar', 'dstar', 'jps' ou 'hpa'
+    - perfil: perfil.Perfil que mede as fases do ciclo BDI (None = sem instrumentação)
+
+    Retorna: (estados, agente), com estados sendo a Trajetoria do episódio
+    """
+    agente = Agente_BDI(tamanho=tamanho, otimizador=otimizador, semente=semente, planejador=planejador)
+    if perfil is not None:
+        perfil.instrumentar(agente)
+        observadores = tuple(observadores) + (perfil.registrar,)
+    return rodar(agente, max_steps, parar, observadores, eventos), agente
+
+def simular_BDI(tamanho=5, max_steps=100, intervalo_ms=500, otimizador='auto', semente=None, saida=None, passo=1,
+                perfil=None):
+    estados, agente = rodar_BDI(tamanho, max_steps, otimizador, semente, perfil=perfil)
 
     if not estados:
         print("Nenhum estado gerado")
         return
 
-    fig, ax = plt.subplots(figsize=(5, 5))
-    tamanho = len(estados[0]['grid'])
-    ax.set_xticks(np.arange(tamanho + 1) - 0.5)
-    ax.set_yticks(np.arange(tamanho + 1) - 0.5)
-    ax.grid(True)
-    ax.set_xticklabels([])
-    ax.set_yticklabels([])
-    ax.invert_yaxis()
-    ax.set_xlim(-0.5, tamanho - 0.5)
-    ax.set_ylim(-0.5, tamanho - 0.5)
-
-    agent_marker = ax.plot([], [], 'o', markersize=18)[0]
-    score_text = ax.text(0.01, 0.99, "", transform=ax.transAxes, fontsize=12,
-                         va='top', ha='left', bbox=dict(facecolor='white', alpha=0.8, edgecolor='none', pad=4))
-
-    texts = [[None for _ in range(tamanho)] for _ in range(tamanho)]
-    movel_patches = []
-
-    grid0 = estados[0]['grid']
-    for i in range(tamanho):
-        for j in range(tamanho):
-            valor = grid0[i][j]
-            if valor == "poeira":
-                txt = 'P'; cor = 'brown'
-            elif valor == "liquido":
-                txt = 'L'; cor = 'blue'
-            elif valor == "detritos":
-                txt = 'D'; cor = 'black'
-            elif valor == "movel":
-                rect = plt.Rectangle((j - 0.5, i - 0.5), 1, 1, color='gray')
-                ax.add_patch(rect)
-                movel_patches.append(rect)
-                txt = ''; cor = 'black'
-            else:
-                txt = '.'; cor = 'lightgray'
-            texts[i][j] = ax.text(j, i, txt, ha='center', va='center', fontsize=14, color=cor, weight='bold')
-
-    primeiro = estados[0]
-    agent_marker.set_data([primeiro['y']], [primeiro['x']])
-    score_text.set_text(f"Pontuação: {primeiro.get('pontuacao', 0)}  Bateria: {primeiro.get('bateria', 0)}")
-
-    def update(frame):
-        estado = estados[frame]
-        grid_atual = estado['grid']
-        x, y = estado['x'], estado['y']
-
-        for i in range(tamanho):
-            for j in range(tamanho):
-                cell = grid_atual[i][j]
-                t = texts[i][j]
-                if cell == "limpo":
-                    t.set_text('.'); t.set_color('gray')
-                elif cell == "poeira":
-                    t.set_text('P'); t.set_color('brown')
-                elif cell == "liquido":
-                    t.set_text('L'); t.set_color('blue')
-                elif cell == "detritos":
-                    t.set_text('D'); t.set_color('black')
-                elif cell == "movel":
-                    t.set_text('')
-                else:
-                    t.set_text('.'); t.set_color('lightgray')
-
-        agent_marker.set_data([y], [x])
-
-        score_text.set_text(f"Pontuação: {estado.get('pontuacao', 0)}  Bateria: {estado.get('bateria', 0)}")
-        artists = [agent_marker, score_text] + [t for row in texts for t in row]
-        return artists
-
-    ani = FuncAnimation(fig, update, frames=len(estados), interval=intervalo_ms, blit=False, repeat=False)
-    plt.show()
\ No newline at end of file
+    return mostrar(estados, saida, passo, intervalo_ms, tamanho_marcador=18)
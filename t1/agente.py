@@ -1,15 +1,11 @@
+from celulas import EH_SUJEIRA, PONTOS
+
 def aspiradorSimples(norte, sul, leste, oeste, est, bateria, prioridade=None):
     pontuacao = 0
-    sujeira = {"poeira", "liquido", "detritos"}
     if bateria != 0:
         prioridade = prioridade or []
-        if est in sujeira:
-            if est == "poeira":
-                pontuacao += 1
-            elif est == "liquido":
-                pontuacao += 2
-            else:
-                pontuacao += 3
+        if EH_SUJEIRA[est]:
+            pontuacao += int(PONTOS[est])
             bateria -= 2
             return "aspirar", bateria, pontuacao
         
@@ -43,7 +39,6 @@ def aspiradorSimples(norte, sul, leste, oeste, est, bateria, prioridade=None):
 
 def aspiradorModelo(norte, sul, leste, oeste, est, bateria, prioridade=None, pos=None, visitados=None):
     pontuacao = 0
-    sujeira = {"poeira", "liquido", "detritos"}
 
     if bateria <= 0:
         return "parar", bateria, pontuacao
@@ -64,13 +59,8 @@ def aspiradorModelo(norte, sul, leste, oeste, est, bateria, prioridade=None, pos
             return (x, y - 1)
         return None
 
-    if est in sujeira:
-        if est == "poeira":
-            pontuacao += 1
-        elif est == "liquido":
-            pontuacao += 2
-        else:
-            pontuacao += 3
+    if EH_SUJEIRA[est]:
+        pontuacao += int(PONTOS[est])
         bateria -= 2
         if pos is not None:
             visitados.add(pos)
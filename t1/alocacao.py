@@ -0,0 +1,126 @@
+import numpy as np
+from rotas import CUSTO_ASPIRAR
+
+
+def matriz_valores(D, pontos, baterias):
+    """
+    Valor de mandar cada agente para cada sujeira, com o mesmo critério da
+    rota gulosa: pontos² / (distância + 1). Pares que não cabem na bateria
+    do agente (ou inacessíveis) ficam com -inf.
+
+    Parâmetros:
+    - D: array (agentes, sujeiras) de distâncias, inf quando não há caminho
+    - pontos: pontos de cada sujeira
+    - baterias: bateria de cada agente
+
+    Retorna: array (agentes, sujeiras)
+    """
+    pontos = np.asarray(pontos, dtype=float)
+    valores = pontos[None, :] ** 2 / (D + 1)
+    # rotas.cabe_no_orcamento para uma sujeira, vetorizado
+    cabe = D + CUSTO_ASPIRAR - 1 <= np.asarray(baterias)[:, None]
+    valores[~cabe] = -np.inf
+    return valores
+
+
+def alocar_leilao(valores):
+    """
+    Leilão guloso: repete a maior oferta (agente, sujeira) entre os agentes
+    e sujeiras ainda livres.
+
+    Retorna: array com a sujeira de cada agente, -1 quando ficou sem tarefa
+    """
+    agentes, sujeiras = valores.shape
+    alocacao = np.full(agentes, -1)
+    livre = np.ones(sujeiras, dtype=bool)
+    for plano in np.argsort(-valores, axis=None, kind='stable'):
+        k, j = divmod(int(plano), sujeiras)
+        if valores[k, j] == -np.inf:
+            break
+        if alocacao[k] < 0 and livre[j]:
+            alocacao[k] = j
+            livre[j] = False
+    return alocacao
+
+
+def _hungaro(custo):
+    """
+    Método húngaro (potenciais, O(n² m)) para custo (n, m) com n <= m.
+
+    Retorna: coluna atribuída a cada linha
+    """
+    n, m = custo.shape
+    u = np.zeros(n + 1)
+    v = np.zeros(m + 1)
+    dono = np.zeros(m + 1, dtype=np.int64)  # dono[j]: linha (base 1) da coluna j; coluna 0 é sentinela
+    anterior = np.zeros(m + 1, dtype=np.int64)
+
+    for i in range(1, n + 1):
+        dono[0] = i
+        j0 = 0
+        minimo = np.full(m + 1, np.inf)
+        usado = np.zeros(m + 1, dtype=bool)
+        while True:
+            usado[j0] = True
+            i0 = dono[j0]
+            livres = ~usado
+            reduzido = np.empty(m + 1)
+            reduzido[0] = np.inf
+            reduzido[1:] = custo[i0 - 1] - u[i0] - v[1:]
+            melhora = livres & (reduzido < minimo)
+            minimo[melhora] = reduzido[melhora]
+            anterior[melhora] = j0
+            candidatos = np.where(livres, minimo, np.inf)
+            j1 = int(np.argmin(candidatos))
+            delta = candidatos[j1]
+            u[dono[usado]] += delta
+            v[usado] -= delta
+            minimo[livres] -= delta
+            j0 = j1
+            if dono[j0] == 0:
+                break
+        while j0:
+            j1 = anterior[j0]
+            dono[j0] = dono[j1]
+            j0 = j1
+
+    atribuicao = np.full(n, -1)
+    for j in range(1, m + 1):
+        if dono[j]:
+            atribuicao[dono[j] - 1] = j - 1
+    return atribuicao
+
+
+def alocar_hungaro(valores):
+    """
+    Atribuição ótima (uma sujeira por agente) pelo método húngaro: ocupa o
+    maior número possível de agentes e, entre essas atribuições, maximiza a
+    soma dos valores.
+
+    Retorna: array com a sujeira de cada agente, -1 quando ficou sem tarefa
+    """
+    agentes, sujeiras = valores.shape
+    alocacao = np.full(agentes, -1)
+    if not agentes or not sujeiras:
+        return alocacao
+
+    viavel = np.isfinite(valores)
+    # Pares inviáveis viram um custo maior que qualquer soma de pares viáveis
+    proibido = 1 + np.abs(valores[viavel]).sum() * 2
+    custo = np.where(viavel, -valores, proibido)
+
+    if agentes <= sujeiras:
+        alocacao = _hungaro(custo)
+    else:
+        for j, k in enumerate(_hungaro(custo.T)):
+            alocacao[k] = j
+
+    linhas = np.flatnonzero(alocacao >= 0)
+    alocacao[linhas[~viavel[linhas, alocacao[linhas]]]] = -1
+    return alocacao
+
+
+ALOCADORES = {
+    'leilao': alocar_leilao,
+    'hungaro': alocar_hungaro
+}
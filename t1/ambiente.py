@@ -0,0 +1,118 @@
+import numpy as np
+from celulas import EH_SUJEIRA, MOVEL
+
+# Um bit por vizinho nas máscaras de passagem e de sujeira
+BIT_N, BIT_S, BIT_L, BIT_O = 1, 2, 4, 8
+BITS = {'N': BIT_N, 'S': BIT_S, 'L': BIT_L, 'O': BIT_O}
+
+# Deslocamento de cada direção: (dx, dy, bit)
+DESLOCAMENTOS = ((-1, 0, BIT_N), (1, 0, BIT_S), (0, 1, BIT_L), (0, -1, BIT_O))
+# Bit que o vizinho na direção d usa para enxergar a célula de volta
+OPOSTO = {BIT_N: BIT_S, BIT_S: BIT_N, BIT_L: BIT_O, BIT_O: BIT_L}
+
+# Tabelas indexadas pela máscara de 4 bits
+TABELA_SENSORES = tuple(
+    (int(m & BIT_N != 0), int(m & BIT_S != 0), int(m & BIT_L != 0), int(m & BIT_O != 0))
+    for m in range(16)
+)
+# Mesma ordem de sensoresPr: S, N, L, O
+TABELA_PRIORIDADES = tuple(
+    tuple(d for d in ('S', 'N', 'L', 'O') if m & BITS[d])
+    for m in range(16)
+)
+# Bits na ordem S, N, L, O, usada pelo simulador em lote
+BITS_SNLO = np.array([BIT_S, BIT_N, BIT_L, BIT_O], dtype=np.uint8)
+
+
+def calcular_mascaras(grid):
+    """
+    Calcula, para cada célula, a máscara de vizinhos passáveis e a de
+    vizinhos sujos. Funciona em um grid (N, N) ou em um lote (..., N, N).
+
+    Retorna: (passagem, sujos), arrays uint8 com o formato do grid
+    """
+    livre = (grid != MOVEL).astype(np.uint8)
+    suja = EH_SUJEIRA[grid].astype(np.uint8)
+    passagem = np.zeros(grid.shape, dtype=np.uint8)
+    sujos = np.zeros(grid.shape, dtype=np.uint8)
+
+    for origem, destino, bit in (
+        ((slice(1, None), slice(None)), (slice(None, -1), slice(None)), BIT_N),
+        ((slice(None, -1), slice(None)), (slice(1, None), slice(None)), BIT_S),
+        ((slice(None), slice(None, -1)), (slice(None), slice(1, None)), BIT_L),
+        ((slice(None), slice(1, None)), (slice(None), slice(None, -1)), BIT_O),
+    ):
+        passagem[(Ellipsis,) + origem] |= livre[(Ellipsis,) + destino] * np.uint8(bit)
+        sujos[(Ellipsis,) + origem] |= suja[(Ellipsis,) + destino] * np.uint8(bit)
+
+    return passagem, sujos
+
+
+def alterar_mascaras_lote(passagem, sujos, e, x, y, valores):
+    """
+    Atualiza as máscaras de um lote depois que as células (e, x, y)
+    passaram a valer `valores`. Só os quatro vizinhos de cada célula mudam.
+    Espera no máximo uma célula alterada por episódio em cada chamada.
+    """
+    tamanho = passagem.shape[-1]
+    livre = np.asarray(valores) != MOVEL
+    suja = EH_SUJEIRA[valores]
+    for dx, dy, bit in DESLOCAMENTOS:
+        nx, ny = x + dx, y + dy
+        dentro = (nx >= 0) & (nx < tamanho) & (ny >= 0) & (ny < tamanho)
+        ee, nx, ny = e[dentro], nx[dentro], ny[dentro]
+        oposto = np.uint8(OPOSTO[bit])
+        passagem[ee, nx, ny] = np.where(livre[dentro], passagem[ee, nx, ny] | oposto, passagem[ee, nx, ny] & ~oposto)
+        sujos[ee, nx, ny] = np.where(suja[dentro], sujos[ee, nx, ny] | oposto, sujos[ee, nx, ny] & ~oposto)
+
+
+class Ambiente:
+    """
+    Grid da sala com as máscaras de vizinhança pré-calculadas.
+
+    passagem[x, y] tem um bit (N/S/L/O) para cada vizinho onde o agente pode
+    entrar; sujos[x, y] marca os vizinhos passáveis com sujeira. As máscaras
+    são calculadas uma vez e mantidas em dia por alterar(), então ler os
+    sensores é só um acesso ao array.
+    """
+
+    def __init__(self, grid, mascaras=None):
+        """
+        mascaras: (passagem, sujos) já calculadas para este grid (ver cenarios.py)
+        """
+        self.grid = grid
+        self.tamanho = len(grid)
+        self.passagem, self.sujos = mascaras if mascaras is not None else calcular_mascaras(grid)
+
+    def alterar(self, x, y, valor):
+        self.grid[x, y] = valor
+        livre = valor != MOVEL
+        suja = EH_SUJEIRA[valor]
+        for dx, dy, bit in DESLOCAMENTOS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.tamanho and 0 <= ny < self.tamanho:
+                oposto = OPOSTO[bit]
+                if livre:
+                    self.passagem[nx, ny] |= oposto
+                else:
+                    self.passagem[nx, ny] &= ~oposto & 0xF
+                if suja:
+                    self.sujos[nx, ny] |= oposto
+                else:
+                    self.sujos[nx, ny] &= ~oposto & 0xF
+
+    def sensores(self, x, y):
+        """
+        Retorna: (norte, sul, leste, oeste, est), como sensores() em modelo.py
+        """
+        norte, sul, leste, oeste = TABELA_SENSORES[self.passagem[x, y]]
+        return norte, sul, leste, oeste, int(self.grid[x, y])
+
+    def prioridades(self, x, y):
+        """
+        Direções de vizinhos passáveis com sujeira, na ordem S, N, L, O.
+        """
+        return TABELA_PRIORIDADES[self.sujos[x, y]]
+
+    def pode_ir(self, x, y, direcao):
+        return bool(self.passagem[x, y] & BITS[direcao])
@@ -0,0 +1,176 @@
+import argparse
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from trajetoria import CODIGO_ACAO
+
+BATERIA_INICIAL = 30
+AGENTES = ('simples', 'modelo', 'explorador', 'bdi')
+# Limite de passos usado por padrão em cada ponto de entrada original
+PASSOS_PADRAO = {'simples': 60, 'modelo': 60, 'explorador': 60, 'bdi': 100}
+METRICAS = ('pontuacao', 'bateria_usada', 'celulas_limpas', 'passos', 'tempo')
+
+
+def semente_episodio(semente, tamanho, episodio):
+    """
+    Semente da sala de um episódio. Depende só de (semente, tamanho, episodio),
+    então todos os agentes são avaliados exatamente nas mesmas salas.
+    """
+    return int(np.random.SeedSequence([semente, tamanho, episodio]).generate_state(1)[0])
+
+
+def rodar_episodio(agente, tamanho, semente, max_steps=None, cenarios=None):
+    """
+    Roda um episódio sem interface gráfica e mede o resultado.
+    Com `cenarios` (pasta de um CatalogoCenarios), a sala e as distâncias
+    são lidas do disco em vez de geradas.
+
+    Retorna: dict com agente, tamanho, semente e as METRICAS do episódio
+    """
+    max_steps = max_steps or PASSOS_PADRAO[agente]
+    # Importa antes de medir, para o tempo do episódio não incluir o import
+    if agente == 'simples':
+        from reativoSimples import rodar_simulacao as rodar
+    elif agente == 'modelo':
+        from modelo import rodar_simulacao as rodar
+    elif agente == 'explorador':
+        from exploracao import rodar_exploracao as rodar
+    elif agente == 'bdi':
+        from Agente_BDI import rodar_BDI as rodar
+    else:
+        raise ValueError(f"agente desconhecido: {agente}")
+    if cenarios is not None:
+        from cenarios import CatalogoCenarios, rodar_cenario
+        catalogo = CatalogoCenarios(cenarios)
+
+        def rodar(tamanho, max_steps, semente):
+            return rodar_cenario(agente, tamanho, semente, max_steps, catalogo)
+
+    inicio = time.perf_counter()
+    estados, _ = rodar(tamanho, max_steps, semente=semente)
+    tempo = time.perf_counter() - inicio
+
+    # Lê direto do log de eventos, sem reconstruir o grid do último quadro
+    vazio = len(estados) == 0
+    return {
+        'agente': agente,
+        'tamanho': tamanho,
+        'semente': semente,
+        'pontuacao': 0 if vazio else estados.pontuacao[-1],
+        'bateria_usada': 0 if vazio else BATERIA_INICIAL - estados.bateria[-1],
+        'celulas_limpas': sum(1 for a in estados.acao if a == CODIGO_ACAO['aspirar']),
+        'passos': len(estados),
+        'tempo': tempo
+    }
+
+
+def _rodar_tarefa(tarefa):
+    return rodar_episodio(*tarefa)
+
+
+def avaliar(agentes=AGENTES, tamanhos=(5,), episodios=100, max_steps=None, processos=None, semente=0,
+            cenarios=None):
+    """
+    Roda `episodios` episódios por agente e tamanho de sala em um pool de
+    processos. Os episódios são independentes, então escalam com os núcleos.
+
+    Parâmetros:
+    - agentes: nomes em AGENTES
+    - tamanhos: lados de sala a avaliar
+    - episodios: episódios por (agente, tamanho)
+    - max_steps: limite de passos; None usa PASSOS_PADRAO de cada agente
+    - processos: tamanho do pool (None = os.cpu_count(); 1 roda no processo atual)
+    - semente: semente base das salas
+    - cenarios: pasta de cenários em disco (ver cenarios.py); None gera cada sala
+
+    Retorna: lista de dicts, um por episódio
+    """
+    tarefas = [
+        (agente, tamanho, semente_episodio(semente, tamanho, e), max_steps, cenarios)
+        for agente in agentes
+        for tamanho in tamanhos
+        for e in range(episodios)
+    ]
+    if processos == 1:
+        return [_rodar_tarefa(t) for t in tarefas]
+
+    processos = processos or os.cpu_count()
+    lote = max(1, len(tarefas) // (processos * 4))
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        return list(pool.map(_rodar_tarefa, tarefas, chunksize=lote))
+
+
+def resumir(resultados, percentis=(5, 50, 95)):
+    """
+    Agrupa por (agente, tamanho) e calcula média e percentis de cada métrica.
+
+    Retorna: lista de dicts, um por grupo
+    """
+    grupos = {}
+    for r in resultados:
+        grupos.setdefault((r['agente'], r['tamanho']), []).append(r)
+
+    resumo = []
+    for (agente, tamanho), linhas in grupos.items():
+        item = {'agente': agente, 'tamanho': tamanho, 'episodios': len(linhas)}
+        for metrica in METRICAS:
+            valores = np.array([linha[metrica] for linha in linhas], dtype=float)
+            item[f'{metrica}_media'] = float(valores.mean())
+            for p in percentis:
+                item[f'{metrica}_p{p}'] = float(np.percentile(valores, p))
+        item['episodios_por_segundo'] = len(linhas) / max(sum(l['tempo'] for l in linhas), 1e-12)
+        resumo.append(item)
+    return resumo
+
+
+def salvar_csv(linhas, caminho):
+    if not linhas:
+        return
+    with open(caminho, 'w', newline='') as f:
+        escritor = csv.DictWriter(f, fieldnames=list(linhas[0].keys()))
+        escritor.writeheader()
+        escritor.writerows(linhas)
+
+
+def salvar_json(dados, caminho):
+    with open(caminho, 'w') as f:
+        json.dump(dados, f, indent=2)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Avaliação Monte Carlo dos agentes do t1")
+    parser.add_argument('--agentes', nargs='+', default=list(AGENTES), choices=AGENTES)
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=[5])
+    parser.add_argument('--episodios', type=int, default=100)
+    parser.add_argument('--passos', type=int, default=None)
+    parser.add_argument('--processos', type=int, default=None)
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--cenarios', help="pasta de cenários em disco, reaproveitados entre execuções")
+    parser.add_argument('--csv', help="arquivo CSV com um episódio por linha")
+    parser.add_argument('--json', help="arquivo JSON com o resumo por agente e tamanho")
+    args = parser.parse_args(argv)
+
+    inicio = time.perf_counter()
+    resultados = avaliar(args.agentes, args.tamanhos, args.episodios, args.passos, args.processos, args.semente,
+                         args.cenarios)
+    resumo = resumir(resultados)
+    total = time.perf_counter() - inicio
+
+    if args.csv:
+        salvar_csv(resultados, args.csv)
+    if args.json:
+        salvar_json({'parametros': vars(args), 'tempo_total': total, 'resumo': resumo}, args.json)
+
+    for item in resumo:
+        print(f"{item['agente']:>8} N={item['tamanho']:<4} "
+              f"pontuação {item['pontuacao_media']:.2f} (p50 {item['pontuacao_p50']:.0f}) "
+              f"bateria {item['bateria_usada_media']:.1f} limpas {item['celulas_limpas_media']:.2f} "
+              f"passos {item['passos_media']:.1f} tempo/ep {item['tempo_media'] * 1000:.2f} ms")
+    print(f"{len(resultados)} episódios em {total:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
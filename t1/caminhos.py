@@ -0,0 +1,494 @@
+import heapq
+import numpy as np
+from distancias import campo_distancias, INALCANCAVEL
+
+# Deslocamentos na ordem de desempate dos agentes: S, N, L, O
+VIZINHOS = ((1, 0), (-1, 0), (0, 1), (0, -1))
+
+
+def comprimento(caminho):
+    """
+    Número de passos de um caminho [inicio, ..., destino]; inf se não há caminho.
+    """
+    return float('inf') if caminho is None else len(caminho) - 1
+
+
+def _montar(pais, destino):
+    caminho = []
+    pos = destino
+    while pos is not None:
+        caminho.append(pos)
+        pos = pais[pos]
+    caminho.reverse()
+    return caminho
+
+
+def a_estrela(passavel, inicio, destino):
+    """
+    A* de referência em grid 4-vizinho (o mesmo de Agente_BDI.calcular_caminho),
+    usado para validar as outras buscas.
+
+    Retorna: lista [inicio, ..., destino] ou None se inacessível
+    """
+    linhas, colunas = passavel.shape
+
+    def heuristica(pos):
+        return abs(pos[0] - destino[0]) + abs(pos[1] - destino[1])
+
+    fila = [(heuristica(inicio), 0, inicio)]
+    custos = {inicio: 0}
+    pais = {inicio: None}
+    while fila:
+        _, g, (x, y) = heapq.heappop(fila)
+        if (x, y) == destino:
+            return _montar(pais, destino)
+        if g > custos[(x, y)]:
+            continue
+        for dx, dy in VIZINHOS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < linhas and 0 <= ny < colunas and passavel[nx, ny]:
+                novo_g = g + 1
+                if novo_g < custos.get((nx, ny), float('inf')):
+                    custos[(nx, ny)] = novo_g
+                    pais[(nx, ny)] = (x, y)
+                    heapq.heappush(fila, (novo_g + heuristica((nx, ny)), novo_g, (nx, ny)))
+    return None
+
+
+def _expandir(pontos):
+    """
+    Liga pontos alinhados (mesma linha ou coluna) célula a célula.
+    """
+    caminho = [pontos[0]]
+    for (x0, y0), (x1, y1) in zip(pontos, pontos[1:]):
+        dx = (x1 > x0) - (x1 < x0)
+        dy = (y1 > y0) - (y1 < y0)
+        x, y = x0, y0
+        while (x, y) != (x1, y1):
+            x, y = x + dx, y + dy
+            caminho.append((x, y))
+    return caminho
+
+
+class BuscaJPS:
+    """
+    Jump Point Search para grid 4-vizinho com custo uniforme.
+
+    Ordem canônica "horizontal primeiro": de um movimento horizontal o
+    caminho pode virar para cima ou para baixo em qualquer célula; de um
+    movimento vertical só vira quando é forçado, isto é, quando a célula ao
+    lado está livre mas a do lado da célula anterior está bloqueada. Com
+    isso a busca só põe no heap os pontos de salto, não cada célula aberta.
+
+    Os saltos são feitos com arrays pré-calculados (células forçadas e
+    "o raio vertical que sai daqui encontra uma célula forçada"), então
+    cada salto é um fatiamento NumPy e não um laço célula a célula. Os
+    arrays são refeitos no próximo caminho() depois de celula_alterada().
+    """
+
+    def __init__(self, passavel):
+        self.passavel = passavel
+        self.expandidos = 0
+        self.empurrados = 0
+        self._preparar()
+
+    def celula_alterada(self, x, y):
+        self._pronto = False
+
+    def _preparar(self):
+        p = self.passavel
+        linhas, colunas = p.shape
+        borda = np.zeros((linhas + 2, colunas + 2), dtype=bool)
+        borda[1:-1, 1:-1] = p
+        direita, esquerda = borda[1:-1, 2:], borda[1:-1, :-2]
+        # forcado[d][x, y]: chegando em (x, y) na vertical, sentido d, algum lado vira obrigatório
+        self.forcado = {
+            1: p & ((direita & ~borda[:-2, 2:]) | (esquerda & ~borda[:-2, :-2])),
+            -1: p & ((direita & ~borda[2:, 2:]) | (esquerda & ~borda[2:, :-2])),
+        }
+        # raio[d][x, y]: andando na vertical a partir de (x, y), sentido d, acha uma célula forçada
+        raio_s = np.zeros_like(p)
+        raio_n = np.zeros_like(p)
+        for x in range(linhas - 2, -1, -1):
+            raio_s[x] = p[x + 1] & (self.forcado[1][x + 1] | raio_s[x + 1])
+        for x in range(1, linhas):
+            raio_n[x] = p[x - 1] & (self.forcado[-1][x - 1] | raio_n[x - 1])
+        self.raio = {1: raio_s, -1: raio_n}
+        self._pronto = True
+
+    def _alcance(self, linha):
+        """
+        Quantas células livres seguidas há no início de `linha`.
+        """
+        bloqueio = ~linha
+        return int(bloqueio.argmax()) if bloqueio.any() else len(linha)
+
+    def _saltar_vertical(self, x, y, dx, destino):
+        p = self.passavel
+        raio = p[x + 1:, y] if dx > 0 else p[x - 1::-1, y] if x > 0 else p[:0, y]
+        n = self._alcance(raio)
+        if not n:
+            return None
+        if destino[1] == y and 0 < (destino[0] - x) * dx <= n:
+            alvo = abs(destino[0] - x)
+        else:
+            alvo = n + 1
+        forcado = self.forcado[dx][x + 1:x + 1 + n, y] if dx > 0 else self.forcado[dx][x - 1::-1, y][:n]
+        i = int(forcado.argmax()) + 1 if forcado.any() else n + 1
+        passos = min(i, alvo)
+        if passos > n:
+            return None
+        return x + dx * passos, y
+
+    def _saltar_horizontal(self, x, y, dy, destino):
+        p = self.passavel
+        colunas = p.shape[1]
+        linha = p[x, y + 1:] if dy > 0 else p[x, y - 1::-1] if y > 0 else p[x, :0]
+        n = self._alcance(linha)
+        if not n:
+            return None
+        trecho = slice(y + 1, y + 1 + n) if dy > 0 else slice(y - n, y)
+        vira = self.raio[1][x, trecho] | self.raio[-1][x, trecho]
+        if dy < 0:
+            vira = vira[::-1]
+        i = int(vira.argmax()) + 1 if vira.any() else n + 1
+        # O destino conta se está na mesma linha ou é visível na vertical a partir do trecho
+        dy_dest = (destino[1] - y) * dy
+        if 0 < dy_dest <= n:
+            cx = destino[0]
+            if cx == x:
+                i = min(i, dy_dest)
+            else:
+                sentido = 1 if cx > x else -1
+                coluna = p[x + sentido:cx + sentido:sentido, destino[1]] if sentido > 0 or cx > 0 else p[x - 1::-1, destino[1]]
+                if coluna.all():
+                    i = min(i, dy_dest)
+        if i > n:
+            return None
+        return x, y + dy * i
+
+    def _sucessores(self, no, direcao, destino):
+        x, y = no
+        if direcao is None:
+            direcoes = VIZINHOS
+        elif direcao[0] == 0:
+            # horizontal: segue e pode virar para os dois lados
+            direcoes = (direcao, (1, 0), (-1, 0))
+        else:
+            dx = direcao[0]
+            direcoes = [direcao]
+            linhas, colunas = self.passavel.shape
+            for s in (1, -1):
+                ny = y + s
+                if 0 <= ny < colunas and self.passavel[x, ny]:
+                    px = x - dx
+                    if not (0 <= px < linhas) or not self.passavel[px, ny]:
+                        direcoes.append((0, s))
+        for dx, dy in direcoes:
+            if dx:
+                salto = self._saltar_vertical(x, y, dx, destino)
+            else:
+                salto = self._saltar_horizontal(x, y, dy, destino)
+            if salto is not None:
+                yield salto, (dx, dy)
+
+    def caminho(self, inicio, destino):
+        """
+        Retorna: lista [inicio, ..., destino] ou None se inacessível
+        """
+        if not self._pronto:
+            self._preparar()
+        if inicio == destino:
+            return [inicio]
+        if not self.passavel[destino]:
+            return None
+
+        def heuristica(pos):
+            return abs(pos[0] - destino[0]) + abs(pos[1] - destino[1])
+
+        fila = [(heuristica(inicio), 0, inicio, None)]
+        custos = {inicio: 0}
+        pais = {inicio: None}
+        while fila:
+            _, g, no, direcao = heapq.heappop(fila)
+            if no == destino:
+                return _expandir(_montar(pais, destino))
+            if g > custos[no]:
+                continue
+            self.expandidos += 1
+            for salto, nova_direcao in self._sucessores(no, direcao, destino):
+                novo_g = g + abs(salto[0] - no[0]) + abs(salto[1] - no[1])
+                if novo_g < custos.get(salto, float('inf')):
+                    custos[salto] = novo_g
+                    pais[salto] = no
+                    heapq.heappush(fila, (novo_g + heuristica(salto), novo_g, salto, nova_direcao))
+                    self.empurrados += 1
+        return None
+
+
+class BuscaHPA:
+    """
+    HPA* (Botea, Müller e Schaeffer): o grid é dividido em clusters
+    `tamanho_cluster` x `tamanho_cluster`. Em cada borda entre clusters, os
+    trechos livres dos dois lados viram entradas (uma no meio do trecho, ou
+    duas nas pontas se ele for longo). O grafo abstrato liga as entradas de
+    um mesmo cluster pela distância dentro do cluster (BFS local) e as duas
+    células de cada entrada com custo 1.
+
+    Uma busca liga início e destino às entradas dos seus clusters, roda A*
+    no grafo abstrato (poucos nós) e refina cada aresta com uma BFS local.
+    O caminho é quase ótimo, não necessariamente o mais curto. Mudar uma
+    célula só reconstrói as bordas e arestas do seu cluster e dos vizinhos.
+    """
+
+    TRECHO_LONGO = 6
+
+    def __init__(self, passavel, tamanho_cluster=16):
+        self.passavel = passavel
+        self.c = tamanho_cluster
+        linhas, colunas = passavel.shape
+        self.num_clusters = (-(-linhas // self.c), -(-colunas // self.c))
+        self.bordas = {}  #(cluster_a, cluster_b) -> [(célula em a, célula em b)]
+        self.intra = {}  #cluster -> {porta: {porta: distância}}
+        self.expandidos = 0
+        self.empurrados = 0
+        ci, cj = self.num_clusters
+        for i in range(ci):
+            for j in range(cj):
+                if j + 1 < cj:
+                    self._construir_borda((i, j), (i, j + 1))
+                if i + 1 < ci:
+                    self._construir_borda((i, j), (i + 1, j))
+        for i in range(ci):
+            for j in range(cj):
+                self._construir_intra((i, j))
+
+    def _cluster(self, pos):
+        return pos[0] // self.c, pos[1] // self.c
+
+    def _limites(self, cluster):
+        linhas, colunas = self.passavel.shape
+        x0, y0 = cluster[0] * self.c, cluster[1] * self.c
+        return x0, min(x0 + self.c, linhas), y0, min(y0 + self.c, colunas)
+
+    def _construir_borda(self, a, b):
+        p = self.passavel
+        x0, x1, y0, y1 = self._limites(a)
+        if b[1] > a[1]:
+            celulas = [((x, y1 - 1), (x, y1)) for x in range(x0, x1)]
+        else:
+            celulas = [((x1 - 1, y), (x1, y)) for y in range(y0, y1)]
+        pares = []
+        trecho = []
+        for par in celulas + [None]:
+            if par is not None and p[par[0]] and p[par[1]]:
+                trecho.append(par)
+                continue
+            if trecho:
+                if len(trecho) < self.TRECHO_LONGO:
+                    pares.append(trecho[len(trecho) // 2])
+                else:
+                    pares += [trecho[0], trecho[-1]]
+            trecho = []
+        self.bordas[(a, b)] = pares
+
+    def _portas(self, cluster):
+        i, j = cluster
+        portas = set()
+        for outro, lado in (((i, j + 1), 0), ((i + 1, j), 0), ((i, j - 1), 1), ((i - 1, j), 1)):
+            chave = (cluster, outro) if lado == 0 else (outro, cluster)
+            for par in self.bordas.get(chave, ()):
+                portas.add(par[lado])
+        return portas
+
+    def _campo_local(self, cluster, origem):
+        x0, x1, y0, y1 = self._limites(cluster)
+        campo = campo_distancias(self.passavel[x0:x1, y0:y1], (origem[0] - x0, origem[1] - y0))
+        return campo, x0, y0
+
+    def _campo_consulta(self, cluster, origem):
+        # BFS local de uma consulta: cada célula alcançada conta como expandida e enfileirada
+        campo, x0, y0 = self._campo_local(cluster, origem)
+        alcancadas = int(np.count_nonzero(campo != INALCANCAVEL))
+        self.expandidos += alcancadas
+        self.empurrados += alcancadas
+        return campo, x0, y0
+
+    def _construir_intra(self, cluster):
+        portas = sorted(self._portas(cluster))
+        arestas = {porta: {} for porta in portas}
+        for k, porta in enumerate(portas):
+            campo, x0, y0 = self._campo_local(cluster, porta)
+            for outra in portas[k + 1:]:
+                d = campo[outra[0] - x0, outra[1] - y0]
+                if d != INALCANCAVEL:
+                    arestas[porta][outra] = int(d)
+                    arestas[outra][porta] = int(d)
+        self.intra[cluster] = arestas
+
+    def celula_alterada(self, x, y):
+        """
+        Reconstrói as bordas do cluster de (x, y) e as arestas internas dele
+        e dos clusters vizinhos, que compartilham essas bordas.
+        """
+        i, j = self._cluster((x, y))
+        ci, cj = self.num_clusters
+        vizinhos = [(i + di, j + dj) for di, dj in VIZINHOS if 0 <= i + di < ci and 0 <= j + dj < cj]
+        for outro in vizinhos:
+            self._construir_borda(min((i, j), outro), max((i, j), outro))
+        for cluster in [(i, j)] + vizinhos:
+            self._construir_intra(cluster)
+
+    def _inter(self, porta):
+        """
+        Células do outro lado das entradas que passam por `porta`.
+        """
+        cluster = self._cluster(porta)
+        i, j = cluster
+        for outro in ((i, j + 1), (i + 1, j), (i, j - 1), (i - 1, j)):
+            chave = (cluster, outro) if outro > cluster else (outro, cluster)
+            lado = 0 if outro > cluster else 1
+            for par in self.bordas.get(chave, ()):
+                if par[lado] == porta:
+                    yield par[1 - lado]
+
+    def _refinar(self, a, b):
+        """
+        Caminho célula a célula entre dois nós abstratos do mesmo cluster,
+        descendo o campo BFS local de b; para uma entrada, só o passo entre
+        as duas células.
+        """
+        if abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1 and self._cluster(a) != self._cluster(b):
+            return [b]
+        cluster = self._cluster(a)
+        campo, x0, y0 = self._campo_consulta(cluster, b)
+        linhas, colunas = campo.shape
+        x, y = a[0] - x0, a[1] - y0
+        trecho = []
+        while campo[x, y]:
+            for dx, dy in VIZINHOS:
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < linhas and 0 <= ny < colunas and campo[nx, ny] == campo[x, y] - 1:
+                    x, y = nx, ny
+                    break
+            trecho.append((x + x0, y + y0))
+        return trecho
+
+    def caminho(self, inicio, destino):
+        """
+        Retorna: lista [inicio, ..., destino] ou None se inacessível
+        """
+        if inicio == destino:
+            return [inicio]
+        if not self.passavel[destino]:
+            return None
+
+        c_ini, c_dest = self._cluster(inicio), self._cluster(destino)
+        campo_ini, x0, y0 = self._campo_consulta(c_ini, inicio)
+        saidas = {}
+        for porta in self.intra[c_ini]:
+            d = campo_ini[porta[0] - x0, porta[1] - y0]
+            if d != INALCANCAVEL:
+                saidas[porta] = int(d)
+        campo_dest, x1, y1 = self._campo_consulta(c_dest, destino)
+        chegadas = {}
+        for porta in self.intra[c_dest]:
+            d = campo_dest[porta[0] - x1, porta[1] - y1]
+            if d != INALCANCAVEL:
+                chegadas[porta] = int(d)
+
+        melhor = float('inf')
+        if c_ini == c_dest:
+            d = campo_ini[destino[0] - x0, destino[1] - y0]
+            if d != INALCANCAVEL:
+                melhor = int(d)
+
+        def heuristica(pos):
+            return abs(pos[0] - destino[0]) + abs(pos[1] - destino[1])
+
+        # A* no grafo abstrato; o destino entra pelas portas do seu cluster
+        fila = [(heuristica(inicio), 0, inicio)]
+        custos = {inicio: 0}
+        pais = {inicio: None}
+        while fila:
+            f, g, no = heapq.heappop(fila)
+            if f >= melhor:
+                break
+            if no == destino:
+                break
+            if g > custos[no]:
+                continue
+            self.expandidos += 1
+            if no == inicio:
+                # O início pode ser ele mesmo uma porta
+                arestas = list(saidas.items()) + [(v, 1) for v in self._inter(no)]
+            else:
+                arestas = list(self.intra[self._cluster(no)][no].items()) + [(v, 1) for v in self._inter(no)]
+                if no in chegadas:
+                    arestas.append((destino, chegadas[no]))
+            for v, custo in arestas:
+                novo_g = g + custo
+                if novo_g < custos.get(v, float('inf')):
+                    custos[v] = novo_g
+                    pais[v] = no
+                    heapq.heappush(fila, (novo_g + heuristica(v), novo_g, v))
+                    self.empurrados += 1
+
+        if custos.get(destino, float('inf')) < melhor:
+            abstrato = _montar(pais, destino)
+            caminho = [inicio]
+            for a, b in zip(abstrato, abstrato[1:]):
+                caminho += self._refinar(a, b)
+            return caminho
+        if melhor < float('inf'):
+            return [inicio] + self._refinar(inicio, destino)
+        return None
+
+
+# Backends de busca selecionáveis por agente (Agente_BDI(planejador=...))
+BUSCAS = {
+    'jps': BuscaJPS,
+    'hpa': BuscaHPA
+}
+
+
+def conferir(consultas=2000, tamanhos=(5, 10, 20, 40), densidade=0.25, tamanho_cluster=8, semente=0):
+    """
+    Valida os backends contra a_estrela em salas aleatórias: o caminho do JPS
+    tem que ter o mesmo comprimento e o do HPA* tem que ser válido (existe
+    sempre que o A* acha um), podendo ser mais longo.
+
+    Retorna: (consultas conferidas, razão média e máxima HPA*/A*);
+    levanta AssertionError na primeira diferença
+    """
+    rng = np.random.default_rng(semente)
+    razoes = []
+    feitas = 0
+    por_sala = max(1, consultas // (len(tamanhos) * 10))
+    for tamanho in tamanhos:
+        for _ in range(10):
+            passavel = rng.random((tamanho, tamanho)) >= densidade
+            livres = [tuple(map(int, c)) for c in np.argwhere(passavel)]
+            if len(livres) < 2:
+                continue
+            jps, hpa = BuscaJPS(passavel), BuscaHPA(passavel, tamanho_cluster)
+            for _ in range(por_sala):
+                inicio, destino = (livres[i] for i in rng.integers(len(livres), size=2))
+                referencia = a_estrela(passavel, inicio, destino)
+                for nome, caminho in (('jps', jps.caminho(inicio, destino)), ('hpa', hpa.caminho(inicio, destino))):
+                    assert (caminho is None) == (referencia is None), (nome, inicio, destino)
+                    if caminho is None:
+                        continue
+                    assert caminho[0] == inicio and caminho[-1] == destino, (nome, inicio, destino)
+                    for (x0, y0), (x1, y1) in zip(caminho, caminho[1:]):
+                        assert abs(x1 - x0) + abs(y1 - y0) == 1 and passavel[x1, y1], (nome, inicio, destino)
+                assert comprimento(jps.caminho(inicio, destino)) == comprimento(referencia), (inicio, destino)
+                if referencia is not None and len(referencia) > 1:
+                    razoes.append(comprimento(hpa.caminho(inicio, destino)) / comprimento(referencia))
+                feitas += 1
+    return feitas, float(np.mean(razoes)), float(np.max(razoes))
+
+
+if __name__ == "__main__":
+    feitas, media, maxima = conferir()
+    print(f"{feitas} consultas: JPS igual ao A*, HPA* {media:.3f}x em média (máx {maxima:.2f}x)")
@@ -0,0 +1,52 @@
+from enum import IntEnum
+import numpy as np
+
+
+class Celula(IntEnum):
+    """
+    Tipos de célula do ambiente, guardados no grid como inteiros de 1 byte.
+    Os códigos das sujeiras coincidem com a pontuação de cada uma.
+    """
+    LIMPO = 0
+    POEIRA = 1
+    LIQUIDO = 2
+    DETRITOS = 3
+    MOVEL = 4
+
+
+# Constantes inteiras simples para os laços quentes (comparar com IntEnum é mais lento)
+LIMPO = int(Celula.LIMPO)
+POEIRA = int(Celula.POEIRA)
+LIQUIDO = int(Celula.LIQUIDO)
+DETRITOS = int(Celula.DETRITOS)
+MOVEL = int(Celula.MOVEL)
+
+TIPO_GRID = np.uint8
+
+# Tabelas indexadas pelo código da célula
+PONTOS = np.array([0, 1, 2, 3, 0], dtype=np.int64)
+EH_SUJEIRA = PONTOS > 0
+NOMES = np.array(["limpo", "poeira", "liquido", "detritos", "movel"], dtype=object)
+CODIGOS = {nome: codigo for codigo, nome in enumerate(NOMES)}
+
+
+def grid_vazio(tamanho):
+    return np.full((tamanho, tamanho), LIMPO, dtype=TIPO_GRID)
+
+
+def para_texto(grid):
+    """
+    Converte um grid de códigos para os nomes em texto (só para exibição).
+    """
+    return NOMES[np.asarray(grid)]
+
+
+def de_texto(grid):
+    """
+    Converte um grid de nomes em texto ("limpo", "movel", ...) para códigos.
+    """
+    grid = np.asarray(grid, dtype=object)
+    codigos = np.empty(grid.shape, dtype=TIPO_GRID)
+    for nome, codigo in CODIGOS.items():
+        codigos[grid == nome] = codigo
+    return codigos
@@ -0,0 +1,174 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections import namedtuple
+import numpy as np
+from ambiente import Ambiente, calcular_mascaras
+from celulas import EH_SUJEIRA, MOVEL, NOMES
+from distancias import campo_distancias
+from gerador import gerar_ambiente
+
+# Mude quando a geração das salas ou o formato dos arquivos mudar: invalida os cenários antigos
+VERSAO = 1
+FORMATOS = ('npz', 'npy')
+CAMPOS = ('grid', 'passagem', 'sujos', 'nos', 'distancias')
+INICIO = (0, 0)
+
+# Sala pronta para simular:
+# - nos: coordenadas (K+1, 2) do início e das K sujeiras, nessa ordem
+# - distancias: matriz (K+1, K+1) de distâncias BFS entre os nós (INALCANCAVEL = -1)
+Cenario = namedtuple('Cenario', CAMPOS)
+
+
+def _normalizar(opcoes):
+    """
+    Opções de gerar_ambiente num formato estável para a chave: tipos de
+    célula viram nomes e dicts viram listas ordenadas.
+    """
+    normal = {}
+    for nome, valor in sorted(opcoes.items()):
+        if isinstance(valor, dict):
+            valor = sorted((tipo if isinstance(tipo, str) else NOMES[int(tipo)], float(v)) for tipo, v in valor.items())
+        elif isinstance(valor, tuple):
+            valor = [list(v) if isinstance(v, tuple) else v for v in valor]
+        normal[nome] = valor
+    return normal
+
+
+def chave(tamanho, semente, **opcoes):
+    """
+    Identificador do cenário (tamanho, opções de geração como densidades, semente).
+
+    Retorna: string hexadecimal, usada como nome de arquivo
+    """
+    if semente is None:
+        raise ValueError("cenário sem semente não tem chave: cada chamada gera uma sala diferente")
+    descricao = json.dumps({'versao': VERSAO, 'tamanho': tamanho, 'semente': semente,
+                            'opcoes': _normalizar(opcoes)}, sort_keys=True)
+    return hashlib.sha1(descricao.encode()).hexdigest()[:20]
+
+
+def montar_cenario(tamanho, semente, **opcoes):
+    """
+    Gera a sala (mesma de gerar_ambiente / inicializar_ambiente para as
+    mesmas opções) e calcula máscaras e a matriz de distâncias entre o
+    início e todas as sujeiras, com uma BFS por nó.
+    """
+    grid = gerar_ambiente(tamanho, semente=semente, **opcoes)
+    passagem, sujos = calcular_mascaras(grid)
+    nos = np.array([INICIO] + [tuple(c) for c in np.argwhere(EH_SUJEIRA[grid])], dtype=np.int32).reshape(-1, 2)
+    passavel = grid != MOVEL
+    linhas, colunas = nos[:, 0], nos[:, 1]
+    distancias = np.empty((len(nos), len(nos)), dtype=np.int32)
+    for i, no in enumerate(nos):
+        distancias[i] = campo_distancias(passavel, tuple(no))[linhas, colunas]
+    return Cenario(grid, passagem, sujos, nos, distancias)
+
+
+class CatalogoCenarios:
+    """
+    Cenários salvos em disco, um por chave(tamanho, semente, opções).
+
+    - formato 'npz': um arquivo comprimido por cenário (menor em disco)
+    - formato 'npy': uma pasta com um .npy por array, aberta com
+      mmap_mode='r'; vários processos lendo a mesma matriz de distâncias
+      compartilham as páginas do arquivo em vez de cada um ter sua cópia
+
+    Grid e máscaras voltam como cópias graváveis, porque a simulação os
+    altera; a matriz de distâncias fica só leitura.
+    """
+
+    def __init__(self, pasta=None, formato='npz'):
+        if formato not in FORMATOS:
+            raise ValueError(f"formato desconhecido: {formato}")
+        self.pasta = pasta or os.environ.get('T1_CENARIOS') or os.path.join(tempfile.gettempdir(), 't1_cenarios')
+        self.formato = formato
+        self.gerados = 0
+        self.lidos = 0
+        os.makedirs(self.pasta, exist_ok=True)
+
+    def _caminho(self, nome):
+        return os.path.join(self.pasta, nome + ('.npz' if self.formato == 'npz' else ''))
+
+    def _salvar(self, nome, cenario):
+        # Grava num nome temporário e renomeia: processos concorrentes nunca leem um cenário pela metade
+        destino = self._caminho(nome)
+        temporario = tempfile.mkdtemp(dir=self.pasta, prefix='.tmp_')
+        if self.formato == 'npz':
+            arquivo = os.path.join(temporario, 'cenario.npz')
+            np.savez_compressed(arquivo, **cenario._asdict())
+            os.replace(arquivo, destino)
+            os.rmdir(temporario)
+        else:
+            for campo, valor in cenario._asdict().items():
+                np.save(os.path.join(temporario, campo + '.npy'), valor)
+            try:
+                os.rename(temporario, destino)
+            except OSError:
+                # Outro processo salvou o mesmo cenário primeiro
+                for campo in CAMPOS:
+                    os.remove(os.path.join(temporario, campo + '.npy'))
+                os.rmdir(temporario)
+
+    def _ler(self, nome):
+        caminho = self._caminho(nome)
+        if not os.path.exists(caminho):
+            return None
+        if self.formato == 'npz':
+            with np.load(caminho) as dados:
+                return Cenario(*(dados[campo] for campo in CAMPOS))
+        arrays = {campo: np.load(os.path.join(caminho, campo + '.npy'), mmap_mode='r') for campo in CAMPOS}
+        # Só a matriz de distâncias continua mapeada; o resto é pequeno e a simulação altera
+        return Cenario(**{campo: (valor if campo == 'distancias' else np.array(valor))
+                          for campo, valor in arrays.items()})
+
+    def obter(self, tamanho, semente, **opcoes):
+        """
+        Lê o cenário do disco ou, na primeira vez, gera e salva. Sem semente
+        a sala é aleatória a cada chamada, então é gerada sem passar pelo disco.
+
+        Retorna: Cenario
+        """
+        if semente is None:
+            self.gerados += 1
+            return montar_cenario(tamanho, semente, **opcoes)
+        nome = chave(tamanho, semente, **opcoes)
+        cenario = self._ler(nome)
+        if cenario is not None:
+            self.lidos += 1
+            return cenario
+        cenario = montar_cenario(tamanho, semente, **opcoes)
+        self._salvar(nome, cenario)
+        self.gerados += 1
+        return cenario
+
+    def ambiente(self, tamanho, semente, **opcoes):
+        """
+        Retorna: (Ambiente pronto, Cenario)
+        """
+        cenario = self.obter(tamanho, semente, **opcoes)
+        return Ambiente(cenario.grid, (cenario.passagem, cenario.sujos)), cenario
+
+
+def rodar_cenario(agente, tamanho, semente, max_steps=60, catalogo=None, bateria=30, parar=(), observadores=(),
+                  **opcoes):
+    """
+    Roda um episódio numa sala do catálogo. O agente BDI recebe a matriz de
+    distâncias do cenário e não roda as BFS do primeiro plano.
+
+    Parâmetros:
+    - agente: nome em motor.AGENTES
+    - catalogo: CatalogoCenarios (None usa a pasta padrão)
+    - opcoes: opções de gerar_ambiente (densidades, moveis, ...)
+
+    Retorna: (estados, agente)
+    """
+    from motor import criar_agente, rodar
+
+    catalogo = catalogo or CatalogoCenarios()
+    ambiente, cenario = catalogo.ambiente(tamanho, semente, **opcoes)
+    instancia = criar_agente(agente, ambiente, bateria)
+    if agente == 'bdi':
+        instancia.distancias.carregar_pares(cenario.nos, cenario.distancias)
+    return rodar(instancia, max_steps, parar, observadores), instancia
@@ -0,0 +1,132 @@
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from avaliacao import AGENTES, PASSOS_PADRAO, rodar_episodio, semente_episodio
+
+# Só numpy e os módulos da simulação são importados aqui; matplotlib só
+# entra com --render ou --exportar (motor.mostrar importa na hora)
+
+
+def _tarefa(argumentos):
+    return rodar_episodio(*argumentos)
+
+
+def episodios(agente, tamanho, episodios=1, max_steps=None, semente=0, processos=1, cenarios=None):
+    """
+    Roda os episódios e entrega cada resultado assim que fica pronto, na
+    ordem dos episódios (a semente da sala de cada um é
+    avaliacao.semente_episodio(semente, tamanho, e)).
+
+    Retorna: gerador de dicts de avaliacao.rodar_episodio
+    """
+    tarefas = ((agente, tamanho, semente_episodio(semente, tamanho, e), max_steps, cenarios)
+               for e in range(episodios))
+    if processos == 1:
+        for tarefa in tarefas:
+            yield _tarefa(tarefa)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    processos = processos or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        yield from pool.map(_tarefa, tarefas, chunksize=max(1, episodios // (processos * 8)))
+
+
+class Saida:
+    """
+    Escreve uma linha por resultado (JSON lines ou CSV) e dá flush a cada
+    linha, para quem lê o stdout ou o arquivo acompanhar a execução.
+    """
+
+    def __init__(self, arquivo, formato):
+        self.arquivo = arquivo
+        self.formato = formato
+        self.escritor = None
+
+    def escrever(self, linha):
+        if self.formato == 'csv':
+            if self.escritor is None:
+                self.escritor = csv.DictWriter(self.arquivo, fieldnames=list(linha))
+                self.escritor.writeheader()
+            self.escritor.writerow(linha)
+        else:
+            self.arquivo.write(json.dumps(linha) + '\n')
+        self.arquivo.flush()
+
+
+def _passo_dict(p):
+    linha = p._asdict()
+    linha['celula'] = list(p.celula) if p.celula is not None else None
+    return linha
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulação dos agentes do t1 sem interface gráfica")
+    parser.add_argument('--agente', default='bdi', choices=AGENTES)
+    parser.add_argument('--tamanho', type=int, default=5)
+    parser.add_argument('--passos', type=int, default=None, help="limite de passos (padrão do agente se omitido)")
+    parser.add_argument('--semente', type=int, default=0, help="semente base das salas")
+    parser.add_argument('--episodios', type=int, default=1, help="0 = só anima/exporta (com --render/--exportar)")
+    parser.add_argument('--processos', type=int, default=1, help="processos em paralelo (0 = todos os núcleos)")
+    parser.add_argument('--saida', default='-', help="arquivo de resultados ('-' = stdout)")
+    parser.add_argument('--formato', choices=('jsonl', 'csv'), default='jsonl')
+    parser.add_argument('--trajetoria', action='store_true',
+                        help="escreve cada passo dos episódios em vez de um resumo por episódio")
+    parser.add_argument('--cenarios', help="pasta de cenários em disco (ver cenarios.py)")
+    parser.add_argument('--render', action='store_true', help="anima o primeiro episódio na tela")
+    parser.add_argument('--exportar', help="grava o primeiro episódio em GIF (.gif) ou PNGs (pasta)")
+    args = parser.parse_args(argv)
+    if args.trajetoria and args.processos != 1:
+        parser.error("--trajetoria roda os episódios em sequência; não use com --processos")
+    if args.trajetoria and args.cenarios:
+        parser.error("--trajetoria gera as salas direto; não use com --cenarios")
+
+    max_steps = args.passos or PASSOS_PADRAO[args.agente]
+    arquivo = sys.stdout if args.saida == '-' else open(args.saida, 'w', newline='')
+    saida = Saida(arquivo, args.formato)
+    inicio = time.perf_counter()
+    total = 0
+    try:
+        if args.trajetoria:
+            for e in range(args.episodios):
+                semente = semente_episodio(args.semente, args.tamanho, e)
+                for p in _passos_episodio(args.agente, args.tamanho, max_steps, semente):
+                    saida.escrever(dict(_passo_dict(p), episodio=e, semente=semente))
+                total += 1
+        else:
+            for resultado in episodios(args.agente, args.tamanho, args.episodios, max_steps, args.semente,
+                                       args.processos or None, args.cenarios):
+                saida.escrever(resultado)
+                total += 1
+    except BrokenPipeError:
+        # Leitor do stdout fechou antes do fim (ex.: `| head`)
+        sys.stdout = open(os.devnull, 'w')
+        return 0
+    finally:
+        if arquivo is not sys.stdout:
+            arquivo.close()
+    if args.episodios:
+        print(f"{total} episódios em {time.perf_counter() - inicio:.3f} s", file=sys.stderr)
+
+    if args.render or args.exportar:
+        from motor import rodar_episodio as rodar, mostrar
+        estados, _ = rodar(args.agente, args.tamanho, max_steps, semente_episodio(args.semente, args.tamanho, 0))
+        if args.exportar:
+            mostrar(estados, args.exportar)
+        if args.render:
+            mostrar(estados, intervalo_ms=500)
+    return 0
+
+
+def _passos_episodio(agente, tamanho, max_steps, semente):
+    from ambiente import Ambiente
+    from desenharMapa import inicializar_ambiente
+    from motor import criar_agente, passos
+    return passos(criar_agente(agente, Ambiente(inicializar_ambiente(tamanho, semente))), max_steps)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,209 @@
+import argparse
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+import numpy as np
+from ambiente import Ambiente
+from avaliacao import AGENTES, BATERIA_INICIAL, PASSOS_PADRAO, semente_episodio, salvar_json
+from desenharMapa import inicializar_ambiente
+from motor import criar_agente, passos
+
+TAMANHOS = (5, 16, 32, 64, 128, 256, 512)
+# Métricas comparadas entre dois arquivos de resultado; todas são "menor é melhor"
+METRICAS = ('geracao_ms', 'preparo_ms', 'passo_us_p50', 'passo_us_p95', 'episodio_ms', 'memoria_pico_kb')
+
+
+def limites(agente, tamanho, max_steps=None, bateria=None):
+    """
+    Limite de passos e bateria inicial de um episódio. Sem valores
+    explícitos, crescem com a sala (4 por lado, no mínimo os padrões dos
+    agentes): com a bateria fixa de 30 o agente nem atravessa uma sala
+    grande e o benchmark só mediria o planejamento inicial.
+
+    Retorna: (max_steps, bateria)
+    """
+    return (max_steps or max(PASSOS_PADRAO[agente], 4 * tamanho),
+            bateria or max(BATERIA_INICIAL, 4 * tamanho))
+
+
+def _episodio(agente, grid, max_steps, bateria):
+    """
+    Monta o agente sobre uma cópia de `grid`.
+
+    Retorna: gerador de fluxo.Passo do episódio
+    """
+    return passos(criar_agente(agente, Ambiente(grid.copy()), bateria), max_steps)
+
+
+def medir_episodio(agente, tamanho, semente, max_steps=None, bateria=None):
+    """
+    Cronometra uma sala: geração, preparo do agente e cada passo da
+    simulação (o planejamento inicial do BDI cai no primeiro passo).
+
+    Retorna: dict com geracao_ms, preparo_ms, episodio_ms e a lista passos_us
+    """
+    max_steps, bateria = limites(agente, tamanho, max_steps, bateria)
+    _episodio(agente, inicializar_ambiente(5, 0), 1, 1)  # importa os módulos do agente fora da medição
+
+    inicio = time.perf_counter()
+    grid = inicializar_ambiente(tamanho, semente)
+    geracao = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    passos = _episodio(agente, grid, max_steps, bateria)
+    preparo = time.perf_counter() - inicio
+
+    tempos = []
+    anterior = time.perf_counter()
+    for _ in passos:
+        agora = time.perf_counter()
+        tempos.append(agora - anterior)
+        anterior = agora
+    episodio = preparo + sum(tempos) + (time.perf_counter() - anterior)
+
+    return {
+        'geracao_ms': geracao * 1e3,
+        'preparo_ms': preparo * 1e3,
+        'episodio_ms': episodio * 1e3,
+        'passos_us': [t * 1e6 for t in tempos]
+    }
+
+
+def medir_memoria(agente, tamanho, semente, max_steps=None, bateria=None):
+    """
+    Pico de memória alocada (tracemalloc) gerando a sala e rodando o
+    episódio inteiro. Fica separado dos tempos porque o tracemalloc deixa
+    cada alocação bem mais lenta.
+
+    Retorna: pico em KiB
+    """
+    max_steps, bateria = limites(agente, tamanho, max_steps, bateria)
+    tracemalloc.start()
+    try:
+        for _ in _episodio(agente, inicializar_ambiente(tamanho, semente), max_steps, bateria):
+            pass
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return pico / 1024
+
+
+def medir(agentes=AGENTES, tamanhos=TAMANHOS, repeticoes=5, max_steps=None, bateria=None, semente=0, memoria=True):
+    """
+    Roda o benchmark completo. Cada (agente, tamanho) usa as mesmas
+    `repeticoes` salas (sementes de avaliacao.semente_episodio), então
+    resultados de commits diferentes são comparáveis.
+
+    Retorna: lista de dicts, um por (agente, tamanho), com medianas dos
+    tempos de geração, preparo e episódio, p50/p95 do tempo por passo
+    (juntando os passos de todas as repetições; None se nenhum passo) e
+    pico de memória
+    """
+    resultados = []
+    for tamanho in tamanhos:
+        sementes = [semente_episodio(semente, tamanho, r) for r in range(repeticoes)]
+        for agente in agentes:
+            medidas = [medir_episodio(agente, tamanho, s, max_steps, bateria) for s in sementes]
+            passos = [t for m in medidas for t in m['passos_us']]
+            item = {
+                'agente': agente,
+                'tamanho': tamanho,
+                'repeticoes': repeticoes,
+                'passos_medio': float(np.mean([len(m['passos_us']) for m in medidas])),
+                'geracao_ms': float(np.median([m['geracao_ms'] for m in medidas])),
+                'preparo_ms': float(np.median([m['preparo_ms'] for m in medidas])),
+                'passo_us_p50': float(np.percentile(passos, 50)) if passos else None,
+                'passo_us_p95': float(np.percentile(passos, 95)) if passos else None,
+                'episodio_ms': float(np.median([m['episodio_ms'] for m in medidas])),
+            }
+            if memoria:
+                item['memoria_pico_kb'] = medir_memoria(agente, tamanho, sementes[0], max_steps, bateria)
+            resultados.append(item)
+    return resultados
+
+
+def _commit():
+    try:
+        saida = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, timeout=5)
+        return saida.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def comparar(antes, depois, limite=1.2):
+    """
+    Compara dois resultados de medir() (ou os dicts salvos por main).
+
+    Parâmetros:
+    - limite: razão depois/antes a partir da qual a métrica conta como regressão
+
+    Retorna: lista de (agente, tamanho, metrica, antes, depois, razao, regressao)
+    """
+    antes = antes.get('resultados', antes) if isinstance(antes, dict) else antes
+    depois = depois.get('resultados', depois) if isinstance(depois, dict) else depois
+    base = {(r['agente'], r['tamanho']): r for r in antes}
+    linhas = []
+    for r in depois:
+        anterior = base.get((r['agente'], r['tamanho']))
+        if anterior is None:
+            continue
+        for metrica in METRICAS:
+            if r.get(metrica) is not None and anterior.get(metrica) is not None:
+                razao = r[metrica] / anterior[metrica] if anterior[metrica] else float('inf')
+                linhas.append((r['agente'], r['tamanho'], metrica, anterior[metrica], r[metrica],
+                               razao, razao > limite))
+    return linhas
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark de escala dos agentes do t1")
+    parser.add_argument('--agentes', nargs='+', default=list(AGENTES), choices=AGENTES)
+    parser.add_argument('--tamanhos', nargs='+', type=int, default=list(TAMANHOS))
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--passos', type=int, default=None, help="limite de passos (padrão: cresce com a sala)")
+    parser.add_argument('--bateria', type=int, default=None, help="bateria inicial (padrão: cresce com a sala)")
+    parser.add_argument('--semente', type=int, default=0)
+    parser.add_argument('--sem-memoria', action='store_true', help="não mede o pico de memória")
+    parser.add_argument('--json', help="arquivo JSON com os resultados")
+    parser.add_argument('--comparar', nargs=2, metavar=('ANTES', 'DEPOIS'),
+                        help="compara dois arquivos JSON em vez de medir")
+    parser.add_argument('--limite', type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    if args.comparar:
+        with open(args.comparar[0]) as f:
+            antes = json.load(f)
+        with open(args.comparar[1]) as f:
+            depois = json.load(f)
+        regressoes = 0
+        for agente, tamanho, metrica, a, d, razao, regressao in comparar(antes, depois, args.limite):
+            regressoes += regressao
+            print(f"{agente:>8} N={tamanho:<4} {metrica:<16} {a:12.2f} -> {d:12.2f}  {razao:5.2f}x"
+                  f"{'  REGRESSÃO' if regressao else ''}")
+        return 1 if regressoes else 0
+
+    resultados = medir(args.agentes, args.tamanhos, args.repeticoes, args.passos, args.bateria, args.semente,
+                       not args.sem_memoria)
+    if args.json:
+        salvar_json({
+            'parametros': vars(args),
+            'commit': _commit(),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'plataforma': platform.platform(),
+            'resultados': resultados
+        }, args.json)
+
+    for r in resultados:
+        memoria = f" mem {r['memoria_pico_kb']:.0f} KiB" if 'memoria_pico_kb' in r else ""
+        print(f"{r['agente']:>8} N={r['tamanho']:<4} geração {r['geracao_ms']:.2f} ms "
+              f"preparo {r['preparo_ms']:.2f} ms passo p50 {r['passo_us_p50'] or 0:.1f} us "
+              f"p95 {r['passo_us_p95'] or 0:.1f} us episódio {r['episodio_ms']:.2f} ms "
+              f"({r['passos_medio']:.0f} passos){memoria}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
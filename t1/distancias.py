@@ -0,0 +1,202 @@
+from collections import OrderedDict, deque
+import heapq
+import numpy as np
+from celulas import MOVEL
+
+# Valor do campo de distâncias para células que não podem ser alcançadas
+INALCANCAVEL = -1
+
+
+def campo_distancias(passavel, origem):
+    """
+    Distância (em passos, vizinhança 4) da origem até todas as células do grid.
+
+    BFS por frentes de onda: a cada iteração a frente inteira avança um passo
+    de uma vez com operações NumPy sobre índices planos. O grid é cercado por
+    uma borda não passável, então não há testes de limite no laço.
+
+    Parâmetros:
+    - passavel: array booleano (linhas, colunas), True onde o agente pode andar
+    - origem: tupla (x, y) da célula de partida
+
+    Retorna: array int32 (linhas, colunas) com INALCANCAVEL onde não há caminho
+    """
+    linhas, colunas = passavel.shape
+    largura = colunas + 2
+    livre = np.zeros((linhas + 2, largura), dtype=bool)
+    livre[1:-1, 1:-1] = passavel
+    livre = livre.ravel()
+    dist = np.full(livre.size, INALCANCAVEL, dtype=np.int32)
+
+    inicio = (origem[0] + 1) * largura + origem[1] + 1
+    dist[inicio] = 0
+    livre[inicio] = False
+
+    deslocamentos = np.array([largura, -largura, 1, -1])
+    frente = np.array([inicio])
+    passo = 0
+    while frente.size:
+        passo += 1
+        vizinhos = (frente[:, None] + deslocamentos).ravel()
+        vizinhos = np.unique(vizinhos[livre[vizinhos]])
+        livre[vizinhos] = False
+        dist[vizinhos] = passo
+        frente = vizinhos
+
+    return dist.reshape(linhas + 2, largura)[1:-1, 1:-1].copy()
+
+
+def _vizinhos(campo, x, y):
+    linhas, colunas = campo.shape
+    if x > 0:
+        yield x - 1, y
+    if x < linhas - 1:
+        yield x + 1, y
+    if y > 0:
+        yield x, y - 1
+    if y < colunas - 1:
+        yield x, y + 1
+
+
+def reparar_campo(campo, passavel, x, y):
+    """
+    Corrige no lugar um campo de distâncias depois que só a passagem da
+    célula (x, y) mudou (`passavel` já deve estar atualizado). Só as células
+    cuja distância muda são visitadas, então o custo depende do tamanho da
+    região afetada e não do grid.
+
+    - Célula liberada: propaga a redução de distância a partir dela.
+    - Célula bloqueada: marca as células que só chegavam à origem passando
+      por ela e recalcula apenas essas, a partir da fronteira não afetada.
+
+    Retorna: número de células alteradas, ou None se a própria origem do
+    campo foi bloqueada (o campo deixa de fazer sentido)
+    """
+    if passavel[x, y]:
+        alcancaveis = [campo[v] for v in _vizinhos(campo, x, y) if campo[v] != INALCANCAVEL]
+        if not alcancaveis:
+            return 0
+        campo[x, y] = min(alcancaveis) + 1
+        fila = deque([(x, y)])
+        alteradas = 1
+        while fila:
+            u = fila.popleft()
+            d = campo[u] + 1
+            for v in _vizinhos(campo, *u):
+                if passavel[v] and (campo[v] == INALCANCAVEL or campo[v] > d):
+                    campo[v] = d
+                    fila.append(v)
+                    alteradas += 1
+        return alteradas
+
+    d0 = campo[x, y]
+    if d0 == INALCANCAVEL:
+        return 0
+    if d0 == 0:
+        return None
+    campo[x, y] = INALCANCAVEL
+
+    # Em ordem de distância: uma célula é afetada se nenhum vizinho não
+    # afetado está um passo mais perto da origem
+    afetadas = set()
+    vistas = set()
+    fila = deque(v for v in _vizinhos(campo, x, y) if campo[v] == d0 + 1)
+    while fila:
+        v = fila.popleft()
+        if v in vistas:
+            continue
+        vistas.add(v)
+        d = campo[v]
+        if any(campo[u] == d - 1 and u not in afetadas for u in _vizinhos(campo, *v)):
+            continue
+        afetadas.add(v)
+        fila.extend(w for w in _vizinhos(campo, *v) if campo[w] == d + 1)
+
+    for v in afetadas:
+        campo[v] = INALCANCAVEL
+    # Recalcula as afetadas a partir dos vizinhos que mantiveram a distância
+    fronteira = []
+    for v in afetadas:
+        alcancaveis = [campo[u] for u in _vizinhos(campo, *v) if campo[u] != INALCANCAVEL]
+        if alcancaveis:
+            heapq.heappush(fronteira, (min(alcancaveis) + 1, v))
+    while fronteira:
+        d, v = heapq.heappop(fronteira)
+        if campo[v] != INALCANCAVEL and campo[v] <= d:
+            continue
+        campo[v] = d
+        for w in _vizinhos(campo, *v):
+            if w in afetadas and (campo[w] == INALCANCAVEL or campo[w] > d + 1):
+                heapq.heappush(fronteira, (d + 1, w))
+    return len(afetadas) + 1
+
+
+class CacheDistancias:
+    """
+    Guarda os campos de distância já calculados, um por origem.
+
+    Os campos só dependem das células "movel", então continuam válidos
+    enquanto nenhum móvel muda de lugar. Qualquer alteração de célula deve ser
+    avisada com celula_alterada(), que descarta o cache se a passagem mudou.
+    """
+
+    def __init__(self, grid, max_campos=64):
+        self.passavel = grid != MOVEL
+        self.max_campos = max_campos
+        self.campos = OrderedDict()
+        self.pares = None #(índice coord -> linha, matriz) pré-calculada, ver carregar_pares
+
+    def carregar_pares(self, nos, matriz):
+        """
+        Usa uma matriz de distâncias entre `nos` já pronta (por exemplo lida
+        de um cenário em disco) em vez de rodar uma BFS por origem. Vale até
+        a primeira mudança de passagem.
+        """
+        self.pares = ({tuple(map(int, no)): i for i, no in enumerate(nos)}, matriz)
+
+    def campo(self, origem):
+        campo = self.campos.get(origem)
+        if campo is None:
+            campo = campo_distancias(self.passavel, origem)
+            self.campos[origem] = campo
+            if len(self.campos) > self.max_campos:
+                self.campos.popitem(last=False)
+        else:
+            self.campos.move_to_end(origem)
+        return campo
+
+    def distancias(self, origem, destinos):
+        """
+        Distâncias da origem até cada destino, com float('inf') se inacessível.
+        """
+        if self.pares is not None and origem not in self.campos:
+            indice, matriz = self.pares
+            if origem in indice and all(destino in indice for destino in destinos):
+                linha = matriz[indice[origem]]
+                return [float('inf') if d == INALCANCAVEL else int(d)
+                        for d in (linha[indice[destino]] for destino in destinos)]
+        campo = self.campo(origem)
+        return [float('inf') if d == INALCANCAVEL else int(d)
+                for d in (campo[destino] for destino in destinos)]
+
+    def celula_alterada(self, x, y, valor):
+        """
+        Atualiza a passagem de (x, y). Se ela mudou, os campos em cache são
+        reparados localmente (reparar_campo) em vez de descartados; só os
+        campos cuja origem ficou bloqueada saem do cache.
+
+        Retorna: True se a passagem mudou
+        """
+        passavel = valor != MOVEL
+        if self.passavel[x, y] == passavel:
+            return False
+        self.passavel[x, y] = passavel
+        self.pares = None
+        for origem in list(self.campos):
+            if reparar_campo(self.campos[origem], self.passavel, x, y) is None:
+                del self.campos[origem]
+        return True
+
+    def invalidar(self):
+        self.campos.clear()
+        self.pares = None
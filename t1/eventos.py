@@ -0,0 +1,53 @@
+import numpy as np
+from celulas import LIMPO, MOVEL, POEIRA, LIQUIDO, DETRITOS
+from ambiente import DESLOCAMENTOS
+
+# Tipos de sujeira que podem surgir durante o episódio
+TIPOS_SUJEIRA = (POEIRA, LIQUIDO, DETRITOS)
+
+
+def agenda(eventos):
+    """
+    Eventos fixos: {passo: [(x, y, valor), ...]}.
+
+    Retorna: função (passo, grid, ocupadas) -> lista de (x, y, valor)
+    """
+    def ocorrer(passo, grid, ocupadas):
+        return [(x, y, valor) for x, y, valor in eventos.get(passo, ())
+                if (x, y) not in ocupadas]
+    return ocorrer
+
+
+def eventos_aleatorios(taxa_sujeira=0.05, taxa_movel=0.02, semente=None):
+    """
+    Sala dinâmica: a cada passo, com probabilidade `taxa_sujeira` aparece uma
+    sujeira em uma célula limpa e com probabilidade `taxa_movel` uma célula
+    de móvel é empurrada para uma célula limpa vizinha. Células ocupadas por
+    agentes nunca recebem móvel nem sujeira.
+
+    Retorna: função (passo, grid, ocupadas) -> lista de (x, y, valor)
+    """
+    rng = np.random.default_rng(semente)
+
+    def ocorrer(passo, grid, ocupadas):
+        mudancas = []
+        if rng.random() < taxa_sujeira:
+            limpas = np.flatnonzero(grid.ravel() == LIMPO)
+            if limpas.size:
+                x, y = divmod(int(rng.choice(limpas)), grid.shape[1])
+                if (x, y) not in ocupadas:
+                    mudancas.append((x, y, int(rng.choice(TIPOS_SUJEIRA))))
+
+        if rng.random() < taxa_movel:
+            moveis = np.flatnonzero(grid.ravel() == MOVEL)
+            if moveis.size:
+                x, y = divmod(int(rng.choice(moveis)), grid.shape[1])
+                dx, dy, _ = DESLOCAMENTOS[int(rng.integers(len(DESLOCAMENTOS)))]
+                nx, ny = x + dx, y + dy
+                if (0 <= nx < grid.shape[0] and 0 <= ny < grid.shape[1]
+                        and grid[nx, ny] == LIMPO and (nx, ny) not in ocupadas
+                        and not any((cx, cy) == (nx, ny) for cx, cy, _ in mudancas)):
+                    mudancas += [(x, y, LIMPO), (nx, ny, MOVEL)]
+        return mudancas
+
+    return ocorrer
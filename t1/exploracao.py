@@ -0,0 +1,183 @@
+from collections import deque
+import numpy as np
+from ambiente import Ambiente, DESLOCAMENTOS, BITS
+from celulas import EH_SUJEIRA, MOVEL
+from desenharMapa import inicializar_ambiente
+from motor import passos, rodar, MOVIMENTOS
+from politicas import obter_politica
+from trajetoria import ACOES
+
+# Direção de cada deslocamento, na mesma ordem de DESLOCAMENTOS (N, S, L, O)
+DIRECAO_DESLOCAMENTO = ('N', 'S', 'L', 'O')
+
+
+class Cobertura:
+    """
+    Cobertura da sala em bitmaps NumPy: `visitado` marca as células por onde
+    o agente já passou e `fronteira` as células livres ainda não visitadas
+    vizinhas de uma visitada. A fronteira é mantida a cada visita (só os
+    quatro vizinhos mudam), então nunca é recalculada sobre o grid inteiro.
+    """
+
+    def __init__(self, ambiente):
+        self.ambiente = ambiente
+        self.visitado = np.zeros(ambiente.grid.shape, dtype=bool)
+        self.fronteira = np.zeros(ambiente.grid.shape, dtype=bool)
+        self.tamanho_fronteira = 0
+
+    def _marcar_fronteira(self, x, y, valor):
+        if self.fronteira[x, y] != valor:
+            self.fronteira[x, y] = valor
+            self.tamanho_fronteira += 1 if valor else -1
+
+    def visitar(self, x, y):
+        if self.visitado[x, y]:
+            return
+        self.visitado[x, y] = True
+        self._marcar_fronteira(x, y, False)
+        passagem = self.ambiente.passagem[x, y]
+        for dx, dy, bit in DESLOCAMENTOS:
+            if passagem & bit and not self.visitado[x + dx, y + dy]:
+                self._marcar_fronteira(x + dx, y + dy, True)
+
+    def _atualizar_fronteira(self, x, y):
+        # Fronteira: célula livre, não visitada, com uma vizinha visitada livre
+        if self.visitado[x, y] or self.ambiente.grid[x, y] == MOVEL:
+            self._marcar_fronteira(x, y, False)
+            return
+        passagem = self.ambiente.passagem[x, y]
+        self._marcar_fronteira(x, y, any(passagem & bit and self.visitado[x + dx, y + dy]
+                                         for dx, dy, bit in DESLOCAMENTOS))
+
+    def celula_alterada(self, x, y, valor):
+        """
+        Um móvel ocupando (x, y) a tira da fronteira; uma célula liberada ao
+        lado de uma visitada entra nela. Se (x, y) já foi visitada, a mudança
+        também decide se as vizinhas livres continuam (ou voltam a ser)
+        alcançáveis por uma célula visitada, então elas são conferidas.
+        """
+        self._atualizar_fronteira(x, y)
+        if self.visitado[x, y]:
+            passagem = self.ambiente.passagem[x, y]
+            for dx, dy, bit in DESLOCAMENTOS:
+                if passagem & bit:
+                    self._atualizar_fronteira(x + dx, y + dy)
+
+    def novos(self, x, y):
+        """
+        Máscara de 4 bits dos vizinhos passáveis ainda não visitados.
+        """
+        passagem = self.ambiente.passagem[x, y]
+        novos = 0
+        for dx, dy, bit in DESLOCAMENTOS:
+            if passagem & bit and not self.visitado[x + dx, y + dy]:
+                novos |= bit
+        return novos
+
+    def caminho_fronteira(self, x, y):
+        """
+        BFS pelas máscaras de passagem até a célula de fronteira mais próxima.
+        Para no primeiro alvo encontrado, então o custo depende da distância
+        até a fronteira e não do tamanho da sala.
+
+        Retorna: (alvo, lista de direções) ou None se nenhuma fronteira é alcançável
+        """
+        if not self.tamanho_fronteira:
+            return None
+        passagem = self.ambiente.passagem
+        pais = {(x, y): None}
+        fila = deque([(x, y)])
+        while fila:
+            atual = fila.popleft()
+            if self.fronteira[atual]:
+                alvo = atual
+                direcoes = []
+                while pais[atual] is not None:
+                    atual, direcao = pais[atual]
+                    direcoes.append(direcao)
+                direcoes.reverse()
+                return alvo, direcoes
+            cx, cy = atual
+            mascara = passagem[cx, cy]
+            for (dx, dy, bit), direcao in zip(DESLOCAMENTOS, DIRECAO_DESLOCAMENTO):
+                vizinho = (cx + dx, cy + dy)
+                if mascara & bit and vizinho not in pais:
+                    pais[vizinho] = (atual, direcao)
+                    fila.append(vizinho)
+        return None
+
+
+class AgenteExplorador:
+    """
+    Modo de exploração do aspiradorModelo no protocolo do motor.
+
+    A decisão local é a mesma tabela compilada do aspiradorModelo, com os
+    vizinhos não visitados lidos do bitmap de cobertura em vez de um set de
+    tuplas. Quando a tabela cai no último caso (andar para um vizinho já
+    visitado e limpo, o vaivém que gasta bateria em salas grandes), o agente
+    segue o caminho mais curto até a fronteira mais próxima; sem fronteira
+    alcançável a sala está coberta e ele para.
+    """
+
+    def __init__(self, ambiente, bateria=30):
+        self.ambiente = ambiente
+        self.politica = obter_politica("modelo")
+        self.bateria = bateria
+        self.cobertura = Cobertura(ambiente)
+        self.alvo = None #célula de fronteira perseguida
+        self.rumo = deque() #direções restantes até self.alvo
+
+    def tem_bateria(self):
+        return self.politica.tem_bateria(self.bateria)
+
+    def observar(self, x, y):
+        self.cobertura.visitar(x, y)
+
+    def _rumo_fronteira(self, x, y):
+        if self.alvo is None or not self.cobertura.fronteira[self.alvo] or not self.rumo \
+                or not self.ambiente.pode_ir(x, y, self.rumo[0]):
+            encontrado = self.cobertura.caminho_fronteira(x, y)
+            if encontrado is None:
+                self.alvo, self.rumo = None, deque()
+                return "parar"
+            self.alvo, direcoes = encontrado
+            self.rumo = deque(direcoes)
+        return self.rumo.popleft()
+
+    def agir(self, x, y):
+        ambiente = self.ambiente
+        novos = self.cobertura.novos(x, y)
+        sujos = int(ambiente.sujos[x, y])
+        codigo = self.politica.codigo(int(ambiente.passagem[x, y]), sujos, int(EH_SUJEIRA[ambiente.grid[x, y]]),
+                                      int(self.tem_bateria()), novos)
+        acao = ACOES[self.politica.tabela[codigo]]
+        if acao in MOVIMENTOS and not (novos | sujos) & BITS[acao]:
+            return self._rumo_fronteira(x, y)
+        if acao in MOVIMENTOS:
+            # Desvio local: o rumo antigo não vale mais a partir da nova célula
+            self.rumo.clear()
+        return acao
+
+    def alterar_celula(self, x, y, valor):
+        self.ambiente.alterar(x, y, valor)
+        self.cobertura.celula_alterada(x, y, valor)
+
+
+def passos_exploracao(ambiente, max_steps=60, bateria=30):
+    """
+    Simula o agente explorador passo a passo sobre `ambiente`, que é alterado no lugar.
+
+    Retorna: gerador de fluxo.Passo, um por ação executada
+    """
+    return passos(AgenteExplorador(ambiente, bateria), max_steps)
+
+
+def rodar_exploracao(tamanho=5, max_steps=60, semente=None, parar=(), observadores=()):
+    """
+    Roda um episódio sem desenhar nada, gravando os passos numa Trajetoria.
+
+    Retorna: (estados, grid)
+    """
+    ambiente = Ambiente(inicializar_ambiente(tamanho, semente))
+    estados = rodar(AgenteExplorador(ambiente), max_steps, parar, observadores)
+    return estados, ambiente.grid
@@ -0,0 +1,103 @@
+import os
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from PIL import Image, GifImagePlugin
+from renderizador import Renderizador, legenda
+
+# Cores por quadro do GIF; a paleta é calculada no primeiro quadro e reusada
+CORES_GIF = 64
+
+
+def indices_quadros(total, passo=1, inicio=0, fim=None):
+    """
+    Índices dos quadros exportados: um a cada `passo`, sempre incluindo o
+    último, para o estado final do episódio aparecer na saída.
+    """
+    fim = total if fim is None else min(fim, total)
+    if inicio >= fim:
+        return
+    for i in range(inicio, fim, passo):
+        yield i
+    if (fim - 1 - inicio) % passo:
+        yield fim - 1
+
+
+def gerar_imagens(estados, passo=1, inicio=0, fim=None, dpi=80, tamanho_marcador=18):
+    """
+    Renderiza os quadros pelo backend Agg, sem display, um de cada vez.
+
+    Uma única figura é reaproveitada e o Renderizador só aplica as células
+    que mudaram entre um quadro e o próximo, então a memória não cresce com
+    o tamanho do episódio.
+
+    Retorna: gerador de (indice, PIL.Image RGB)
+    """
+    fig = Figure(figsize=(5, 5), dpi=dpi)
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    renderizador = Renderizador(ax, estados, tamanho_marcador, animado=False)
+    legenda(ax)
+
+    for i in indices_quadros(len(estados), passo, inicio, fim):
+        renderizador.desenhar(i)
+        canvas.draw()
+        yield i, Image.fromarray(np.asarray(canvas.buffer_rgba())[..., :3])
+
+
+def exportar_png(estados, pasta, prefixo='quadro', **opcoes):
+    """
+    Grava cada quadro como <pasta>/<prefixo>_NNNNN.png.
+
+    Retorna: número de quadros gravados
+    """
+    os.makedirs(pasta, exist_ok=True)
+    digitos = max(5, len(str(len(estados))))
+    gravados = 0
+    for i, imagem in gerar_imagens(estados, **opcoes):
+        imagem.save(os.path.join(pasta, f"{prefixo}_{i:0{digitos}d}.png"))
+        gravados += 1
+    return gravados
+
+
+def exportar_gif(estados, caminho, intervalo_ms=200, repetir=True, **opcoes):
+    """
+    Grava um GIF animado escrevendo quadro a quadro no arquivo, em vez de
+    juntar todas as imagens na memória antes de salvar.
+
+    Parâmetros:
+    - intervalo_ms: duração de cada quadro
+    - repetir: se True o GIF roda em loop
+    - opcoes: passo, inicio, fim, dpi, tamanho_marcador (ver gerar_imagens)
+
+    Retorna: número de quadros gravados
+    """
+    paleta = None
+    gravados = 0
+    with open(caminho, 'wb') as f:
+        for _, imagem in gerar_imagens(estados, **opcoes):
+            if paleta is None:
+                paleta = imagem.quantize(CORES_GIF, dither=Image.Dither.NONE)
+                quadro = paleta
+                cabecalho, _ = GifImagePlugin.getheader(quadro, info={'loop': 0} if repetir else {})
+                for bloco in cabecalho:
+                    f.write(bloco)
+            else:
+                quadro = imagem.quantize(palette=paleta, dither=Image.Dither.NONE)
+            for bloco in GifImagePlugin.getdata(quadro, duration=intervalo_ms):
+                f.write(bloco)
+            gravados += 1
+        f.write(b';')
+    return gravados
+
+
+def exportar(estados, saida, **opcoes):
+    """
+    Exporta um episódio: caminhos terminados em .gif viram um GIF animado,
+    qualquer outro é tratado como pasta de quadros PNG.
+
+    Retorna: número de quadros gravados
+    """
+    if saida.lower().endswith('.gif'):
+        return exportar_gif(estados, saida, **opcoes)
+    return exportar_png(estados, saida, **opcoes)
@@ -0,0 +1,67 @@
+from collections import namedtuple
+
+# Registro de um passo do episódio, já depois da ação:
+# - celula: (cx, cy, novo_valor) se alguma célula mudou, senão None
+# - sujeiras: sujeiras que ainda restam no grid
+# - agente: quem agiu, nas simulações com mais de um agente (frota.py)
+Passo = namedtuple('Passo', 'passo x y acao bateria pontuacao celula sujeiras agente', defaults=(0,))
+
+
+def bateria_esgotada(p):
+    return p.bateria <= 0
+
+
+def tudo_limpo(p):
+    return p.sujeiras == 0
+
+
+def pontuacao_atingida(alvo):
+    """
+    Critério de parada: pontuação acumulada chegou a `alvo`.
+    """
+    def atingiu(p):
+        return p.pontuacao >= alvo
+    return atingiu
+
+
+def gravar(trajetoria):
+    """
+    Observador que grava cada passo em uma Trajetoria.
+    """
+    def registrar(p):
+        trajetoria.registrar(p.x, p.y, p.acao, p.bateria, p.pontuacao, p.celula)
+    return registrar
+
+
+def consumir(passos, parar=(), observadores=()):
+    """
+    Repassa os passos de um gerador de simulação, chamando os observadores
+    em cada um e encerrando no primeiro passo que satisfaz algum critério
+    de parada (esse passo ainda é entregue). Como os geradores são
+    preguiçosos, os passos que sobrariam nunca chegam a ser simulados.
+
+    Parâmetros:
+    - passos: gerador de Passo (motor.passos, passos_BDI, passos_frota)
+    - parar: funções Passo -> bool
+    - observadores: funções Passo -> None
+
+    Retorna: gerador de Passo
+    """
+    for p in passos:
+        for observador in observadores:
+            observador(p)
+        yield p
+        if any(criterio(p) for criterio in parar):
+            break
+
+
+def executar(passos, parar=(), observadores=()):
+    """
+    Roda o episódio inteiro sem guardar os passos.
+
+    Retorna: o último Passo, ou None se não houve nenhum
+    """
+    ultimo = None
+    for ultimo in consumir(passos, parar, observadores):
+        pass
+    return ultimo
@@ -0,0 +1,240 @@
+from array import array
+import numpy as np
+from Agente_BDI import Agente_BDI, DELTA_POR_DIRECAO
+from alocacao import ALOCADORES, matriz_valores
+from ambiente import Ambiente
+from celulas import EH_SUJEIRA, PONTOS, LIMPO
+from desenharMapa import inicializar_ambiente
+from distancias import CacheDistancias, campo_distancias, INALCANCAVEL
+from fluxo import Passo, executar, gravar
+from indiceSujeira import IndiceSujeira
+from rotas import CUSTO_ASPIRAR
+from trajetoria import Trajetoria
+
+# Mesma ordem de desempate dos outros agentes
+DIRECOES = ('S', 'N', 'L', 'O')
+# Passos parado atrás de outro agente antes de sair da frente para qualquer lado
+ESPERA_MAXIMA = 2
+
+
+def posicoes_iniciais(grid, k):
+    """
+    Posição de partida de cada agente: o primeiro começa em (0, 0), como nas
+    outras simulações, e os demais em células limpas espalhadas pela sala.
+    """
+    livres = [(int(x), int(y)) for x, y in np.argwhere(grid == LIMPO) if (x, y) != (0, 0)]
+    if k - 1 > len(livres):
+        raise ValueError(f"a sala não tem células livres para {k} agentes")
+    escolhidas = np.linspace(0, len(livres) - 1, k - 1).round().astype(int) if k > 1 else []
+    # linspace pode repetir índices quando há poucas células; completa com as seguintes
+    usadas = []
+    for i in escolhidas:
+        while i in usadas:
+            i = (i + 1) % len(livres)
+        usadas.append(i)
+    return [(0, 0)] + [livres[i] for i in usadas]
+
+
+class Frota:
+    """
+    K agentes BDI na mesma sala. Ambiente, índice de sujeiras e cache de
+    campos de distância são um só para a frota inteira.
+
+    Cada agente persegue uma única sujeira (seu desire), escolhida por um
+    passo de alocação de tarefas que só roda quando o conjunto de sujeiras
+    muda. Como o grid não tem pesos, a distância agente -> sujeira é lida no
+    campo BFS da sujeira, que fica em cache; o caminho também sai desse
+    campo (descida de gradiente), então um passo comum custa O(K).
+
+    Os Agente_BDI da frota não deliberam: update_desires, calcula_melhor_rota
+    e update_intentions nunca são chamados. Cada um guarda posição, bateria e
+    o alvo dado pelo alocador (em desires/intentions), e quem decide o
+    movimento é Frota.decidir.
+    """
+
+    def __init__(self, tamanho=10, k=3, alocacao='hungaro', semente=None, bateria=30, grid=None):
+        if grid is None:
+            grid = inicializar_ambiente(tamanho, semente)
+        self.ambiente = Ambiente(grid)
+        self.grid = self.ambiente.grid
+        self.indice = IndiceSujeira(self.grid)
+        # Um campo por sujeira mais folga, para a alocação não expulsar campos ainda úteis
+        self.distancias = CacheDistancias(self.grid, max_campos=max(64, 2 * len(self.indice) + k))
+        self.alocar = ALOCADORES[alocacao]
+
+        self.agentes = []
+        for _ in range(k):
+            agente = Agente_BDI(len(self.grid), ambiente=self.ambiente,
+                                indice=self.indice, distancias=self.distancias)
+            agente.bateria = bateria
+            self.agentes.append(agente)
+
+        self.posicoes = posicoes_iniciais(self.grid, k)
+        self.ocupado = np.zeros(self.grid.shape, dtype=bool)
+        for pos in self.posicoes:
+            self.ocupado[pos] = True
+        self.alvos = [None] * k
+        self.esperas = [0] * k
+        self.mudancas_pendentes = []
+        self.versao_alocada = -1
+
+    def alterar_celula(self, x, y, valor):
+        self.ambiente.alterar(x, y, valor)
+        self.mudancas_pendentes.append((x, y, valor))
+
+    def perceive(self):
+        """
+        Repassa as células alteradas ao índice e ao cache compartilhados, uma
+        vez por passo da frota e não uma vez por agente.
+        """
+        for x, y, valor in self.mudancas_pendentes:
+            self.indice.celula_alterada(x, y, valor)
+            self.distancias.celula_alterada(x, y, valor)
+        self.mudancas_pendentes.clear()
+
+    def realocar(self):
+        """
+        Distribui as sujeiras entre os agentes com bateria. Monta a matriz
+        agentes x sujeiras lendo, no campo de cada sujeira, as posições de
+        todos os agentes de uma vez.
+        """
+        coords = list(self.indice.sujeiras)
+        ativos = [k for k, agente in enumerate(self.agentes) if agente.bateria > 0]
+        self.alvos = [None] * len(self.agentes)
+        for agente in self.agentes:
+            agente.desires = []
+        self.versao_alocada = self.indice.versao
+        if not coords or not ativos:
+            return
+
+        linhas, colunas = zip(*(self.posicoes[k] for k in ativos))
+        D = np.empty((len(ativos), len(coords)))
+        for j, coord in enumerate(coords):
+            d = self.distancias.campo(coord)[linhas, colunas]
+            D[:, j] = np.where(d == INALCANCAVEL, np.inf, d)
+
+        pontos = [self.indice.sujeiras[c]["pontos"] for c in coords]
+        valores = matriz_valores(D, pontos, [self.agentes[k].bateria for k in ativos])
+        for k, j in zip(ativos, self.alocar(valores)):
+            if j >= 0:
+                self.alvos[k] = coords[j]
+                self.agentes[k].desires = [self.indice.sujeiras[coords[j]]]
+
+    def _descer(self, campo, x, y):
+        """
+        Primeira direção livre que desce um passo no campo de distâncias.
+        """
+        for direcao in DIRECOES:
+            dx, dy = DELTA_POR_DIRECAO[direcao]
+            nx, ny = x + dx, y + dy
+            if (self.ambiente.pode_ir(x, y, direcao) and not self.ocupado[nx, ny]
+                    and campo[nx, ny] == campo[x, y] - 1):
+                return direcao
+        return None
+
+    def decidir(self, k):
+        """
+        Próxima ação do agente k, ou None se ele fica parado neste passo.
+
+        Segue o campo da sua sujeira; se outro agente está no caminho, busca
+        um desvio tratando os agentes como obstáculos e, depois de
+        ESPERA_MAXIMA passos sem desvio, sai da frente para qualquer lado.
+        """
+        alvo = self.alvos[k]
+        if alvo is None:
+            return None
+        x, y = self.posicoes[k]
+        if (x, y) == alvo:
+            return "aspirar" if EH_SUJEIRA[self.grid[x, y]] else None
+
+        direcao = self._descer(self.distancias.campo(alvo), x, y)
+        if direcao is None:
+            livre = self.distancias.passavel & ~self.ocupado
+            livre[x, y] = True
+            desvio = campo_distancias(livre, alvo)
+            if desvio[x, y] != INALCANCAVEL:
+                direcao = self._descer(desvio, x, y)
+
+        if direcao is None:
+            self.esperas[k] += 1
+            if self.esperas[k] <= ESPERA_MAXIMA:
+                return None
+            for d in DIRECOES:
+                dx, dy = DELTA_POR_DIRECAO[d]
+                if self.ambiente.pode_ir(x, y, d) and not self.ocupado[x + dx, y + dy]:
+                    direcao = d
+                    break
+
+        if direcao is not None:
+            self.esperas[k] = 0
+        return direcao
+
+
+def passos_frota(frota, max_steps=100):
+    """
+    Roda a frota passo a passo; em cada passo os agentes agem em ordem e
+    cada um já enxerga a posição nova dos anteriores.
+
+    Retorna: gerador de fluxo.Passo, um por ação, com Passo.agente indicando
+    quem agiu e Passo.pontuacao sendo a pontuação total da frota
+    """
+    total_pontuacao = 0
+    sujeiras = len(frota.indice)
+
+    for passo in range(max_steps):
+        frota.perceive()
+        if frota.indice.versao != frota.versao_alocada:
+            frota.realocar()
+
+        agiu = False
+        for k, agente in enumerate(frota.agentes):
+            if agente.bateria <= 0:
+                continue
+            acao = frota.decidir(k)
+            agente.intentions = [acao] if acao else []
+            if acao is None:
+                continue
+
+            x, y = frota.posicoes[k]
+            celula = None
+            if acao == "aspirar":
+                conteudo = frota.grid[x, y]
+                total_pontuacao += int(PONTOS[conteudo])
+                sujeiras -= 1
+                frota.alterar_celula(x, y, LIMPO)
+                celula = (x, y, LIMPO)
+                agente.bateria -= CUSTO_ASPIRAR
+            else:
+                dx, dy = DELTA_POR_DIRECAO[acao]
+                frota.ocupado[x, y] = False
+                x, y = x + dx, y + dy
+                frota.ocupado[x, y] = True
+                frota.posicoes[k] = (x, y)
+                agente.bateria -= 1
+
+            agiu = True
+            yield Passo(passo, x, y, acao, agente.bateria, total_pontuacao, celula, sujeiras, k)
+
+        if not agiu:
+            break
+
+
+def rodar_frota(tamanho=10, k=3, max_steps=100, alocacao='hungaro', semente=None, bateria=30,
+                parar=(), observadores=()):
+    """
+    Roda um episódio da frota sem desenhar nada.
+
+    Parâmetros:
+    - k: número de agentes
+    - alocacao: 'hungaro' ou 'leilao' (ver alocacao.py)
+    - parar, observadores: critérios de parada e callbacks por passo (ver fluxo.consumir)
+
+    Retorna: (estados, autores, frota). estados é a Trajetoria com as ações
+    de todos os agentes intercaladas; autores[i] é o agente do evento i.
+    """
+    frota = Frota(tamanho, k, alocacao, semente=semente, bateria=bateria)
+    estados = Trajetoria(frota.grid)
+    autores = array('b')
+    executar(passos_frota(frota, max_steps), parar,
+             (gravar(estados), lambda p: autores.append(p.agente)) + tuple(observadores))
+    return estados, autores, frota
@@ -0,0 +1,149 @@
+import numpy as np
+from celulas import Celula, CODIGOS, LIMPO, MOVEL, grid_vazio, TIPO_GRID
+from distancias import campo_distancias, INALCANCAVEL
+
+# Formatos de móvel (altura, largura): dois blocos na horizontal ou na vertical
+FORMATOS_PADRAO = ((1, 2), (2, 1))
+# Mesma sala de inicializar_ambiente: duas sujeiras de cada tipo
+CONTAGENS_PADRAO = {Celula.POEIRA: 2, Celula.LIQUIDO: 2, Celula.DETRITOS: 2}
+
+
+def _codigo(tipo):
+    return CODIGOS[tipo] if isinstance(tipo, str) else int(tipo)
+
+
+def _posicionar_moveis(grid, quantidade, formatos, rng, inicio):
+    """
+    Coloca até `quantidade` móveis sem sobreposição.
+
+    Todas as posições possíveis (formato, canto) são embaralhadas com uma
+    única permutação e testadas em ordem; cada candidata é vista no máximo
+    uma vez, então o laço sempre termina. A célula inicial fica livre.
+
+    Retorna: lista de peças (x, y, altura, largura)
+    """
+    tamanho = len(grid)
+    ocupado = np.zeros(grid.shape, dtype=bool)
+    ocupado[inicio] = True
+    pecas = []
+    if quantidade <= 0:
+        return pecas
+
+    larguras = []
+    inicios = [0]
+    for altura, largura in formatos:
+        linhas = max(tamanho - altura + 1, 0)
+        colunas = max(tamanho - largura + 1, 0)
+        larguras.append(colunas)
+        inicios.append(inicios[-1] + linhas * colunas)
+
+    for candidato in rng.permutation(inicios[-1]):
+        candidato = int(candidato)
+        f = 0
+        while candidato >= inicios[f + 1]:
+            f += 1
+        altura, largura = formatos[f]
+        x, y = divmod(candidato - inicios[f], larguras[f])
+        if ocupado[x:x + altura, y:y + largura].any():
+            continue
+        ocupado[x:x + altura, y:y + largura] = True
+        grid[x:x + altura, y:y + largura] = MOVEL
+        pecas.append((x, y, altura, largura))
+        if len(pecas) == quantidade:
+            break
+
+    return pecas
+
+
+def _garantir_conexao(grid, pecas, inicio):
+    """
+    Remove móveis até toda célula livre ser alcançável a partir do início.
+    Cada rodada faz uma BFS e retira as peças que encostam em alguma região
+    isolada; como o número de peças é finito, o laço termina.
+    """
+    dono = np.full(grid.shape, -1, dtype=np.int64)
+    for i, (x, y, altura, largura) in enumerate(pecas):
+        dono[x:x + altura, y:y + largura] = i
+
+    while True:
+        livre = grid != MOVEL
+        isolado = (campo_distancias(livre, inicio) == INALCANCAVEL) & livre
+        if not isolado.any():
+            return
+
+        borda = np.zeros(grid.shape, dtype=bool)
+        borda[1:, :] |= isolado[:-1, :]
+        borda[:-1, :] |= isolado[1:, :]
+        borda[:, 1:] |= isolado[:, :-1]
+        borda[:, :-1] |= isolado[:, 1:]
+        for i in np.unique(dono[borda & (dono >= 0)]):
+            x, y, altura, largura = pecas[i]
+            grid[x:x + altura, y:y + largura] = LIMPO
+            dono[x:x + altura, y:y + largura] = -1
+
+
+def gerar_ambiente(tamanho=5, contagens=None, densidades=None, moveis=2, densidade_moveis=None,
+                   formatos=FORMATOS_PADRAO, semente=None, conectado=False, inicio=(0, 0)):
+    """
+    Gera uma sala em O(células), reproduzível pela semente.
+
+    Parâmetros:
+    - tamanho: lado do grid
+    - contagens: {tipo: quantidade} de sujeiras (tipo como Celula ou nome, ex. "poeira")
+    - densidades: {tipo: fração das células}; somada às contagens
+    - moveis: número de móveis, ou densidade_moveis (fração das células cobertas)
+    - formatos: formatos (altura, largura) sorteados para os móveis
+    - semente: int, np.random.Generator ou None
+    - conectado: se True, garante que toda célula livre é alcançável do início
+    - inicio: célula de partida do agente, nunca coberta por móvel
+
+    Se não houver espaço para tudo, coloca o máximo possível em vez de
+    ficar tentando para sempre.
+
+    Retorna: grid de códigos de célula (uint8)
+    """
+    rng = np.random.default_rng(semente)
+    grid = grid_vazio(tamanho)
+    celulas = tamanho * tamanho
+
+    if densidade_moveis is not None:
+        area_media = np.mean([altura * largura for altura, largura in formatos])
+        moveis = int(round(densidade_moveis * celulas / area_media))
+    pecas = _posicionar_moveis(grid, moveis, formatos, rng, inicio)
+    if conectado:
+        _garantir_conexao(grid, pecas, inicio)
+
+    quantidades = {}
+    if contagens is None and densidades is None:
+        contagens = CONTAGENS_PADRAO
+    for tipo, n in (contagens or {}).items():
+        quantidades[_codigo(tipo)] = quantidades.get(_codigo(tipo), 0) + int(n)
+    for tipo, fracao in (densidades or {}).items():
+        quantidades[_codigo(tipo)] = quantidades.get(_codigo(tipo), 0) + int(round(fracao * celulas))
+
+    livres = np.flatnonzero(grid.ravel() == LIMPO)
+    total = min(sum(quantidades.values()), livres.size)
+    escolhidas = rng.choice(livres, size=total, replace=False)
+    plano = grid.ravel()
+    usado = 0
+    for codigo, n in quantidades.items():
+        n = min(n, total - usado)
+        plano[escolhidas[usado:usado + n]] = codigo
+        usado += n
+
+    return grid
+
+
+def gerar_cenarios(quantidade, tamanho=5, semente=None, **opcoes):
+    """
+    Gera `quantidade` salas independentes e reproduzíveis. Cada sala recebe
+    sua própria semente derivada (SeedSequence.spawn), então a sala i é a
+    mesma qualquer que seja a quantidade pedida.
+
+    Retorna: array (quantidade, tamanho, tamanho) de códigos de célula
+    """
+    sementes = np.random.SeedSequence(semente).spawn(quantidade)
+    grids = np.empty((quantidade, tamanho, tamanho), dtype=TIPO_GRID)
+    for i, s in enumerate(sementes):
+        grids[i] = gerar_ambiente(tamanho, semente=np.random.default_rng(s), **opcoes)
+    return grids
@@ -0,0 +1,61 @@
+import numpy as np
+from celulas import EH_SUJEIRA, PONTOS
+
+
+class IndiceSujeira:
+    """
+    Índice persistente das sujeiras do grid.
+
+    É montado uma única vez a partir do grid e depois só é atualizado célula
+    a célula com celula_alterada(), em O(1). Guarda um dict coordenada ->
+    belief ({"coord": (x, y), "pontos": n}) e a contagem de sujeiras por tipo.
+    """
+
+    def __init__(self, grid):
+        self.sujeiras = {}
+        self.tipos = {}
+        self.contagem = [0] * len(PONTOS)
+        self.versao = 0 #incrementada a cada mudança no conjunto de sujeiras
+
+        for x, y in np.argwhere(EH_SUJEIRA[grid]):
+            x, y = int(x), int(y)
+            self._adicionar((x, y), int(grid[x, y]))
+
+    def _adicionar(self, coord, tipo):
+        self.sujeiras[coord] = {"coord": coord, "pontos": int(PONTOS[tipo])}
+        self.tipos[coord] = tipo
+        self.contagem[tipo] += 1
+
+    def _remover(self, coord):
+        del self.sujeiras[coord]
+        self.contagem[self.tipos.pop(coord)] -= 1
+
+    def celula_alterada(self, x, y, valor):
+        """
+        Atualiza o índice depois que a célula (x, y) passou a valer `valor`.
+        """
+        coord = (x, y)
+        antigo = self.tipos.get(coord)
+        novo = int(valor) if EH_SUJEIRA[valor] else None
+        if antigo == novo:
+            return
+        if antigo is not None:
+            self._remover(coord)
+        if novo is not None:
+            self._adicionar(coord, novo)
+        self.versao += 1
+
+    def beliefs(self):
+        """
+        Visão viva (dict_values) dos beliefs: reflete as mudanças sem cópia.
+        """
+        return self.sujeiras.values()
+
+    def pontos_restantes(self):
+        return sum(int(PONTOS[tipo]) * n for tipo, n in enumerate(self.contagem))
+
+    def __len__(self):
+        return len(self.sujeiras)
+
+    def __contains__(self, coord):
+        return coord in self.sujeiras
@@ -1,7 +1,9 @@
-#from reativoSimples import simulacao
-from modelo import simulacao
-from Agente_BDI import simular_BDI
+import random
+import sys
+from cli import main
 
 if __name__ == "__main__":
-    simular_BDI()
-    #simulacao()
\ No newline at end of file
+    # Sem argumentos mantém o comportamento de antes: anima um episódio do agente BDI
+    # numa sala nova a cada execução, sem escrever resultados
+    padrao = ["--agente", "bdi", "--episodios", "0", "--render", "--semente", str(random.randrange(2 ** 32))]
+    raise SystemExit(main(sys.argv[1:] or padrao))
@@ -0,0 +1,178 @@
+from ambiente import Ambiente
+from celulas import EH_SUJEIRA, PONTOS, LIMPO
+from desenharMapa import inicializar_ambiente
+from fluxo import Passo, executar, gravar
+from politicas import obter_politica, CUSTO_ACAO, DX_ACAO, DY_ACAO
+from trajetoria import Trajetoria, CODIGO_ACAO
+
+# Agentes que criar_agente sabe montar
+AGENTES = ('simples', 'modelo', 'explorador', 'bdi')
+MOVIMENTOS = ('N', 'S', 'L', 'O')
+
+# Protocolo de agente usado por passos():
+# - ambiente: Ambiente em que o agente atua (o motor lê e altera a sala por ele)
+# - bateria: carga atual; o motor desconta o custo de cada ação (politicas.CUSTO_ACAO)
+# - tem_bateria(): False encerra o episódio antes de observar
+# - observar(x, y): percepção do passo, antes de decidir
+# - agir(x, y): 'aspirar', 'N', 'S', 'L', 'O', 'parar' (encerra) ou None (nada a fazer)
+# - alterar_celula(x, y, valor): toda mudança da sala passa por aqui, para o
+#   agente poder atualizar o que sabe dela
+
+
+def sensores(ambiente, x, y):
+    # Leitura direta da máscara de passagem pré-calculada pelo Ambiente
+    return ambiente.sensores(x, y)
+
+
+def sensoresPr(ambiente, x, y):
+    # Vizinhos passáveis com sujeira, na ordem S, N, L, O
+    return ambiente.prioridades(x, y)
+
+
+class AgenteReativo:
+    """
+    aspiradorSimples ou aspiradorModelo no protocolo do motor, decidindo pela
+    tabela compilada de politicas.py. O modelo guarda as células visitadas.
+    """
+
+    def __init__(self, ambiente, nome="simples", bateria=30):
+        self.ambiente = ambiente
+        self.politica = obter_politica(nome)
+        self.bateria = bateria
+        self.visitados = set() if self.politica.usa_visitados else None
+
+    def tem_bateria(self):
+        return self.politica.tem_bateria(self.bateria)
+
+    def observar(self, x, y):
+        if self.visitados is not None:
+            self.visitados.add((x, y))
+
+    def agir(self, x, y):
+        acao, _, _ = self.politica.decidir(self.ambiente, x, y, self.bateria, self.visitados)
+        return acao
+
+    def alterar_celula(self, x, y, valor):
+        self.ambiente.alterar(x, y, valor)
+
+
+def criar_agente(nome, ambiente, bateria=30, **opcoes):
+    """
+    Monta um agente do protocolo sobre `ambiente`.
+
+    Parâmetros:
+    - nome: 'simples', 'modelo', 'explorador' (aspiradorModelo com mapa de cobertura) ou 'bdi'
+    - opcoes: repassadas ao Agente_BDI (otimizador, planejador, ...)
+    """
+    if nome in ('simples', 'modelo'):
+        return AgenteReativo(ambiente, nome, bateria)
+    if nome == 'explorador':
+        from exploracao import AgenteExplorador
+        return AgenteExplorador(ambiente, bateria)
+    if nome == 'bdi':
+        from Agente_BDI import Agente_BDI
+        agente = Agente_BDI(ambiente.tamanho, ambiente=ambiente, **opcoes)
+        agente.bateria = bateria
+        return agente
+    raise ValueError(f"agente desconhecido: {nome}")
+
+
+def passos(agente, max_steps=100, eventos=None, inicio=(0, 0)):
+    """
+    Laço único de simulação: a cada passo aplica os eventos da sala, deixa o
+    agente observar, pede uma ação e executa (pontuação, sujeira restante,
+    movimento e bateria são contados aqui, iguais para todos os agentes).
+
+    Parâmetros:
+    - agente: objeto do protocolo descrito no topo do módulo
+    - eventos: função (passo, grid, ocupadas) -> [(x, y, valor)] com as
+      mudanças da sala a cada passo (ver eventos.py); cada mudança também
+      sai no fluxo, com acao 'evento'. Com eventos, um agente sem ação
+      espera em vez de encerrar, porque ainda pode aparecer sujeira.
+    - inicio: posição inicial
+
+    Retorna: gerador de fluxo.Passo, um por ação executada
+    """
+    ambiente = agente.ambiente
+    x, y = inicio
+    total_pontuacao = 0
+    sujeiras = int(EH_SUJEIRA[ambiente.grid].sum())
+
+    for passo in range(max_steps):
+        if not agente.tem_bateria():
+            break
+
+        if eventos is not None:
+            for cx, cy, valor in eventos(passo, ambiente.grid, {(x, y)}):
+                sujeiras += int(EH_SUJEIRA[valor]) - int(EH_SUJEIRA[ambiente.grid[cx, cy]])
+                agente.alterar_celula(cx, cy, valor)
+                yield Passo(passo, x, y, "evento", agente.bateria, total_pontuacao, (cx, cy, valor), sujeiras)
+
+        agente.observar(x, y)
+        acao = agente.agir(x, y)
+        if acao is None:
+            if eventos is None:
+                break
+            continue
+
+        celula = None
+        if acao == "aspirar":
+            conteudo = ambiente.grid[x, y]
+            if EH_SUJEIRA[conteudo]:
+                total_pontuacao += int(PONTOS[conteudo])
+                sujeiras -= 1
+            agente.alterar_celula(x, y, LIMPO)
+            celula = (x, y, LIMPO)
+        elif acao in MOVIMENTOS:
+            # A máscara de passagem já cobre limites do grid e móveis
+            if ambiente.pode_ir(x, y, acao):
+                codigo = CODIGO_ACAO[acao]
+                x += int(DX_ACAO[codigo])
+                y += int(DY_ACAO[codigo])
+        else:
+            break
+        agente.bateria -= int(CUSTO_ACAO[CODIGO_ACAO[acao]])
+
+        yield Passo(passo, x, y, acao, agente.bateria, total_pontuacao, celula, sujeiras)
+
+
+def rodar(agente, max_steps=100, parar=(), observadores=(), eventos=None):
+    """
+    Roda um episódio sem desenhar nada, gravando os passos numa Trajetoria.
+
+    Parâmetros:
+    - parar, observadores: critérios de parada e callbacks por passo (ver fluxo.consumir)
+
+    Retorna: a Trajetoria do episódio
+    """
+    estados = Trajetoria(agente.ambiente.grid)
+    executar(passos(agente, max_steps, eventos), parar, (gravar(estados),) + tuple(observadores))
+    return estados
+
+
+def rodar_episodio(nome, tamanho=5, max_steps=60, semente=None, bateria=30, parar=(), observadores=(),
+                   eventos=None, **opcoes):
+    """
+    Gera a sala e roda um episódio de qualquer agente de AGENTES.
+
+    Retorna: (estados, agente)
+    """
+    agente = criar_agente(nome, Ambiente(inicializar_ambiente(tamanho, semente)), bateria, **opcoes)
+    return rodar(agente, max_steps, parar, observadores, eventos), agente
+
+
+def mostrar(estados, saida=None, passo=1, intervalo_ms=500, tamanho_marcador=18):
+    """
+    Anima o episódio na tela ou, com `saida`, grava PNGs/GIF sem display.
+    matplotlib só é importado aqui.
+    """
+    if not estados:
+        return None
+
+    if saida:
+        # Sem display: grava PNGs ou um GIF pelo backend Agg
+        from exportacao import exportar
+        return exportar(estados, saida, passo=passo, tamanho_marcador=tamanho_marcador)
+
+    from renderizador import animar
+    return animar(estados, intervalo_ms=intervalo_ms, tamanho_marcador=tamanho_marcador)
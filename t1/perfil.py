@@ -0,0 +1,130 @@
+import json
+import time
+from functools import wraps
+
+# Fases do ciclo BDI medidas. Os tempos são inclusivos: update_desires
+# contém calcula_melhor_rota e update_intentions contém calcular_caminho
+# (A*, JPS, HPA*) ou planejar_dstar (D* Lite).
+FASES = ('perceive', 'update_desires', 'calcula_melhor_rota', 'update_intentions', 'calcular_caminho',
+         'planejar_dstar')
+# Fases que fazem uma busca de caminho e deixam o resultado em agente.ultima_busca
+FASES_BUSCA = ('calcular_caminho', 'planejar_dstar')
+
+
+class Perfil:
+    """
+    Instrumentação por fase do ciclo de decisão do Agente_BDI.
+
+    instrumentar() troca os métodos de FASES só naquela instância por
+    versões cronometradas; um agente sem perfil roda o código original, sem
+    nenhum teste extra no caminho quente. Cada busca de caminho também
+    registra nós expandidos, inserções no heap e comprimento do caminho
+    (lidos de agente.ultima_busca).
+
+    Os números são agrupados por passo da simulação: registrar() é um
+    observador de fluxo (ver fluxo.consumir) que fecha o passo corrente.
+    """
+
+    def __init__(self):
+        self.totais = {fase: {'chamadas': 0, 'tempo_s': 0.0, 'maximo_s': 0.0} for fase in FASES}
+        self.buscas = {'chamadas': 0, 'expandidos': 0, 'empurrados': 0, 'sem_caminho': 0}
+        self.passos = []
+        self._corrente = self._novo_passo()
+
+    def _novo_passo(self):
+        return {'fases': {}, 'buscas': []}
+
+    def _medir(self, fase, metodo, agente):
+        total = self.totais[fase]
+
+        @wraps(metodo)
+        def medido(*args, **kwargs):
+            inicio = time.perf_counter()
+            resultado = metodo(*args, **kwargs)
+            tempo = time.perf_counter() - inicio
+            total['chamadas'] += 1
+            total['tempo_s'] += tempo
+            total['maximo_s'] = max(total['maximo_s'], tempo)
+            fases = self._corrente['fases']
+            chamadas, acumulado = fases.get(fase, (0, 0.0))
+            fases[fase] = (chamadas + 1, acumulado + tempo)
+            if fase in FASES_BUSCA:
+                self._registrar_busca(agente.ultima_busca)
+            return resultado
+
+        return medido
+
+    def _registrar_busca(self, busca):
+        self.buscas['chamadas'] += 1
+        self.buscas['expandidos'] += busca['expandidos']
+        self.buscas['empurrados'] += busca['empurrados']
+        if busca['comprimento'] is None:
+            self.buscas['sem_caminho'] += 1
+        self._corrente['buscas'].append(dict(busca))
+
+    def instrumentar(self, agente):
+        """
+        Passa a medir as fases de `agente`.
+
+        Retorna: o próprio agente
+        """
+        for fase in FASES:
+            setattr(agente, fase, self._medir(fase, getattr(agente, fase), agente))
+        return agente
+
+    def registrar(self, p):
+        """
+        Observador de fluxo: atribui ao passo `p.passo` o que foi medido
+        desde o último registro. Eventos da sala no mesmo passo caem no
+        mesmo registro.
+        """
+        corrente = self._corrente
+        if not corrente['fases'] and not corrente['buscas']:
+            return
+        if self.passos and self.passos[-1]['passo'] == p.passo:
+            registro = self.passos[-1]
+            for fase, (chamadas, tempo) in corrente['fases'].items():
+                c, t = registro['fases'].get(fase, (0, 0.0))
+                registro['fases'][fase] = (c + chamadas, t + tempo)
+            registro['buscas'] += corrente['buscas']
+        else:
+            self.passos.append({'passo': p.passo, 'fases': corrente['fases'], 'buscas': corrente['buscas']})
+        self._corrente = self._novo_passo()
+
+    def resumo(self):
+        """
+        Resumo do episódio, pronto para json.dump. O trabalho feito depois do
+        último passo (por exemplo o ciclo que decidiu parar) entra como um
+        passo final com "passo": null.
+
+        Retorna: dict com 'fases' (totais por fase), 'buscas' (totais das
+        buscas de caminho) e 'passos' (fases e buscas de cada passo)
+        """
+        passos = list(self.passos)
+        if self._corrente['fases'] or self._corrente['buscas']:
+            passos.append(dict(self._corrente, passo=None))
+
+        fases = {}
+        for fase, total in self.totais.items():
+            fases[fase] = dict(total, medio_s=total['tempo_s'] / total['chamadas'] if total['chamadas'] else 0.0)
+
+        buscas = dict(self.buscas)
+        comprimentos = [b['comprimento'] for p in passos for b in p['buscas'] if b['comprimento'] is not None]
+        buscas['comprimento_medio'] = sum(comprimentos) / len(comprimentos) if comprimentos else 0.0
+
+        return {
+            'fases': fases,
+            'buscas': buscas,
+            'passos': [{'passo': p['passo'],
+                        'fases': {fase: {'chamadas': c, 'tempo_s': t} for fase, (c, t) in p['fases'].items()},
+                        'buscas': p['buscas']}
+                       for p in passos]
+        }
+
+    def salvar(self, caminho):
+        """
+        Grava o resumo do episódio em JSON.
+        """
+        with open(caminho, 'w', encoding='utf-8') as arquivo:
+            json.dump(self.resumo(), arquivo, indent=1)
+        return caminho
@@ -0,0 +1,175 @@
+from functools import lru_cache
+import numpy as np
+from agente import aspiradorSimples, aspiradorModelo
+from ambiente import DESLOCAMENTOS, TABELA_SENSORES, TABELA_PRIORIDADES
+from celulas import EH_SUJEIRA, PONTOS, LIMPO, POEIRA
+from trajetoria import ACOES, CODIGO_ACAO
+
+# Código de sensores empacotado em um inteiro:
+# bits 0-3 vizinhos passáveis, 4-7 vizinhos sujos (prioridades),
+# bit 8 célula atual suja, bit 9 ainda tem bateria,
+# bits 10-13 vizinhos ainda não visitados (só aspiradorModelo)
+DESLOC_SUJOS = 4
+DESLOC_SUJA = 8
+DESLOC_BATERIA = 9
+DESLOC_NOVOS = 10
+
+ASPIRAR = CODIGO_ACAO['aspirar']
+PARAR = CODIGO_ACAO['parar']
+# Custo de bateria e deslocamento de cada ação, indexados pelo código
+CUSTO_ACAO = np.array([2 if a == 'aspirar' else 1 if a in ('N', 'S', 'L', 'O') else 0 for a in ACOES])
+DX_ACAO = np.array([{'S': 1, 'N': -1}.get(a, 0) for a in ACOES])
+DY_ACAO = np.array([{'L': 1, 'O': -1}.get(a, 0) for a in ACOES])
+
+# Posição fictícia usada para montar os vizinhos visitados na compilação
+_CENTRO = (1, 1)
+
+
+def _entradas(codigo):
+    """
+    Desempacota um código de sensores nos argumentos dos agentes de agente.py.
+
+    Retorna: (norte, sul, leste, oeste, est, bateria, prioridade, visitados)
+    """
+    passagem = codigo & 0xF
+    sujos = (codigo >> DESLOC_SUJOS) & 0xF
+    novos = (codigo >> DESLOC_NOVOS) & 0xF
+    norte, sul, leste, oeste = TABELA_SENSORES[passagem]
+    est = POEIRA if codigo >> DESLOC_SUJA & 1 else LIMPO
+    bateria = codigo >> DESLOC_BATERIA & 1
+    # Em sala estática, vizinho sujo nunca foi visitado: o agente só sai de uma
+    # célula depois de limpá-la. Com eventos (motor.passos(..., eventos=...)) uma
+    # célula visitada pode voltar a ficar suja; a tabela a trata como não
+    # visitada e volta para limpá-la, de propósito, onde o aspiradorModelo
+    # original a veria como visitada. Só nesse caso as duas decisões diferem.
+    novos |= sujos
+    visitados = {(_CENTRO[0] + dx, _CENTRO[1] + dy) for dx, dy, bit in DESLOCAMENTOS if not novos & bit}
+    visitados.add(_CENTRO)
+    return norte, sul, leste, oeste, est, bateria, list(TABELA_PRIORIDADES[sujos]), visitados
+
+
+class Politica:
+    """
+    Agente reativo compilado em uma tabela código de sensores -> ação.
+
+    A decisão de aspiradorSimples/aspiradorModelo só depende dos bits
+    empacotados no código (ver DESLOC_*), então a tabela tem no máximo
+    2**14 entradas e decidir é um único acesso ao array, tanto para um
+    episódio quanto para um lote inteiro com índices vetorizados.
+    """
+
+    def __init__(self, nome, tabela, usa_visitados, bateria_negativa):
+        self.nome = nome
+        self.tabela = tabela
+        self.usa_visitados = usa_visitados
+        # aspiradorSimples só para com bateria == 0; aspiradorModelo com bateria <= 0
+        self.bateria_negativa = bateria_negativa
+
+    def tem_bateria(self, bateria):
+        """
+        Funciona com um int ou um array de cargas.
+        """
+        return bateria != 0 if self.bateria_negativa else bateria > 0
+
+    def codigo(self, passagem, sujos, suja, tem_bateria, novos=0):
+        """
+        Empacota os sensores. Aceita ints ou arrays do mesmo formato.
+        """
+        return (passagem | (sujos << DESLOC_SUJOS) | (suja << DESLOC_SUJA)
+                | (tem_bateria << DESLOC_BATERIA) | (novos << DESLOC_NOVOS))
+
+    def decidir(self, ambiente, x, y, bateria, visitados=None):
+        """
+        Mesmo contrato dos agentes de agente.py, lendo os sensores direto das
+        máscaras do Ambiente.
+
+        Retorna: (acao, bateria, pontuacao)
+        """
+        est = ambiente.grid[x, y]
+        novos = 0
+        if self.usa_visitados:
+            for dx, dy, bit in DESLOCAMENTOS:
+                if (x + dx, y + dy) not in visitados:
+                    novos |= bit
+        codigo = self.codigo(int(ambiente.passagem[x, y]), int(ambiente.sujos[x, y]),
+                             int(EH_SUJEIRA[est]), int(self.tem_bateria(bateria)), novos)
+        acao = self.tabela[codigo]
+        pontuacao = int(PONTOS[est]) if acao == ASPIRAR else 0
+        return ACOES[acao], bateria - int(CUSTO_ACAO[acao]), pontuacao
+
+
+def compilar(funcao, bits):
+    """
+    Monta a tabela chamando o agente original uma vez para cada código.
+
+    Retorna: array uint8 de 2**bits códigos de ação
+    """
+    tabela = np.empty(1 << bits, dtype=np.uint8)
+    for codigo in range(len(tabela)):
+        norte, sul, leste, oeste, est, bateria, prioridade, visitados = _entradas(codigo)
+        if funcao is aspiradorModelo:
+            acao, _, _ = funcao(norte, sul, leste, oeste, est, bateria, prioridade, pos=_CENTRO, visitados=visitados)
+        else:
+            acao, _, _ = funcao(norte, sul, leste, oeste, est, bateria, prioridade)
+        tabela[codigo] = CODIGO_ACAO[acao]
+    return tabela
+
+
+@lru_cache(maxsize=None)
+def obter_politica(nome):
+    """
+    Política compilada de "simples" (aspiradorSimples) ou "modelo"
+    (aspiradorModelo). A tabela é montada no primeiro uso e reaproveitada.
+    """
+    if nome == "simples":
+        return Politica(nome, compilar(aspiradorSimples, DESLOC_NOVOS), False, True)
+    if nome == "modelo":
+        return Politica(nome, compilar(aspiradorModelo, DESLOC_NOVOS + 4), True, False)
+    raise ValueError(f"agente desconhecido: {nome}")
+
+
+def conferir(nome, episodios=200, tamanhos=(4, 5, 8), max_steps=60, semente=0):
+    """
+    Confere a política compilada contra a função original: roda episódios
+    chamando o agente de agente.py e compara a decisão da tabela em cada
+    passo, inclusive bateria e pontuação devolvidas.
+
+    Retorna: número de passos conferidos; levanta AssertionError na primeira diferença
+    """
+    from ambiente import Ambiente
+    from gerador import gerar_cenarios
+
+    politica = obter_politica(nome)
+    conferidos = 0
+    for tamanho in tamanhos:
+        for grid in gerar_cenarios(episodios, tamanho, semente):
+            ambiente = Ambiente(grid)
+            x, y, bateria = 0, 0, 30
+            visitados = {(x, y)}
+            for _ in range(max_steps):
+                norte, sul, leste, oeste, est = ambiente.sensores(x, y)
+                prioridade = ambiente.prioridades(x, y)
+                if nome == "modelo":
+                    esperado = aspiradorModelo(norte, sul, leste, oeste, est, bateria, prioridade,
+                                               pos=(x, y), visitados=visitados)
+                else:
+                    esperado = aspiradorSimples(norte, sul, leste, oeste, est, bateria, prioridade)
+                obtido = politica.decidir(ambiente, x, y, bateria, visitados)
+                assert obtido == esperado, (nome, tamanho, (x, y), obtido, esperado)
+                conferidos += 1
+
+                acao, bateria, _ = esperado
+                if acao == "parar":
+                    break
+                if acao == "aspirar":
+                    ambiente.alterar(x, y, LIMPO)
+                else:
+                    x += int(DX_ACAO[CODIGO_ACAO[acao]])
+                    y += int(DY_ACAO[CODIGO_ACAO[acao]])
+                visitados.add((x, y))
+    return conferidos
+
+
+if __name__ == "__main__":
+    for nome in ("simples", "modelo"):
+        print(f"{nome}: {conferir(nome)} passos conferidos")
@@ -0,0 +1,140 @@
+import numpy as np
+from matplotlib.collections import LineCollection
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Rectangle
+from celulas import NOMES
+from trajetoria import Trajetoria
+
+# Cor de cada código de célula: limpo, poeira, líquido, detritos, móvel
+CORES = ('white', 'saddlebrown', 'royalblue', 'black', 'gray')
+MAPA_CORES = ListedColormap(CORES, name='celulas')
+# Acima disso as linhas do grid só poluem a imagem
+MAX_LINHAS_GRID = 50
+
+
+class Renderizador:
+    """
+    Desenha um episódio gravado em um Axes: a sala inteira é uma única
+    imagem (imshow) com um colormap categórico, mais o marcador do agente e
+    o texto de pontuação.
+
+    A cada quadro só as células que mudaram são copiadas para o array da
+    imagem. Com uma Trajetoria elas vêm direto do log de eventos; com uma
+    lista de dicts {'grid', 'x', 'y', ...} saem de uma comparação com o
+    quadro anterior. Com animado=True todos os artistas são `animated`, para
+    uso com blit; para desenhar direto no canvas (exportação) use False.
+    """
+
+    def __init__(self, ax, estados, tamanho_marcador=18, animado=True):
+        self.ax = ax
+        self.estados = estados
+        self.eh_trajetoria = isinstance(estados, Trajetoria)
+        grid0 = estados.grid_inicial if self.eh_trajetoria else estados[0]['grid']
+        self.tamanho = len(grid0)
+        self.dados = np.array(grid0, dtype=np.uint8)
+        self.quadro_atual = -1
+
+        n = self.tamanho
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_xlim(-0.5, n - 0.5)
+        ax.set_ylim(-0.5, n - 0.5)
+
+        # origin='lower' mantém a linha 0 embaixo, como nos renderizadores antigos
+        self.imagem = ax.imshow(self.dados, cmap=MAPA_CORES, vmin=-0.5, vmax=len(CORES) - 0.5,
+                                interpolation='nearest', origin='lower', animated=animado)
+        self.artistas = [self.imagem]
+
+        if n <= MAX_LINHAS_GRID:
+            bordas = np.arange(n + 1) - 0.5
+            segmentos = [[(b, -0.5), (b, n - 0.5)] for b in bordas] + [[(-0.5, b), (n - 0.5, b)] for b in bordas]
+            self.linhas = LineCollection(segmentos, colors='lightgray', linewidths=0.8, animated=animado)
+            ax.add_collection(self.linhas)
+            self.artistas.append(self.linhas)
+
+        self.marcador = ax.plot([], [], 'o', color='tab:orange', markersize=tamanho_marcador, animated=animado)[0]
+        self.texto = ax.text(0.01, 0.99, "", transform=ax.transAxes, fontsize=12, va='top', ha='left',
+                             bbox=dict(facecolor='white', alpha=0.8, edgecolor='none', pad=4), animated=animado)
+        self.artistas += [self.marcador, self.texto]
+
+    def __len__(self):
+        return len(self.estados)
+
+    def _atualizar_celulas(self, quadro):
+        """
+        Leva self.dados ao grid do quadro pedido.
+
+        Retorna: True se alguma célula mudou
+        """
+        if self.eh_trajetoria:
+            if quadro > self.quadro_atual:
+                mudou = False
+                for cx, cy, valor in self.estados.alteracoes(self.quadro_atual + 1, quadro + 1):
+                    self.dados[cx, cy] = valor
+                    mudou = True
+                return mudou
+            # Voltando no tempo: reconstrói a partir do snapshot mais próximo
+            self.dados[...] = self.estados.grid_em(quadro, copiar=False)
+            return True
+
+        diferentes = np.nonzero(self.estados[quadro]['grid'] != self.dados)
+        if not diferentes[0].size:
+            return False
+        self.dados[diferentes] = self.estados[quadro]['grid'][diferentes]
+        return True
+
+    def desenhar(self, quadro):
+        """
+        Atualiza os artistas para o quadro `quadro`.
+
+        Retorna: lista de artistas alterados, como FuncAnimation espera
+        """
+        if self._atualizar_celulas(quadro):
+            self.imagem.set_data(self.dados)
+        self.quadro_atual = quadro
+
+        if self.eh_trajetoria:
+            x, y = self.estados.x[quadro], self.estados.y[quadro]
+            pontuacao, bateria = self.estados.pontuacao[quadro], self.estados.bateria[quadro]
+        else:
+            estado = self.estados[quadro]
+            x, y = estado['x'], estado['y']
+            pontuacao, bateria = estado.get('pontuacao', 0), estado.get('bateria', 0)
+
+        self.marcador.set_data([y], [x])
+        self.texto.set_text(f"Pontuação: {pontuacao}  Bateria: {bateria}")
+        return self.artistas
+
+
+def legenda(ax):
+    """
+    Legenda com o nome de cada tipo de célula.
+    """
+    alcas = [Rectangle((0, 0), 1, 1, facecolor=cor, edgecolor='lightgray') for cor in CORES]
+    ax.legend(alcas, list(NOMES), loc='upper center', bbox_to_anchor=(0.5, -0.01),
+              ncol=len(CORES), fontsize=8, frameon=False)
+
+
+def animar(estados, intervalo_ms=500, tamanho_marcador=18):
+    """
+    Mostra a animação de um episódio com blit: só os artistas do
+    Renderizador são redesenhados a cada quadro.
+
+    Parâmetros:
+    - estados: Trajetoria ou lista de dicts de quadros
+    - intervalo_ms: tempo entre quadros
+    - tamanho_marcador: tamanho do marcador do agente
+
+    Retorna: o FuncAnimation (precisa continuar referenciado enquanto roda)
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.animation import FuncAnimation
+
+    fig, ax = plt.subplots(figsize=(5, 5))
+    renderizador = Renderizador(ax, estados, tamanho_marcador)
+    legenda(ax)
+    ani = FuncAnimation(fig, renderizador.desenhar, frames=len(renderizador),
+                        init_func=lambda: renderizador.desenhar(0),
+                        interval=intervalo_ms, blit=True, repeat=False)
+    plt.show()
+    return ani
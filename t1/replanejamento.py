@@ -0,0 +1,146 @@
+import heapq
+
+INF = float('inf')
+DIRECOES = (('S', 1, 0), ('N', -1, 0), ('L', 0, 1), ('O', 0, -1))
+
+
+class DStarLite:
+    """
+    Planejador incremental D* Lite (Koenig & Likhachev) em grid 4-vizinho
+    com custo 1 por passo.
+
+    A busca parte do objetivo, então a árvore de busca continua válida
+    enquanto o agente anda. Quando células mudam de passagem, só os nós
+    afetados são reabertos e corrigidos em planejar(), em vez de refazer a
+    busca do zero; o custo por evento depende de quanto do mapa mudou.
+
+    `passavel` é o array booleano compartilhado com o dono (ex. o
+    CacheDistancias do agente); quem o altera deve avisar com celula_alterada().
+    """
+
+    def __init__(self, passavel, inicio, objetivo):
+        self.passavel = passavel
+        self.linhas, self.colunas = passavel.shape
+        self.inicio = inicio
+        self.objetivo = objetivo
+        self.ultimo = inicio
+        self.km = 0
+        self.g = {}
+        self.rhs = {objetivo: 0}
+        self.fila = []
+        self.chaves = {} #chave atual de cada nó na fila; entradas antigas no heap são ignoradas
+        self.pendentes = []
+        self.expandidos = 0
+        self.empurrados = 0 #inserções no heap, como nas buscas de caminhos.py
+        self._enfileirar(objetivo)
+        self._calcular()
+
+    def _h(self, a):
+        return abs(a[0] - self.inicio[0]) + abs(a[1] - self.inicio[1])
+
+    def _chave(self, s):
+        m = min(self.g.get(s, INF), self.rhs.get(s, INF))
+        return (m + self._h(s) + self.km, m)
+
+    def _enfileirar(self, s):
+        chave = self._chave(s)
+        self.chaves[s] = chave
+        heapq.heappush(self.fila, (chave, s))
+        self.empurrados += 1
+
+    def _vizinhos(self, s):
+        x, y = s
+        for _, dx, dy in DIRECOES:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.linhas and 0 <= ny < self.colunas and self.passavel[nx, ny]:
+                yield nx, ny
+
+    def _atualizar(self, u):
+        if u != self.objetivo:
+            if self.passavel[u]:
+                self.rhs[u] = min((self.g.get(v, INF) + 1 for v in self._vizinhos(u)), default=INF)
+            else:
+                self.rhs[u] = INF
+        if self.g.get(u, INF) != self.rhs.get(u, INF):
+            self._enfileirar(u)
+        else:
+            self.chaves.pop(u, None)
+
+    def _topo(self):
+        while self.fila:
+            chave, s = self.fila[0]
+            if self.chaves.get(s) == chave:
+                return chave
+            heapq.heappop(self.fila)
+        return (INF, INF)
+
+    def _calcular(self):
+        inicio = self.inicio
+        while (self._topo() < self._chave(inicio)
+               or self.rhs.get(inicio, INF) != self.g.get(inicio, INF)):
+            if not self.fila:
+                break
+            chave_antiga, u = heapq.heappop(self.fila)
+            chave_nova = self._chave(u)
+            if chave_antiga < chave_nova:
+                self._enfileirar(u)
+                continue
+            del self.chaves[u]
+            self.expandidos += 1
+            if self.g.get(u, INF) > self.rhs.get(u, INF):
+                self.g[u] = self.rhs[u]
+                for p in self._vizinhos(u):
+                    self._atualizar(p)
+            else:
+                self.g[u] = INF
+                self._atualizar(u)
+                for p in self._vizinhos(u):
+                    self._atualizar(p)
+
+    def celula_alterada(self, x, y):
+        """
+        Avisa que a passagem de (x, y) mudou; o reparo acontece em planejar().
+        """
+        self.pendentes.append((x, y))
+
+    def planejar(self, posicao):
+        """
+        Move o início para `posicao`, repara a árvore com as células
+        alteradas desde a última chamada e devolve a próxima direção.
+
+        Retorna: 'N', 'S', 'L', 'O' ou None se já chegou ou não há caminho
+        """
+        if posicao != self.inicio:
+            self.km += abs(self.ultimo[0] - posicao[0]) + abs(self.ultimo[1] - posicao[1])
+            self.ultimo = posicao
+            self.inicio = posicao
+
+        if self.pendentes:
+            for celula in self.pendentes:
+                self._atualizar(celula)
+                # Vizinhos da célula ganham ou perdem uma aresta
+                x, y = celula
+                for _, dx, dy in DIRECOES:
+                    nx, ny = x + dx, y + dy
+                    if 0 <= nx < self.linhas and 0 <= ny < self.colunas:
+                        self._atualizar((nx, ny))
+            self.pendentes.clear()
+        self._calcular()
+
+        if posicao == self.objetivo or self.g.get(posicao, INF) == INF:
+            return None
+        x, y = posicao
+        melhor, direcao = INF, None
+        for d, dx, dy in DIRECOES:
+            v = (x + dx, y + dy)
+            if 0 <= v[0] < self.linhas and 0 <= v[1] < self.colunas and self.passavel[v]:
+                custo = self.g.get(v, INF) + 1
+                if custo < melhor:
+                    melhor, direcao = custo, d
+        return direcao
+
+    def distancia(self):
+        """
+        Comprimento do caminho atual do início ao objetivo (inf se não há).
+        """
+        return self.g.get(self.inicio, INF)
@@ -0,0 +1,313 @@
+import numpy as np
+
+# Custo de bateria para aspirar uma célula (cada passo custa 1)
+CUSTO_ASPIRAR = 2
+
+
+def matriz_distancias(origem, beliefs, grafo):
+    """
+    Monta a matriz de distâncias a partir do grafo de update_desires.
+
+    O índice 0 é a origem e o índice i + 1 é a sujeira beliefs[i]. Pares sem
+    entrada no grafo (inacessíveis) ficam com float('inf').
+    """
+    coords = [origem] + [b["coord"] for b in beliefs]
+    n = len(coords)
+    D = np.full((n, n), float('inf'))
+    for i, a in enumerate(coords):
+        vizinhos = grafo.get(a, {})
+        for j, b in enumerate(coords):
+            D[i, j] = 0 if a == b else vizinhos.get(b, float('inf'))
+    return D
+
+
+def custo_rota(D, ordem):
+    """
+    Distância total da rota (índices de sujeira) partindo da origem.
+    """
+    anterior = 0
+    total = 0
+    for i in ordem:
+        total += D[anterior, i + 1]
+        anterior = i + 1
+    return total
+
+
+def cabe_no_orcamento(distancia, num_sujeiras, orcamento):
+    """
+    Verifica se a bateria dá para a rota. A simulação só exige bateria
+    positiva antes de cada ação, então a última aspiração pode deixá-la
+    negativa.
+    """
+    if orcamento is None or num_sujeiras == 0:
+        return True
+    return distancia + CUSTO_ASPIRAR * num_sujeiras - 1 <= orcamento
+
+
+def rota_gulosa(D, pontos, orcamento=None):
+    """
+    Heurística gulosa original: a partir da posição atual escolhe a próxima
+    sujeira com maior pontos² / (distância + 1). Ignora o orçamento; serve de
+    linha de base para os otimizadores.
+    """
+    ordem = []
+    restantes = list(range(len(pontos)))
+    atual = 0
+    while restantes:
+        melhor_score = -float('inf')
+        melhor = None
+        for i in restantes:
+            distancia = D[atual, i + 1]
+            if distancia == float('inf'):
+                continue
+            score = (pontos[i] ** 2) / (distancia + 1)
+            if score > melhor_score:
+                melhor_score = score
+                melhor = i
+        if melhor is None:
+            break
+        ordem.append(melhor)
+        restantes.remove(melhor)
+        atual = melhor + 1
+    return ordem
+
+
+def rota_exata(D, pontos, orcamento=None):
+    """
+    Programação dinâmica de Held–Karp sobre subconjuntos de sujeiras.
+
+    dp[mascara, j] é a menor distância saindo da origem, visitando exatamente
+    as sujeiras de `mascara` e terminando em j. Sem orçamento devolve a rota
+    mais curta que passa por todas as sujeiras alcançáveis; com orçamento
+    resolve a versão de orientação: maior pontuação que cabe na bateria, com
+    desempate pela menor distância. Custo O(2^k · k²), para k pequeno.
+    """
+    alcancaveis = [i for i in range(len(pontos)) if np.isfinite(D[0, i + 1])]
+    m = len(alcancaveis)
+    if m == 0:
+        return []
+
+    indices = np.array(alcancaveis) + 1
+    sub = D[np.ix_(indices, indices)]
+    valores = np.asarray(pontos, dtype=float)[alcancaveis]
+
+    total = 1 << m
+    dp = np.full((total, m), float('inf'))
+    pai = np.full((total, m), -1, dtype=np.int64)
+    bits = 1 << np.arange(m)
+    dp[bits, np.arange(m)] = D[0, indices]
+
+    for mascara in range(1, total):
+        linha = dp[mascara]
+        if not np.isfinite(linha).any():
+            continue
+        fora = np.nonzero((mascara & bits) == 0)[0]
+        if fora.size == 0:
+            continue
+        candidatos = linha[:, None] + sub[:, fora]
+        melhores = candidatos.argmin(axis=0)
+        custos = candidatos[melhores, np.arange(fora.size)]
+        novas = mascara | bits[fora]
+        melhora = custos < dp[novas, fora]
+        dp[novas[melhora], fora[melhora]] = custos[melhora]
+        pai[novas[melhora], fora[melhora]] = melhores[melhora]
+
+    mascaras = np.arange(total)
+    if orcamento is None:
+        mascara = total - 1
+        fim = int(dp[mascara].argmin())
+    else:
+        tamanhos = np.zeros(total, dtype=np.int64)
+        pontuacao = np.zeros(total)
+        for b in range(m):
+            tem = (mascaras & bits[b]) != 0
+            tamanhos += tem
+            pontuacao += tem * valores[b]
+        viavel = dp + CUSTO_ASPIRAR * tamanhos[:, None] - 1 <= orcamento
+        viavel[0] = False
+        if not viavel.any():
+            return []
+        pontuacao_viavel = np.where(viavel, pontuacao[:, None], -1)
+        melhor_pontuacao = pontuacao_viavel.max()
+        distancia = np.where(pontuacao_viavel == melhor_pontuacao, dp, float('inf'))
+        mascara, fim = np.unravel_index(int(distancia.argmin()), distancia.shape)
+        mascara, fim = int(mascara), int(fim)
+
+    ordem = []
+    while fim >= 0:
+        ordem.append(alcancaveis[fim])
+        anterior = int(pai[mascara, fim])
+        mascara ^= 1 << fim
+        fim = anterior
+    ordem.reverse()
+    return ordem
+
+
+def _dois_opt(D, rota):
+    """
+    2-opt para caminho aberto com início fixo (rota[0] é a origem).
+    Inverte trechos enquanto isso encurtar o caminho.
+    """
+    melhorou = False
+    n = len(rota)
+    i = 1
+    while i < n - 1:
+        j = i + 1
+        while j < n:
+            a, b = rota[i - 1], rota[i]
+            c = rota[j]
+            antes = D[a][b]
+            depois = D[a][c]
+            if j + 1 < n:
+                d = rota[j + 1]
+                antes += D[c][d]
+                depois += D[b][d]
+            if depois < antes:
+                rota[i:j + 1] = reversed(rota[i:j + 1])
+                melhorou = True
+            j += 1
+        i += 1
+    return melhorou
+
+
+def _or_opt(D, rota):
+    """
+    Or-opt: move trechos de 1 a 3 sujeiras para outra posição da rota.
+    """
+    melhorou = False
+    n = len(rota)
+    for tamanho in (1, 2, 3):
+        i = 1
+        while i + tamanho <= n:
+            trecho = rota[i:i + tamanho]
+            anterior = rota[i - 1]
+            seguinte = rota[i + tamanho] if i + tamanho < n else None
+            ganho = D[anterior][trecho[0]]
+            if seguinte is not None:
+                ganho += D[trecho[-1]][seguinte] - D[anterior][seguinte]
+            resto = rota[:i] + rota[i + tamanho:]
+            melhor_delta = 0
+            melhor_pos = None
+            for p in range(1, len(resto) + 1):
+                if p == i:
+                    continue
+                a = resto[p - 1]
+                b = resto[p] if p < len(resto) else None
+                custo = D[a][trecho[0]]
+                if b is not None:
+                    custo += D[trecho[-1]][b] - D[a][b]
+                delta = custo - ganho
+                if delta < melhor_delta - 1e-9:
+                    melhor_delta = delta
+                    melhor_pos = p
+            if melhor_pos is not None:
+                rota[:] = resto[:melhor_pos] + trecho + resto[melhor_pos:]
+                melhorou = True
+            i += 1
+    return melhorou
+
+
+def _busca_local(D, rota):
+    while _dois_opt(D, rota) or _or_opt(D, rota):
+        pass
+
+
+def _distancia_caminho(D, rota):
+    return sum(D[rota[i]][rota[i + 1]] for i in range(len(rota) - 1))
+
+
+def rota_busca_local(D, pontos, orcamento=None):
+    """
+    Parte da rota gulosa e melhora com 2-opt e Or-opt.
+
+    Com orçamento, remove as sujeiras com pior relação economia/pontos até a
+    rota caber na bateria e depois tenta inserir (inserção mais barata) as
+    que ficaram de fora enquanto couberem, repetindo a busca local.
+    """
+    Dl = D.tolist()
+    rota = [0] + [i + 1 for i in rota_gulosa(D, pontos)]
+    _busca_local(Dl, rota)
+
+    if orcamento is not None:
+        def cabe(r):
+            return cabe_no_orcamento(_distancia_caminho(Dl, r), len(r) - 1, orcamento)
+
+        while len(rota) > 1 and not cabe(rota):
+            melhor = None
+            melhor_razao = -1
+            for p in range(1, len(rota)):
+                a = rota[p - 1]
+                b = rota[p + 1] if p + 1 < len(rota) else None
+                economia = Dl[a][rota[p]]
+                if b is not None:
+                    economia += Dl[rota[p]][b] - Dl[a][b]
+                razao = (economia + CUSTO_ASPIRAR) / pontos[rota[p] - 1]
+                if razao > melhor_razao:
+                    melhor_razao = razao
+                    melhor = p
+            del rota[melhor]
+            _busca_local(Dl, rota)
+
+        fora = set(i + 1 for i in range(len(pontos)) if np.isfinite(D[0, i + 1])) - set(rota)
+        while fora:
+            escolha = None
+            melhor_razao = -1
+            base = _distancia_caminho(Dl, rota)
+            for no in fora:
+                for p in range(1, len(rota) + 1):
+                    a = rota[p - 1]
+                    b = rota[p] if p < len(rota) else None
+                    acrescimo = Dl[a][no]
+                    if b is not None:
+                        acrescimo += Dl[no][b] - Dl[a][b]
+                    if not cabe_no_orcamento(base + acrescimo, len(rota), orcamento):
+                        continue
+                    razao = pontos[no - 1] / (acrescimo + CUSTO_ASPIRAR)
+                    if razao > melhor_razao:
+                        melhor_razao = razao
+                        escolha = (no, p)
+            if escolha is None:
+                break
+            no, p = escolha
+            rota.insert(p, no)
+            fora.discard(no)
+            _busca_local(Dl, rota)
+
+    return [no - 1 for no in rota[1:]]
+
+
+OTIMIZADORES = {
+    'guloso': rota_gulosa,
+    'exato': rota_exata,
+    'busca_local': rota_busca_local
+}
+
+
+def otimizar_rota(D, pontos, metodo='auto', orcamento=None, limite_exato=12):
+    """
+    Escolhe a ordem de visita das sujeiras.
+
+    Parâmetros:
+    - D: matriz de distâncias de matriz_distancias
+    - pontos: pontuação de cada sujeira (mesma ordem das beliefs)
+    - metodo: 'guloso', 'exato', 'busca_local' ou 'auto' (exato até
+      limite_exato sujeiras, busca local acima disso)
+    - orcamento: bateria disponível; None visita todas as sujeiras alcançáveis
+
+    Retorna: lista de índices de sujeira na ordem de visita
+    """
+    if metodo == 'auto':
+        metodo = 'exato' if len(pontos) <= limite_exato else 'busca_local'
+    if metodo not in OTIMIZADORES:
+        raise ValueError(f"otimizador de rota desconhecido: {metodo}")
+    return OTIMIZADORES[metodo](D, pontos, orcamento)
+
+
+def estatisticas_rota(D, pontos, ordem):
+    distancia_total = int(custo_rota(D, ordem))
+    pontuacao_total = int(sum(pontos[i] for i in ordem))
+    return {
+        'distancia_total': distancia_total,
+        'pontuacao_total': pontuacao_total,
+        'eficiencia': pontuacao_total / (distancia_total + 1)
+    }
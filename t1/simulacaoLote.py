@@ -0,0 +1,145 @@
+import numpy as np
+from gerador import gerar_cenarios
+from celulas import PONTOS, LIMPO, TIPO_GRID
+from ambiente import calcular_mascaras, alterar_mascaras_lote, BITS_SNLO
+from politicas import obter_politica, ASPIRAR, PARAR, DX_ACAO, DY_ACAO
+
+# Mesma ordem em que sensoresPr e os agentes testam as direções: S, N, L, O
+DIRECOES = ('S', 'N', 'L', 'O')
+DX = np.array([1, -1, 0, 0])
+DY = np.array([0, 0, 1, -1])
+
+
+def gerar_lote(episodios, tamanho=5, semente=None, **opcoes):
+    """
+    Gera `episodios` salas independentes e reproduzíveis (gerador.gerar_cenarios).
+
+    Retorna: array de códigos de formato (episodios, tamanho, tamanho)
+    """
+    return gerar_cenarios(episodios, tamanho, semente, **opcoes)
+
+
+def vizinhos_lote(x, y, tamanho):
+    """
+    Coordenadas dos quatro vizinhos (ordem S, N, L, O) de cada episódio.
+
+    Retorna: (nx, ny, dentro), todos de formato (episodios, 4). nx e ny já
+    vêm limitados ao grid; `dentro` indica quais vizinhos existem de fato.
+    """
+    nx = x[:, None] + DX
+    ny = y[:, None] + DY
+    dentro = (nx >= 0) & (nx < tamanho) & (ny >= 0) & (ny < tamanho)
+    return np.clip(nx, 0, tamanho - 1), np.clip(ny, 0, tamanho - 1), dentro
+
+
+def sensores_lote(grids, passagem, sujos, x, y):
+    """
+    Equivalente vetorizado de sensores + sensoresPr para todos os episódios,
+    lendo as máscaras de vizinhança de ambiente.calcular_mascaras.
+
+    Retorna: (livre, suja, est)
+    - livre: (episodios, 4) vizinhos para onde é possível mover
+    - suja: (episodios, 4) vizinhos livres com sujeira (as prioridades)
+    - est: (episodios,) código da célula atual
+    """
+    linhas = np.arange(len(grids))
+    livre = (passagem[linhas, x, y][:, None] & BITS_SNLO) != 0
+    suja = (sujos[linhas, x, y][:, None] & BITS_SNLO) != 0
+    return livre, suja, grids[linhas, x, y]
+
+
+def rodar_lote(grids=None, episodios=1000, tamanho=5, max_steps=60, agente="simples", bateria=30, semente=None):
+    """
+    Roda vários episódios em paralelo, todos no mesmo passo, sem matplotlib.
+
+    Reproduz a lógica de rodar_simulacao com aspiradorSimples (agente="simples")
+    ou aspiradorModelo (agente="modelo"), mas com sensores, decisões, bateria e
+    pontuação calculados com operações de array sobre todos os episódios. As
+    decisões vêm da mesma tabela compilada (politicas.obter_politica) usada
+    na simulação escalar.
+
+    Parâmetros:
+    - grids: array (episodios, N, N) com códigos de célula; se None, gera as salas
+    - episodios, tamanho, semente: usados apenas quando grids é None
+    - max_steps: limite de passos por episódio
+    - agente: "simples" ou "modelo"
+    - bateria: carga inicial de cada episódio
+
+    Retorna: dict de arrays por episódio com 'pontuacao', 'bateria',
+    'bateria_gasta', 'passos' e 'celulas_limpas'
+    """
+    politica = obter_politica(agente)
+
+    if grids is None:
+        grids = gerar_lote(episodios, tamanho, semente)
+    else:
+        grids = np.array(grids, dtype=TIPO_GRID)
+
+    episodios, tamanho, _ = grids.shape
+    linhas = np.arange(episodios)
+    x = np.zeros(episodios, dtype=np.int64)
+    y = np.zeros(episodios, dtype=np.int64)
+    carga = np.full(episodios, bateria, dtype=np.int64)
+    pontuacao = np.zeros(episodios, dtype=np.int64)
+    passos = np.zeros(episodios, dtype=np.int64)
+    limpas = np.zeros(episodios, dtype=np.int64)
+    ativo = np.ones(episodios, dtype=bool)
+    passagem, sujos = calcular_mascaras(grids)
+
+    if politica.usa_visitados:
+        visitados = np.zeros(grids.shape, dtype=bool)
+        visitados[:, 0, 0] = True
+
+    for _ in range(max_steps):
+        if not ativo.any():
+            break
+
+        est = grids[linhas, x, y]
+        pontos = PONTOS[est]
+
+        # Uma consulta na tabela compilada decide a ação de todos os episódios
+        novos = 0
+        if politica.usa_visitados:
+            nx, ny, _ = vizinhos_lote(x, y, tamanho)
+            nao_visitados = ~visitados[linhas[:, None], nx, ny]
+            novos = (nao_visitados * BITS_SNLO).sum(axis=1, dtype=np.int64)
+        codigo = politica.codigo(passagem[linhas, x, y].astype(np.int64), sujos[linhas, x, y].astype(np.int64),
+                                 (pontos > 0).astype(np.int64), politica.tem_bateria(carga).astype(np.int64), novos)
+        acao = politica.tabela[codigo]
+
+        aspirar = ativo & (acao == ASPIRAR)
+        mover = ativo & (acao != ASPIRAR) & (acao != PARAR)
+
+        pontuacao[aspirar] += pontos[aspirar]
+        limpas[aspirar] += 1
+        carga[aspirar] -= 2
+        grids[linhas[aspirar], x[aspirar], y[aspirar]] = LIMPO
+        alterar_mascaras_lote(passagem, sujos, linhas[aspirar], x[aspirar], y[aspirar],
+                              np.full(int(aspirar.sum()), LIMPO, dtype=TIPO_GRID))
+
+        x[mover] += DX_ACAO[acao[mover]]
+        y[mover] += DY_ACAO[acao[mover]]
+        carga[mover] -= 1
+        if politica.usa_visitados:
+            visitados[linhas[mover], x[mover], y[mover]] = True
+
+        passos[aspirar | mover] += 1
+        ativo &= aspirar | mover
+
+    return {
+        'pontuacao': pontuacao,
+        'bateria': carga,
+        'bateria_gasta': bateria - carga,
+        'passos': passos,
+        'celulas_limpas': limpas
+    }
+
+
+def resumo_lote(resultado):
+    """
+    Resume o resultado de rodar_lote em média, mínimo e máximo de cada métrica.
+    """
+    return {
+        chave: {'media': float(valores.mean()), 'min': int(valores.min()), 'max': int(valores.max())}
+        for chave, valores in resultado.items()
+    }
@@ -0,0 +1,214 @@
+from array import array
+import numpy as np
+from celulas import TIPO_GRID
+
+# Ações gravadas no log, codificadas pelo índice nesta tupla;
+# 'evento' é uma mudança da sala que não veio do agente (eventos.py)
+ACOES = ('aspirar', 'N', 'S', 'L', 'O', 'parar', 'evento')
+CODIGO_ACAO = {acao: i for i, acao in enumerate(ACOES)}
+# Bytes de snapshot por passo gravado, no máximo (ver intervalo_padrao)
+BYTES_CHAVE_POR_PASSO = 16
+
+
+def intervalo_padrao(grid, minimo=256):
+    """
+    Intervalo entre snapshots que cresce com a sala: um snapshot de N² células
+    a cada N² / BYTES_CHAVE_POR_PASSO passos custa no máximo
+    BYTES_CHAVE_POR_PASSO bytes por passo, a mesma ordem do log de eventos.
+    Numa sala de 10⁶ células são 62.500 passos entre snapshots.
+    """
+    return max(minimo, np.asarray(grid).size // BYTES_CHAVE_POR_PASSO)
+
+
+class _ChavesArquivo:
+    """
+    Snapshots de uma trajetória carregada, lidos do .npz só quando pedidos
+    (um membro 'chave_j' por snapshot). Snapshots gravados depois do
+    carregamento ficam em memória.
+    """
+
+    def __init__(self, dados, quantidade):
+        self.dados = dados
+        self.quantidade = quantidade
+        self.novas = []
+
+    def __len__(self):
+        return self.quantidade + len(self.novas)
+
+    def __getitem__(self, j):
+        if j < self.quantidade:
+            return self.dados[f'chave_{j}']
+        return self.novas[j - self.quantidade]
+
+    def append(self, grid):
+        self.novas.append(grid)
+
+
+class Trajetoria:
+    """
+    Gravação compacta de um episódio: o grid inicial é guardado uma vez e
+    cada passo vira um evento (posição, ação, célula alterada, bateria,
+    pontuação). Qualquer quadro é reconstruído sob demanda a partir do
+    snapshot mais próximo, guardado a cada `intervalo_chave` passos (por
+    padrão intervalo_padrao(grid), que cresce com a sala, então os
+    snapshots ocupam O(passos) bytes e não O(passos × N²)).
+
+    Se comporta como a antiga lista `estados`: len(traj), traj[i] e iteração
+    devolvem dicts {'grid', 'x', 'y', 'bateria', 'pontuacao', 'passo'}.
+    """
+
+    def __init__(self, grid_inicial, intervalo_chave=None):
+        self.grid_inicial = np.array(grid_inicial, dtype=TIPO_GRID)
+        self.intervalo_chave = intervalo_chave or intervalo_padrao(self.grid_inicial)
+        self.x = array('l')
+        self.y = array('l')
+        self.acao = array('b')
+        self.bateria = array('l')
+        self.pontuacao = array('l')
+        # célula alterada no passo; alterado_x == -1 quando nada mudou
+        self.alterado_x = array('l')
+        self.alterado_y = array('l')
+        self.alterado_valor = array('B')
+        # chaves[j] é o grid depois dos primeiros j * intervalo_chave eventos
+        self.chaves = [self.grid_inicial.copy()]
+        self._grid_atual = self.grid_inicial.copy()
+        self._cursor = None
+
+    def registrar(self, x, y, acao, bateria, pontuacao, celula=None):
+        """
+        Acrescenta um passo ao log.
+
+        Parâmetros:
+        - x, y: posição do agente depois da ação
+        - acao: 'aspirar', 'N', 'S', 'L', 'O', 'parar' ou 'evento'
+        - bateria, pontuacao: valores depois da ação
+        - celula: tupla (cx, cy, novo_valor) se alguma célula mudou, senão None
+        """
+        self.x.append(x)
+        self.y.append(y)
+        self.acao.append(CODIGO_ACAO[acao])
+        self.bateria.append(bateria)
+        self.pontuacao.append(pontuacao)
+        if celula is None:
+            self.alterado_x.append(-1)
+            self.alterado_y.append(-1)
+            self.alterado_valor.append(0)
+        else:
+            cx, cy, valor = celula
+            self.alterado_x.append(cx)
+            self.alterado_y.append(cy)
+            self.alterado_valor.append(valor)
+            self._grid_atual[cx, cy] = valor
+
+        if len(self.x) % self.intervalo_chave == 0:
+            self.chaves.append(self._grid_atual.copy())
+
+    def __len__(self):
+        return len(self.x)
+
+    def alteracoes(self, inicio, fim):
+        """
+        Células alteradas pelos passos inicio..fim-1, como tuplas (cx, cy, valor).
+        """
+        for i in range(inicio, fim):
+            cx = self.alterado_x[i]
+            if cx >= 0:
+                yield cx, self.alterado_y[i], self.alterado_valor[i]
+
+    def _aplicar(self, grid, inicio, fim):
+        for cx, cy, valor in self.alteracoes(inicio, fim):
+            grid[cx, cy] = valor
+
+    def grid_em(self, passo, copiar=True):
+        """
+        Reconstrói o grid depois do passo `passo`. Avança a partir do último
+        quadro pedido quando possível (na reprodução sequencial só os eventos
+        novos são aplicados) e, caso contrário, parte do snapshot anterior
+        mais próximo, aplicando até intervalo_chave eventos.
+
+        A cópia devolvida custa O(N²) por quadro; com copiar=False volta o
+        grid interno do cursor, que só vale até a próxima chamada e não deve
+        ser alterado.
+        """
+        if passo < 0:
+            passo += len(self)
+        if not 0 <= passo < len(self):
+            raise IndexError(passo)
+
+        chave = (passo + 1) // self.intervalo_chave
+        inicio = chave * self.intervalo_chave
+        if self._cursor is not None and inicio <= self._cursor[0] + 1 <= passo + 1:
+            inicio = self._cursor[0] + 1
+            grid = self._cursor[1]
+        else:
+            grid = np.array(self.chaves[chave])
+
+        self._aplicar(grid, inicio, passo + 1)
+        self._cursor = (passo, grid)
+        return grid.copy() if copiar else grid
+
+    def quadro(self, passo):
+        if passo < 0:
+            passo += len(self)
+        return {
+            'grid': self.grid_em(passo),
+            'x': self.x[passo],
+            'y': self.y[passo],
+            'acao': ACOES[self.acao[passo]],
+            'bateria': self.bateria[passo],
+            'pontuacao': self.pontuacao[passo],
+            'passo': passo
+        }
+
+    def __getitem__(self, passo):
+        return self.quadro(passo)
+
+    def __iter__(self):
+        for passo in range(len(self)):
+            yield self.quadro(passo)
+
+    def salvar(self, caminho):
+        """
+        Salva a trajetória em um arquivo .npz comprimido, com um membro por
+        snapshot para carregar() poder lê-los um a um.
+        """
+        np.savez_compressed(
+            caminho,
+            grid_inicial=self.grid_inicial,
+            intervalo_chave=np.array(self.intervalo_chave),
+            x=np.array(self.x, dtype=np.int32),
+            y=np.array(self.y, dtype=np.int32),
+            acao=np.array(self.acao, dtype=np.int8),
+            bateria=np.array(self.bateria, dtype=np.int32),
+            pontuacao=np.array(self.pontuacao, dtype=np.int32),
+            alterado_x=np.array(self.alterado_x, dtype=np.int32),
+            alterado_y=np.array(self.alterado_y, dtype=np.int32),
+            alterado_valor=np.array(self.alterado_valor, dtype=TIPO_GRID),
+            **{f'chave_{j}': self.chaves[j] for j in range(len(self.chaves))}
+        )
+
+    @classmethod
+    def carregar(cls, caminho):
+        """
+        Carrega uma trajetória salva com salvar(). Só o log de eventos vai
+        para a memória: os snapshots ficam no arquivo, que permanece aberto,
+        e cada um é lido quando um quadro precisa dele.
+        """
+        dados = np.load(caminho)
+        try:
+            traj = cls(dados['grid_inicial'], int(dados['intervalo_chave']))
+            traj.x = array('l', dados['x'].tolist())
+            traj.y = array('l', dados['y'].tolist())
+            traj.acao = array('b', dados['acao'].tolist())
+            traj.bateria = array('l', dados['bateria'].tolist())
+            traj.pontuacao = array('l', dados['pontuacao'].tolist())
+            traj.alterado_x = array('l', dados['alterado_x'].tolist())
+            traj.alterado_y = array('l', dados['alterado_y'].tolist())
+            traj.alterado_valor = array('B', dados['alterado_valor'].tolist())
+            quantidade = sum(nome.startswith('chave_') for nome in dados.files)
+            traj.chaves = _ChavesArquivo(dados, quantidade)
+        except BaseException:
+            dados.close()
+            raise
+        traj._grid_atual = traj.grid_em(len(traj) - 1) if len(traj) else traj.grid_inicial.copy()
+        return traj
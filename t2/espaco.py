@@ -0,0 +1,223 @@
+import json
+import os
+import shutil
+import tempfile
+from itertools import permutations
+from math import factorial
+import numpy as np
+from puzzle import Estado, MOVES, OBJETIVO, aplicar_movimento, distancia_manhattan
+
+# Estados alcançáveis: 9 posições do vazio x 8!/2 permutações pares das peças
+POR_VAZIO = factorial(8) // 2
+TOTAL_ESTADOS = 9 * POR_VAZIO
+ARQUIVOS = ('estados', 'proximo', 'manhattan', 'resolvido')
+# Mude quando o layout das tabelas mudar: pastas de outra versão são reconstruídas
+VERSAO = 1
+FORMATO = 'formato.json'
+
+PESOS = np.array([factorial(7 - i) for i in range(8)], dtype=np.int64)
+
+
+def _pecas(tabuleiros: np.ndarray) -> np.ndarray:
+    # Tira o vazio de cada linha, mantendo a ordem das peças
+    return tabuleiros[tabuleiros != 0].reshape(len(tabuleiros), 8)
+
+
+def indices(tabuleiros: np.ndarray) -> np.ndarray:
+    # Código de Lehmer das 8 peças; as permutações 2k e 2k+1 só trocam as duas
+    # últimas peças e têm paridades opostas, então rank // 2 numera as pares
+    tabuleiros = np.asarray(tabuleiros).reshape(-1, 9)
+    pecas = _pecas(tabuleiros)
+    lehmer = np.zeros(len(pecas), dtype=np.int64)
+    inversoes = np.zeros(len(pecas), dtype=np.int64)
+    i = 0
+    while i < 8:
+        menores = (pecas[:, i + 1:] < pecas[:, i:i + 1]).sum(axis=1)
+        lehmer += menores * PESOS[i]
+        inversoes += menores
+        i += 1
+    # Sem esta checagem um tabuleiro insolúvel cairia no índice do par solúvel
+    if (inversoes % 2).any():
+        raise ValueError("tabuleiro insolúvel: fora do espaço de estados alcançáveis")
+    vazio = np.argmax(tabuleiros == 0, axis=1)
+    return vazio * POR_VAZIO + lehmer // 2
+
+
+def indice(estado: Estado) -> int:
+    return int(indices(np.array(estado))[0])
+
+
+def _todos_estados() -> np.ndarray:
+    # Permutações pares em ordem lexicográfica: a k-ésima tem rank // 2 == k
+    pecas = np.array(list(permutations(range(1, 9))), dtype=np.int8)
+    inversoes = np.zeros(len(pecas), dtype=np.int64)
+    i = 0
+    while i < 8:
+        inversoes += (pecas[:, i + 1:] < pecas[:, i:i + 1]).sum(axis=1)
+        i += 1
+    pecas = pecas[inversoes % 2 == 0]
+
+    estados = np.empty((TOTAL_ESTADOS, 9), dtype=np.int8)
+    vazio = 0
+    while vazio < 9:
+        bloco = estados[vazio * POR_VAZIO:(vazio + 1) * POR_VAZIO]
+        bloco[:, :vazio] = pecas[:, :vazio]
+        bloco[:, vazio] = 0
+        bloco[:, vazio + 1:] = pecas[:, vazio:]
+        vazio += 1
+    return estados
+
+
+def construir() -> dict:
+    estados = _todos_estados()
+    vazio = np.repeat(np.arange(9), POR_VAZIO)
+    linhas = np.arange(TOTAL_ESTADOS)
+
+    proximo = np.empty((TOTAL_ESTADOS, len(MOVES)), dtype=np.int32)
+    m = 0
+    while m < len(MOVES):
+        # Para onde o vazio vai com o movimento, a partir de cada posição
+        destinos = np.array([aplicar_movimento(tuple(estados[v * POR_VAZIO]), MOVES[m]).index(0)
+                             for v in range(9)])
+        destino = destinos[vazio]
+        vizinhos = estados.copy()
+        vizinhos[linhas, vazio] = estados[linhas, destino]
+        vizinhos[linhas, destino] = 0
+        proximo[:, m] = indices(vizinhos)
+        m += 1
+
+    alvo = np.zeros(10, dtype=np.int64)
+    alvo[list(OBJETIVO)] = np.arange(9)
+    posicoes = np.tile(np.arange(9), (TOTAL_ESTADOS, 1))
+    destino_peca = alvo[estados]
+    distancias = np.abs(posicoes // 3 - destino_peca // 3) + np.abs(posicoes % 3 - destino_peca % 3)
+    manhattan = np.where(estados != 0, distancias, 0).sum(axis=1).astype(np.int8)
+
+    return {
+        'estados': estados,
+        'proximo': proximo,
+        'manhattan': manhattan,
+        'resolvido': manhattan == 0
+    }
+
+
+class EspacoEstados:
+    # Tabelas indexadas pelo índice do estado:
+    # estados[i] = tabuleiro, proximo[i, m] = índice depois de MOVES[m],
+    # manhattan[i] = distancia_manhattan, resolvido[i] = é o OBJETIVO
+
+    def __init__(self, tabelas: dict):
+        self.estados = tabelas['estados']
+        self.proximo = tabelas['proximo']
+        self.manhattan = tabelas['manhattan']
+        self.resolvido = tabelas['resolvido']
+
+    def indice(self, estado: Estado) -> int:
+        return indice(estado)
+
+    def estado(self, i: int) -> Estado:
+        return tuple(int(v) for v in self.estados[i])
+
+    def aplicar(self, i, mov: str):
+        return self.proximo[i, MOVES.index(mov)]
+
+    def salvar(self, pasta: str, substituir: bool = False) -> None:
+        # Grava numa pasta temporária e renomeia: outro processo nunca lê tabelas pela metade.
+        # Com substituir, uma pasta já existente (ex.: de outra versão) é trocada pela nova
+        raiz = os.path.dirname(os.path.abspath(pasta))
+        os.makedirs(raiz, exist_ok=True)
+        temporario = tempfile.mkdtemp(dir=raiz, prefix='.tmp_')
+        for nome in ARQUIVOS:
+            np.save(os.path.join(temporario, nome + '.npy'), getattr(self, nome))
+        with open(os.path.join(temporario, FORMATO), 'w') as arquivo:
+            json.dump(formato(), arquivo)
+        try:
+            os.rename(temporario, pasta)
+            return
+        except OSError:
+            if not substituir:
+                shutil.rmtree(temporario)
+                return
+        velho = tempfile.mkdtemp(dir=raiz, prefix='.velho_')
+        os.rename(pasta, os.path.join(velho, 'espaco'))
+        os.rename(temporario, pasta)
+        shutil.rmtree(velho)
+
+    @classmethod
+    def carregar(cls, pasta: str, mmap_mode='r'):
+        # Com mmap_mode='r' os processos compartilham as páginas dos arquivos
+        return cls({nome: np.load(os.path.join(pasta, nome + '.npy'), mmap_mode=mmap_mode) for nome in ARQUIVOS})
+
+
+def formato() -> dict:
+    return {'versao': VERSAO, 'estados': TOTAL_ESTADOS, 'moves': list(MOVES)}
+
+
+def carregar_valido(pasta: str):
+    # EspacoEstados da pasta, ou None se ela não tem tabelas desta versão com as formas esperadas
+    try:
+        with open(os.path.join(pasta, FORMATO)) as arquivo:
+            if json.load(arquivo) != formato():
+                return None
+        espaco = EspacoEstados.carregar(pasta)
+    except (OSError, ValueError):
+        return None
+    formas = {
+        'estados': (TOTAL_ESTADOS, 9),
+        'proximo': (TOTAL_ESTADOS, len(MOVES)),
+        'manhattan': (TOTAL_ESTADOS,),
+        'resolvido': (TOTAL_ESTADOS,)
+    }
+    if any(getattr(espaco, nome).shape != forma for nome, forma in formas.items()):
+        return None
+    return espaco
+
+
+def pasta_padrao() -> str:
+    return os.environ.get('T2_ESPACO') or os.path.join(tempfile.gettempdir(), 't2_espaco')
+
+
+def obter_espaco(pasta=None) -> EspacoEstados:
+    # Lê as tabelas do disco ou constrói e salva, na primeira vez ou se as
+    # tabelas da pasta são de outra versão ou estão incompletas
+    pasta = pasta or pasta_padrao()
+    espaco = carregar_valido(pasta)
+    if espaco is None:
+        EspacoEstados(construir()).salvar(pasta, substituir=os.path.exists(pasta))
+        espaco = carregar_valido(pasta)
+    if espaco is None:
+        raise RuntimeError(f"tabelas inválidas em {pasta}")
+    return espaco
+
+
+def conferir(espaco: EspacoEstados, amostras: int = 2000) -> None:
+    rng = np.random.default_rng(0)
+    assert espaco.estado(espaco.indice(OBJETIVO)) == OBJETIVO
+    assert int(espaco.resolvido.sum()) == 1 and espaco.resolvido[espaco.indice(OBJETIVO)]
+    assert np.array_equal(indices(espaco.estados[:5000]), np.arange(5000))
+    try:
+        indice((1, 2, 3, 4, 5, 6, 8, 7, 0))
+        assert False, "tabuleiro insolúvel recebeu índice"
+    except ValueError:
+        pass
+    for i in rng.integers(0, TOTAL_ESTADOS, amostras):
+        estado = espaco.estado(i)
+        assert espaco.indice(estado) == i
+        assert espaco.manhattan[i] == distancia_manhattan(estado)
+        for mov in MOVES:
+            assert espaco.estado(espaco.aplicar(i, mov)) == aplicar_movimento(estado, mov)
+
+
+if __name__ == "__main__":
+    import time
+    inicio = time.perf_counter()
+    tabelas = construir()
+    print(f"construído em {time.perf_counter() - inicio:.2f} s")
+    with tempfile.TemporaryDirectory() as raiz:
+        pasta = os.path.join(raiz, 'espaco')
+        EspacoEstados(tabelas).salvar(pasta)
+        inicio = time.perf_counter()
+        espaco = EspacoEstados.carregar(pasta)
+        print(f"carregado em {(time.perf_counter() - inicio) * 1e3:.2f} ms")
+        conferir(espaco)
+        print("ok")
@@ -1,8 +1,19 @@
 import random
 from typing import List, Tuple, Optional
-from puzzle import aplicar_movimento, distancia_manhattan
+import numpy as np
+from puzzle import MOVES, OBJETIVO, eh_soluvel, indice_para_rc, rc_para_indice
 
 RECOMPENSA_POR_SOLUCAO = 1000000
+NAO_RESOLVIDO = -1
+ELITES = 2
+K_TORNEIO = 3
+
+# Deslocamento (linha, coluna) do vazio em cada movimento
+DESLOCAMENTO = {'U': (-1, 0), 'D': (1, 0), 'L': (0, -1), 'R': (0, 1)}
+
+# Operadores sobre um indivíduo em lista [genes, fitness, estado, passos]. executar_ga
+# usa a versão em matriz (avaliar_populacao, torneios, cruzar_populacao); estes ficam
+# como API para indivíduos avulsos, e avaliar_individuo é a referência da fitness
 
 def criar_individuo_aleatorio(tamanho: int, movimentos: List[str]) -> List:
     genes = []
@@ -146,78 +157,135 @@ def mutar(ind: List, taxa: float, movimentos: List[str]):
             ind[0][i] = movimentos[r2]
         i += 1
 
+# destinos[posicao_do_vazio, codigo]: para onde o vazio vai com movimentos[codigo]
+# (fica no lugar se sair do tabuleiro, como em aplicar_movimento)
+def tabela_destinos(movimentos: List[str]) -> np.ndarray:
+    destinos = np.empty((9, len(movimentos)), dtype=np.intp)
+    for posicao in range(9):
+        linha, coluna = indice_para_rc(posicao)
+        for codigo, mov in enumerate(movimentos):
+            dl, dc = DESLOCAMENTO.get(mov, (0, 0))
+            if 0 <= linha + dl < 3 and 0 <= coluna + dc < 3:
+                destinos[posicao, codigo] = rc_para_indice(linha + dl, coluna + dc)
+            else:
+                destinos[posicao, codigo] = posicao
+    return destinos
+
+# custos[peca, posicao]: distância de Manhattan da peça até a posição dela em objetivo
+def tabela_custos(objetivo) -> np.ndarray:
+    custos = np.zeros((9, 9), dtype=np.int32)
+    for peca in range(1, 9):
+        l2, c2 = indice_para_rc(objetivo.index(peca))
+        for posicao in range(9):
+            l1, c1 = indice_para_rc(posicao)
+            custos[peca, posicao] = abs(l1 - l2) + abs(c1 - c2)
+    return custos
+
+def _trajetos_espaco(genes: np.ndarray, estado_inicial, movimentos: List[str], espaco):
+    # Um índice do espaço de estados por tabuleiro; cada gene é uma consulta à tabela proximo.
+    # Movimento fora de MOVES (coluna -1) deixa o tabuleiro como está, como em aplicar_movimento
+    colunas = np.array([MOVES.index(m) if m in MOVES else -1 for m in movimentos])[genes]
+    parado = (colunas < 0).any()
+    estado = np.full(len(genes), espaco.indice(estado_inicial), dtype=np.int32)
+    for p in range(genes.shape[1]):
+        coluna = colunas[:, p]
+        proximo = espaco.proximo[estado, coluna]
+        estado = np.where(coluna < 0, estado, proximo) if parado else proximo
+        yield espaco.manhattan[estado].astype(np.int32)
+
+def _trajetos_tabuleiros(genes: np.ndarray, estado_inicial, objetivo, movimentos: List[str]):
+    # Tabuleiros andando juntos; a distância muda só pela peça que trocou de lugar com o vazio
+    tamanho_pop = len(genes)
+    destinos = tabela_destinos(movimentos)
+    custos = tabela_custos(objetivo)
+    linhas = np.arange(tamanho_pop)
+
+    tabuleiros = np.tile(np.array(estado_inicial, dtype=np.int8), (tamanho_pop, 1))
+    vazio = np.full(tamanho_pop, estado_inicial.index(0), dtype=np.intp)
+    distancia = np.full(tamanho_pop, custos[list(estado_inicial), np.arange(9)].sum(), dtype=np.int32)
+    for p in range(genes.shape[1]):
+        destino = destinos[vazio, genes[:, p]]
+        peca = tabuleiros[linhas, destino]
+        distancia += custos[peca, vazio] - custos[peca, destino]
+        tabuleiros[linhas, vazio] = peca
+        tabuleiros[linhas, destino] = 0
+        vazio = destino
+        yield distancia
+
+def avaliar_populacao(genes: np.ndarray, estado_inicial, objetivo, movimentos: List[str], espaco=None):
+    # Mesma fitness de avaliar_individuo, com todos os tabuleiros andando juntos,
+    # uma coluna de genes (índices em movimentos) por vez. Com espaco
+    # (espaco.EspacoEstados), objetivo == OBJETIVO e tabuleiro solúvel, cada passo
+    # é uma consulta às tabelas; insolúveis não estão no espaço e andam pelos tabuleiros
+    tamanho_pop, tam_genes = genes.shape
+    if espaco is not None and tuple(objetivo) == OBJETIVO and eh_soluvel(estado_inicial):
+        trajetos = _trajetos_espaco(genes, estado_inicial, movimentos, espaco)
+    else:
+        trajetos = _trajetos_tabuleiros(genes, estado_inicial, objetivo, movimentos)
+    melhor = np.zeros(tamanho_pop, dtype=np.int32)
+    passo_do_min = np.zeros(tamanho_pop, dtype=np.int32)
+    passo_solucao = np.full(tamanho_pop, NAO_RESOLVIDO, dtype=np.int32)
+
+    for p, distancia in enumerate(trajetos):
+        # A distância do passo 1 é o primeiro mínimo, como em avaliar_individuo
+        melhorou = distancia < melhor if p else np.ones(tamanho_pop, dtype=bool)
+        melhor[melhorou] = distancia[melhorou]
+        passo_do_min[melhorou] = p + 1
+        resolveu = (distancia == 0) & (passo_solucao == NAO_RESOLVIDO)
+        passo_solucao[resolveu] = p + 1
+
+    if not tam_genes:
+        melhor[:] = sum(tabela_custos(objetivo)[list(estado_inicial), np.arange(9)])
+    fitness = 1.0 / (1.0 + melhor)
+    if tam_genes:
+        fitness += np.where(passo_do_min > 0, (tam_genes - passo_do_min) / (tam_genes * 100.0), 0.0)
+    resolvidos = passo_solucao != NAO_RESOLVIDO
+    fitness[resolvidos] = RECOMPENSA_POR_SOLUCAO + (tam_genes - passo_solucao[resolvidos])
+    return fitness, melhor, passo_do_min, passo_solucao
+
+def torneios(fitness: np.ndarray, quantidade: int, k: int, rng) -> np.ndarray:
+    sorteados = rng.integers(0, len(fitness), size=(quantidade, k))
+    return sorteados[np.arange(quantidade), np.argmax(fitness[sorteados], axis=1)]
+
+def cruzar_populacao(pais_a: np.ndarray, pais_b: np.ndarray, rng) -> np.ndarray:
+    # Primeiros filhos seguidos dos segundos
+    quantidade, L = pais_a.shape
+    if L <= 1:
+        return np.concatenate([pais_a, pais_b])
+    corte = rng.integers(1, L, size=(quantidade, 1))
+    antes = np.arange(L) < corte
+    return np.concatenate([np.where(antes, pais_a, pais_b), np.where(antes, pais_b, pais_a)])
+
 def executar_ga(estado_inicial,
                 objetivo,
                 movimentos,
                 tamanho_pop,
                 tam_genes,
                 geracoes,
-                taxa_mut):
-
-    pop = []
-    i = 0
-    while i < tamanho_pop:
-        ind = criar_individuo_aleatorio(tam_genes, movimentos)
-        avaliar_individuo(ind, estado_inicial, objetivo, aplicar_movimento, distancia_manhattan)
-        pop.append(ind)
-        i += 1
-
-    melhor = escolher_melhor(pop)
+                taxa_mut,
+                semente: Optional[int] = None,
+                espaco=None):
+    rng = np.random.default_rng(semente)
+    genes = rng.integers(0, len(movimentos), size=(tamanho_pop, tam_genes), dtype=np.int8)
+    fitness, _, _, passo_solucao = avaliar_populacao(genes, estado_inicial, objetivo, movimentos, espaco)
 
     g = 1
     while g <= geracoes:
-        j = 0
-        while j < len(pop):
-            if pop[j][3] is not None:
-                passos = pop[j][3]
-                seq = pop[j][0][:passos]
-                return True, seq, g
-            j += 1
+        resolvidos = np.flatnonzero(passo_solucao != NAO_RESOLVIDO)
+        if len(resolvidos):
+            j = resolvidos[0]
+            return True, [movimentos[c] for c in genes[j, :passo_solucao[j]]], g
 
-        ordenar_populacao(pop)
-        novos = []
-
-        elites = 2
-        if elites > len(pop):
-            elites = len(pop)
-        inicio = len(pop) - elites
-        i = inicio
-        while i < len(pop):
-            genes = []
-            k = 0
-            while k < len(pop[i][0]):
-                genes.append(pop[i][0][k])
-                k += 1
-            ind = [genes, None, None, None]
-            avaliar_individuo(ind, estado_inicial, objetivo, aplicar_movimento, distancia_manhattan)
-            novos.append(ind)
-            i += 1
-
-        while len(novos) < tamanho_pop:
-            p1 = torneio(pop, 3)
-            p2 = torneio(pop, 3)
-            f1, f2 = cruzar(p1, p2)
-            mutar(f1, taxa_mut, movimentos)
-            mutar(f2, taxa_mut, movimentos)
-            avaliar_individuo(f1, estado_inicial, objetivo, aplicar_movimento, distancia_manhattan)
-            if len(novos) < tamanho_pop:
-                novos.append(f1)
-            avaliar_individuo(f2, estado_inicial, objetivo, aplicar_movimento, distancia_manhattan)
-            if len(novos) < tamanho_pop:
-                novos.append(f2)
-
-        pop = novos
-        atual = escolher_melhor(pop)
-        if melhor is None:
-            melhor = atual
-        else:
-            if atual is not None:
-                if melhor[1] is None and atual[1] is not None:
-                    melhor = atual
-                elif melhor[1] is not None and atual[1] is not None:
-                    if atual[1] > melhor[1]:
-                        melhor = atual
+        elites = min(ELITES, tamanho_pop)
+        ordem = np.argsort(fitness, kind='stable')
+        pares = (tamanho_pop - elites + 1) // 2
+        vencedores = torneios(fitness, 2 * pares, K_TORNEIO, rng)
+        filhos = cruzar_populacao(genes[vencedores[0::2]], genes[vencedores[1::2]], rng)
+        mutados = rng.random(filhos.shape) < taxa_mut
+        filhos[mutados] = rng.integers(0, len(movimentos), size=int(mutados.sum()), dtype=np.int8)
 
+        genes = np.concatenate([genes[ordem[len(ordem) - elites:]], filhos[:tamanho_pop - elites]])
+        fitness, _, _, passo_solucao = avaliar_populacao(genes, estado_inicial, objetivo, movimentos, espaco)
         g += 1
 
-    return False, [], 0
\ No newline at end of file
+    return False, [], 0
@@ -2,6 +2,7 @@ import random
 from typing import Tuple
 from puzzle import eh_soluvel, aplicar_movimento, OBJETIVO
 from genetica import executar_ga
+from espaco import obter_espaco
 
 Estado = Tuple[int, ...]
 
@@ -42,7 +43,7 @@ estado = gerar_estado()
 print("Tabuleiro inicial:")
 imprimir_tabuleiro(estado)
 
-ok, seq, geracao = executar_ga(estado, OBJETIVO, ['U','D','L','R'], 200, 50, 2000, 0.04)
+ok, seq, geracao = executar_ga(estado, OBJETIVO, ['U','D','L','R'], 200, 50, 2000, 0.04, espaco=obter_espaco())
 
 if ok:
     print()